@@ -0,0 +1,61 @@
+"""Store top set RPE in tenths and e1RM values as fixed-point
+
+Revision ID: 03100cb83a03
+Revises: 8b32db1edfe0
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "03100cb83a03"
+down_revision: Union[str, Sequence[str], None] = "8b32db1edfe0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+E1RM_TABLES = ("top_set_logs", "pattern_exposures")
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.add_column(sa.Column("rpe_tenths", sa.SmallInteger(), nullable=True))
+
+    op.execute("UPDATE top_set_logs SET rpe_tenths = CAST(ROUND(rpe * 10) AS SMALLINT) WHERE rpe IS NOT NULL")
+
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.drop_column("rpe")
+
+    # SQLite has no fixed-point storage; NUMERIC affinity there is a no-op
+    if op.get_bind().dialect.name == "postgresql":
+        for table in E1RM_TABLES:
+            op.alter_column(
+                table,
+                "e1rm_value",
+                existing_type=sa.Float(),
+                type_=sa.Numeric(precision=7, scale=2),
+                postgresql_using="round(e1rm_value::numeric, 2)",
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in E1RM_TABLES:
+            op.alter_column(
+                table,
+                "e1rm_value",
+                existing_type=sa.Numeric(precision=7, scale=2),
+                type_=sa.Float(),
+                postgresql_using="e1rm_value::double precision",
+            )
+
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.add_column(sa.Column("rpe", sa.Float(), nullable=True))
+
+    op.execute("UPDATE top_set_logs SET rpe = rpe_tenths / 10.0 WHERE rpe_tenths IS NOT NULL")
+
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.drop_column("rpe_tenths")
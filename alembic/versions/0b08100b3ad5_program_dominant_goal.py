@@ -0,0 +1,52 @@
+"""Generated dominant_goal column on programs with a partial index on active programs
+
+Revision ID: 0b08100b3ad5
+Revises: 62d2555d45a7
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "0b08100b3ad5"
+down_revision: Union[str, Sequence[str], None] = "62d2555d45a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The goal with the highest weight; ties go to the earlier slot
+DOMINANT_GOAL = (
+    "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+    "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END"
+)
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    # Same type as goal_1..goal_3: the existing enum on PostgreSQL, its VARCHAR on SQLite
+    goal_type = postgresql.ENUM(name="goal", create_type=False) if is_postgres else sa.String(length=13)
+
+    # SQLite can only add stored generated columns by rebuilding the table
+    with op.batch_alter_table("programs") as batch_op:
+        batch_op.add_column(
+            sa.Column("dominant_goal", goal_type, sa.Computed(DOMINANT_GOAL, persisted=True), nullable=True)
+        )
+
+    op.create_index(
+        "ix_programs_active_dominant_goal",
+        "programs",
+        ["dominant_goal"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+        sqlite_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_programs_active_dominant_goal", table_name="programs")
+    with op.batch_alter_table("programs") as batch_op:
+        batch_op.drop_column("dominant_goal")
@@ -0,0 +1,48 @@
+"""BRIN indexes for time-ordered session, activity and check-in scans
+
+Revision ID: 10b59177c798
+Revises: cd8c2bca771e
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "10b59177c798"
+down_revision: Union[str, Sequence[str], None] = "cd8c2bca771e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (column, B-tree index replaced, BRIN index)
+INDEXES = {
+    "sessions": ("date", "ix_sessions_date", "ix_sessions_date_brin"),
+    "activity_instances": (
+        "performed_start",
+        "ix_activity_instances_performed_start",
+        "ix_activity_instances_performed_start_brin",
+    ),
+    "goal_checkins": ("date", "ix_goal_checkins_date", "ix_goal_checkins_date_brin"),
+}
+
+
+def upgrade() -> None:
+    for table, (column, btree, brin) in INDEXES.items():
+        op.drop_index(btree, table_name=table)
+        # postgresql_* options are ignored elsewhere, leaving a plain index on SQLite
+        op.create_index(
+            brin,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    for table, (column, btree, brin) in INDEXES.items():
+        op.drop_index(brin, table_name=table)
+        op.create_index(btree, table, [column], unique=False)
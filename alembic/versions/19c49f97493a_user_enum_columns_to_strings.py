@@ -0,0 +1,162 @@
+"""Store user, settings, profile and biometrics enums as strings; persona aggression as its SMALLINT value
+
+Revision ID: 19c49f97493a
+Revises: cd9cd0ee6ddf
+Create Date: 2026-10-16
+
+"""
+from contextlib import contextmanager
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+from alembic.operations import BatchOperations
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "19c49f97493a"
+down_revision: Union[str, Sequence[str], None] = "cd9cd0ee6ddf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# programs.dominant_goal (0b08100b3ad5): the goal with the highest weight
+DOMINANT_GOAL = (
+    "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+    "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END"
+)
+
+
+def _generated_columns(table: str) -> list[sa.Column]:
+    """Stored generated columns of table at this revision, as SQLite declares them."""
+    if table == "programs":
+        return [
+            sa.Column("dominant_goal", sa.String(length=13), sa.Computed(DOMINANT_GOAL, persisted=True), nullable=True),
+        ]
+    return []
+
+
+@contextmanager
+def _batch(table: str, **kw) -> Iterator[BatchOperations]:
+    """
+    op.batch_alter_table that keeps the stored generated columns of programs.
+
+    A SQLite rebuild copies rows with INSERT ... SELECT, which SQLite rejects for
+    generated columns, so they are dropped before the batch's own operations and
+    re-added from their declarations after them, within the same rebuild.
+    Other dialects alter in place.
+    """
+    generated = _generated_columns(table) if op.get_bind().dialect.name == "sqlite" else []
+    with op.batch_alter_table(table, **kw) as batch_op:
+        for column in generated:
+            batch_op.drop_column(column.name)
+        yield batch_op
+        for column in generated:
+            batch_op.add_column(column)
+
+
+def _lowered(*names: str) -> dict[str, str]:
+    return {name: name.lower() for name in names}
+
+
+# Stored enum member name -> new stored value (enum value; PersonaAggression is an int enum, 1-5)
+EXPERIENCE_LEVELS = _lowered("BEGINNER", "INTERMEDIATE", "ADVANCED", "EXPERT")
+PERSONA_TONES = _lowered("DRILL_SERGEANT", "SUPPORTIVE", "ANALYTICAL", "MOTIVATIONAL", "MINIMALIST")
+PERSONA_AGGRESSIONS = {
+    name: value
+    for value, name in enumerate(
+        ("CONSERVATIVE", "MODERATE_CONSERVATIVE", "BALANCED", "MODERATE_AGGRESSIVE", "AGGRESSIVE"),
+        start=1,
+    )
+}
+MOVEMENT_RULE_TYPES = _lowered("HARD_NO", "HARD_YES", "PREFERRED")
+RULE_CADENCES = _lowered("PER_MICROCYCLE", "WEEKLY", "BIWEEKLY")
+ENJOYABLE_ACTIVITIES = _lowered(
+    "TENNIS", "BOULDERING", "CYCLING", "SWIMMING", "HIKING", "BASKETBALL",
+    "FOOTBALL", "YOGA", "MARTIAL_ARTS", "DANCE", "OTHER",
+)
+E1RM_FORMULAS = _lowered("EPLEY", "BRZYCKI", "LOMBARDI", "OCONNER")
+SEXES = _lowered("FEMALE", "MALE", "INTERSEX", "UNSPECIFIED")
+BIOMETRIC_METRIC_TYPES = _lowered(
+    "WEIGHT_KG", "BODY_FAT_PERCENT", "RESTING_HR", "HRV", "SLEEP_HOURS", "VO2_MAX"
+)
+DATA_SOURCES = _lowered("MANUAL", "PROVIDER", "ESTIMATED")
+
+# (table, column, PostgreSQL enum type, name -> stored value mapping)
+ENUM_COLUMNS = (
+    ("users", "experience_level", "experiencelevel", EXPERIENCE_LEVELS),
+    ("users", "persona_tone", "personatone", PERSONA_TONES),
+    ("users", "persona_aggression", "personaaggression", PERSONA_AGGRESSIONS),
+    ("programs", "persona_tone", "personatone", PERSONA_TONES),
+    ("programs", "persona_aggression", "personaaggression", PERSONA_AGGRESSIONS),
+    ("user_movement_rules", "rule_type", "movementruletype", MOVEMENT_RULE_TYPES),
+    ("user_movement_rules", "cadence", "rulecadence", RULE_CADENCES),
+    ("user_enjoyable_activities", "activity_type", "enjoyableactivity", ENJOYABLE_ACTIVITIES),
+    ("user_settings", "active_e1rm_formula", "e1rmformula", E1RM_FORMULAS),
+    ("user_profiles", "sex", "sex", SEXES),
+    ("user_biometrics_history", "metric_type", "biometricmetrictype", BIOMETRIC_METRIC_TYPES),
+    ("user_biometrics_history", "source", "datasource", DATA_SOURCES),
+)
+
+# No column uses these types after the upgrade
+DROPPED_TYPES = {enum_name: mapping for _, _, enum_name, mapping in ENUM_COLUMNS}
+
+
+def _literal(value) -> str:
+    return str(value) if isinstance(value, int) else f"'{value}'"
+
+
+def _case(column: str, mapping: dict) -> str:
+    whens = " ".join(f"WHEN {_literal(old)} THEN {_literal(new)}" for old, new in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def _stored_type(mapping: dict) -> sa.types.TypeEngine:
+    if isinstance(next(iter(mapping.values())), int):
+        return sa.SmallInteger()
+    return sa.String(length=32)
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table, column, enum_name, mapping in ENUM_COLUMNS:
+        if is_postgres:
+            op.alter_column(
+                table,
+                column,
+                type_=_stored_type(mapping),
+                postgresql_using=_case(f"{column}::text", mapping),
+            )
+        else:
+            # SQLite: rewrite names as stored values, then the table rebuild sets the type
+            op.execute(f"UPDATE {table} SET {column} = {_case(column, mapping)}")
+            with _batch(table) as batch_op:
+                batch_op.alter_column(column, existing_type=sa.String(), type_=_stored_type(mapping))
+
+    if is_postgres:
+        for enum_name in DROPPED_TYPES:
+            op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    if is_postgres:
+        for enum_name, mapping in DROPPED_TYPES.items():
+            postgresql.ENUM(*mapping, name=enum_name).create(bind, checkfirst=True)
+
+    for table, column, enum_name, mapping in ENUM_COLUMNS:
+        names = {new: old for old, new in mapping.items()}
+        if is_postgres:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.ENUM(*mapping, name=enum_name, create_type=False),
+                postgresql_using=f"({_case(column, names)})::{enum_name}",
+            )
+        else:
+            with _batch(table) as batch_op:
+                batch_op.alter_column(column, existing_type=_stored_type(mapping), type_=sa.String(length=32))
+            op.execute(f"UPDATE {table} SET {column} = {_case(column, names)}")
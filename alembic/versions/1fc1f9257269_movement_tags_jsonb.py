@@ -0,0 +1,63 @@
+"""Store movement tag columns as JSONB with GIN indexes
+
+Revision ID: 1fc1f9257269
+Revises: b3536415cfb8
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "1fc1f9257269"
+down_revision: Union[str, Sequence[str], None] = "b3536415cfb8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TAG_COLUMNS = ("discipline_tags", "equipment_tags", "tags")
+
+
+def _existing_tag_columns() -> list[str]:
+    # movements.tags is declared on the model but no earlier migration creates it,
+    # so a migrated database may lack it
+    present = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("movements")}
+    return [column for column in TAG_COLUMNS if column in present]
+
+
+def upgrade() -> None:
+    # JSON and JSONB are the same type outside PostgreSQL
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in _existing_tag_columns():
+        op.alter_column(
+            "movements",
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+        op.create_index(
+            f"ix_movements_{column}_gin",
+            "movements",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in _existing_tag_columns():
+        op.drop_index(f"ix_movements_{column}_gin", table_name="movements", if_exists=True)
+        op.alter_column(
+            "movements",
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
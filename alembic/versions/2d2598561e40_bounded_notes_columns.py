@@ -0,0 +1,69 @@
+"""Bound notes/description columns so they stay inline
+
+Revision ID: 2d2598561e40
+Revises: c52adf2e211f
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "2d2598561e40"
+down_revision: Union[str, Sequence[str], None] = "c52adf2e211f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) -> maximum length
+BOUNDED_COLUMNS = {
+    ("workout_logs", "notes"): 2048,
+    ("soreness_logs", "notes"): 2048,
+    ("recovery_signals", "notes"): 2048,
+    ("movement_relationships", "notes"): 4096,
+    ("movements", "description"): 4096,
+}
+
+
+def upgrade() -> None:
+    # TEXT and VARCHAR are the same type outside PostgreSQL
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Refuse to truncate: list every column that still holds longer values
+    oversized = []
+    for (table, column), length in BOUNDED_COLUMNS.items():
+        count, longest = bind.execute(
+            sa.text(f"SELECT count(*), max(length({column})) FROM {table} WHERE length({column}) > :length"),
+            {"length": length},
+        ).one()
+        if count:
+            oversized.append(f"{table}.{column}: {count} rows over {length} characters (longest {longest})")
+    if oversized:
+        raise RuntimeError(
+            "Shorten or move these values before bounding the columns:\n" + "\n".join(oversized)
+        )
+
+    for (table, column), length in BOUNDED_COLUMNS.items():
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Text(),
+            type_=sa.String(length=length),
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for (table, column), length in BOUNDED_COLUMNS.items():
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=length),
+            type_=sa.Text(),
+        )
@@ -0,0 +1,108 @@
+"""Server-side UTC now defaults and NOT NULL for remaining timestamps
+
+Revision ID: 3bb4be2c26c2
+Revises: e46b70316b2b
+Create Date: 2026-10-16
+
+"""
+from contextlib import contextmanager
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+from alembic.operations import BatchOperations
+import sqlalchemy as sa
+
+
+revision: str = "3bb4be2c26c2"
+down_revision: Union[str, Sequence[str], None] = "e46b70316b2b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# programs.dominant_goal (0b08100b3ad5): the goal with the highest weight
+DOMINANT_GOAL = (
+    "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+    "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END"
+)
+
+
+def _generated_columns(table: str) -> list[sa.Column]:
+    """Stored generated columns of table at this revision, as SQLite declares them."""
+    if table == "programs":
+        return [
+            sa.Column("dominant_goal", sa.String(length=13), sa.Computed(DOMINANT_GOAL, persisted=True), nullable=True),
+        ]
+    return []
+
+
+@contextmanager
+def _batch(table: str, **kw) -> Iterator[BatchOperations]:
+    """
+    op.batch_alter_table that keeps the stored generated columns of programs.
+
+    A SQLite rebuild copies rows with INSERT ... SELECT, which SQLite rejects for
+    generated columns, so they are dropped before the batch's own operations and
+    re-added from their declarations after them, within the same rebuild.
+    Other dialects alter in place.
+    """
+    generated = _generated_columns(table) if op.get_bind().dialect.name == "sqlite" else []
+    with op.batch_alter_table(table, **kw) as batch_op:
+        for column in generated:
+            batch_op.drop_column(column.name)
+        yield batch_op
+        for column in generated:
+            batch_op.add_column(column)
+
+
+# table -> timestamp columns that were filled in by Python defaults
+COLUMNS = {
+    "programs": ("created_at",),
+    "macro_cycles": ("created_at",),
+    "goals": ("effective_from", "created_at"),
+    "goal_checkins": ("created_at",),
+    "disciplines": ("created_at",),
+    "activity_definitions": ("created_at",),
+    "activity_instances": ("created_at",),
+    "activity_muscle_map": ("created_at",),
+    "user_fatigue_state": ("created_at",),
+    "activity_instance_links": ("created_at",),
+    "user_profiles": ("created_at", "updated_at"),
+    "user_biometrics_history": ("created_at",),
+    "muscles": ("created_at",),
+}
+
+
+def _utc_now() -> sa.TextClause:
+    """Current UTC time as a naive timestamp, like the datetime.utcnow values already stored."""
+    # now() cast to timestamp is the session's local time on PostgreSQL; CURRENT_TIMESTAMP is UTC on SQLite
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("timezone('utc', now())")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def upgrade() -> None:
+    utc_now = _utc_now()
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.execute(f"UPDATE {table} SET {column} = {utc_now.text} WHERE {column} IS NULL")
+        with _batch(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=utc_now,
+                    nullable=False,
+                )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMNS.items():
+        with _batch(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=None,
+                    # effective_from was already NOT NULL
+                    nullable=column == "effective_from",
+                )
@@ -0,0 +1,107 @@
+"""ON DELETE CASCADE from users to the rows they own
+
+Revision ID: 4e2e84fb9350
+Revises: 10b59177c798
+Create Date: 2026-10-16
+
+"""
+from contextlib import contextmanager
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+from alembic.operations import BatchOperations
+import sqlalchemy as sa
+
+
+revision: str = "4e2e84fb9350"
+down_revision: Union[str, Sequence[str], None] = "10b59177c798"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# programs.dominant_goal (0b08100b3ad5): the goal with the highest weight
+DOMINANT_GOAL = (
+    "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+    "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END"
+)
+
+
+def _generated_columns(table: str) -> list[sa.Column]:
+    """Stored generated columns of table at this revision, as SQLite declares them."""
+    if table == "programs":
+        return [
+            sa.Column("dominant_goal", sa.String(length=13), sa.Computed(DOMINANT_GOAL, persisted=True), nullable=True),
+        ]
+    return []
+
+
+@contextmanager
+def _batch(table: str, **kw) -> Iterator[BatchOperations]:
+    """
+    op.batch_alter_table that keeps the stored generated columns of programs.
+
+    A SQLite rebuild copies rows with INSERT ... SELECT, which SQLite rejects for
+    generated columns, so they are dropped before the batch's own operations and
+    re-added from their declarations after them, within the same rebuild.
+    Other dialects alter in place.
+    """
+    generated = _generated_columns(table) if op.get_bind().dialect.name == "sqlite" else []
+    with op.batch_alter_table(table, **kw) as batch_op:
+        for column in generated:
+            batch_op.drop_column(column.name)
+        yield batch_op
+        for column in generated:
+            batch_op.add_column(column)
+
+
+# (table, column, referenced table, ON DELETE action)
+FOREIGN_KEYS = (
+    ("user_movement_rules", "user_id", "users", "CASCADE"),
+    ("user_enjoyable_activities", "user_id", "users", "CASCADE"),
+    ("user_settings", "user_id", "users", "CASCADE"),
+    ("user_profiles", "user_id", "users", "CASCADE"),
+    ("user_biometrics_history", "user_id", "users", "CASCADE"),
+    ("programs", "user_id", "users", "CASCADE"),
+    ("macro_cycles", "user_id", "users", "CASCADE"),
+    ("goals", "user_id", "users", "CASCADE"),
+    ("activity_instances", "user_id", "users", "CASCADE"),
+    ("workout_logs", "user_id", "users", "CASCADE"),
+    ("soreness_logs", "user_id", "users", "CASCADE"),
+    ("recovery_signals", "user_id", "users", "CASCADE"),
+    ("conversation_threads", "user_id", "users", "CASCADE"),
+    # Grandchildren, so the cascade reaches every row the ORM used to delete
+    ("conversation_turns", "thread_id", "conversation_threads", "CASCADE"),
+    ("top_set_logs", "workout_log_id", "workout_logs", "CASCADE"),
+    ("activity_instance_links", "activity_instance_id", "activity_instances", "CASCADE"),
+    ("activity_instance_links", "workout_log_id", "workout_logs", "SET NULL"),
+)
+
+# Names SQLite's unnamed foreign keys so batch mode can drop them
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _set_ondelete(upgrading: bool) -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column, referenced, ondelete in FOREIGN_KEYS:
+        name = next(
+            (
+                fk["name"]
+                for fk in inspector.get_foreign_keys(table)
+                if fk["constrained_columns"] == [column]
+            ),
+            None,
+        ) or f"fk_{table}_{column}_{referenced}"
+
+        with _batch(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                name, referenced, [column], ["id"], ondelete=ondelete if upgrading else None
+            )
+
+
+def upgrade() -> None:
+    _set_ondelete(upgrading=True)
+
+
+def downgrade() -> None:
+    _set_ondelete(upgrading=False)
@@ -0,0 +1,48 @@
+"""Composite (user_id, date) indexes on workout logs and pattern exposures
+
+Revision ID: 500e6faa7a4c
+Revises: 79429b63ab7b
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "500e6faa7a4c"
+down_revision: Union[str, Sequence[str], None] = "79429b63ab7b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (single-column indexes replaced, composite indexes added)
+INDEXES = {
+    "workout_logs": (
+        ("user_id", "date"),
+        {"ix_workout_logs_user_id_date": ["user_id", "date"]},
+    ),
+    "pattern_exposures": (
+        ("user_id", "date", "pattern"),
+        {
+            "ix_pattern_exposures_user_id_date": ["user_id", "date"],
+            "ix_pattern_exposures_user_id_pattern_date": ["user_id", "pattern", "date"],
+        },
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, (columns, composites) in INDEXES.items():
+        for name, composite_columns in composites.items():
+            op.create_index(name, table, composite_columns, unique=False)
+        for column in columns:
+            op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+
+
+def downgrade() -> None:
+    for table, (columns, composites) in INDEXES.items():
+        for column in columns:
+            op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+        for name in composites:
+            op.drop_index(name, table_name=table)
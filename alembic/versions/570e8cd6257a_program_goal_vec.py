@@ -0,0 +1,104 @@
+"""Denormalized goal_vec on programs with a GIN index
+
+Revision ID: 570e8cd6257a
+Revises: 0b08100b3ad5
+Create Date: 2026-10-16
+
+"""
+from contextlib import contextmanager
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+from alembic.operations import BatchOperations
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "570e8cd6257a"
+down_revision: Union[str, Sequence[str], None] = "0b08100b3ad5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# programs.dominant_goal (0b08100b3ad5): the goal with the highest weight
+DOMINANT_GOAL = (
+    "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+    "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END"
+)
+
+
+def _generated_columns(table: str) -> list[sa.Column]:
+    """Stored generated columns of table at this revision, as SQLite declares them."""
+    if table == "programs":
+        return [
+            sa.Column("dominant_goal", sa.String(length=13), sa.Computed(DOMINANT_GOAL, persisted=True), nullable=True),
+        ]
+    return []
+
+
+@contextmanager
+def _batch(table: str, **kw) -> Iterator[BatchOperations]:
+    """
+    op.batch_alter_table that keeps the stored generated columns of programs.
+
+    A SQLite rebuild copies rows with INSERT ... SELECT, which SQLite rejects for
+    generated columns, so they are dropped before the batch's own operations and
+    re-added from their declarations after them, within the same rebuild.
+    Other dialects alter in place.
+    """
+    generated = _generated_columns(table) if op.get_bind().dialect.name == "sqlite" else []
+    with op.batch_alter_table(table, **kw) as batch_op:
+        for column in generated:
+            batch_op.drop_column(column.name)
+        yield batch_op
+        for column in generated:
+            batch_op.add_column(column)
+
+
+GOAL_SLOTS = (
+    ("goal_1", "goal_weight_1"),
+    ("goal_2", "goal_weight_2"),
+    ("goal_3", "goal_weight_3"),
+)
+
+programs = sa.table(
+    "programs",
+    sa.column("id", sa.Integer()),
+    *(sa.column(goal, sa.String()) for goal, _ in GOAL_SLOTS),
+    *(sa.column(weight, sa.Integer()) for _, weight in GOAL_SLOTS),
+    sa.column("goal_vec", sa.JSON()),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+    json_type = postgresql.JSONB() if is_postgres else sa.JSON()
+
+    # A plain ADD COLUMN: a SQLite batch rebuild cannot copy the generated dominant_goal
+    op.add_column(
+        "programs", sa.Column("goal_vec", json_type, server_default=sa.text("'[]'"), nullable=False)
+    )
+
+    # Enum columns hold member names; Goal values are the lowercased names
+    for row in bind.execute(sa.select(programs)).mappings().all():
+        goal_vec = [
+            row[goal].lower()
+            for goal, weight in GOAL_SLOTS
+            if row[goal] is not None and (row[weight] or 0) > 0
+        ]
+        bind.execute(programs.update().where(programs.c.id == row["id"]).values(goal_vec=goal_vec))
+
+    op.create_index(
+        "ix_programs_goal_vec_gin",
+        "programs",
+        ["goal_vec"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_programs_goal_vec_gin", table_name="programs")
+    with _batch("programs") as batch_op:
+        batch_op.drop_column("goal_vec")
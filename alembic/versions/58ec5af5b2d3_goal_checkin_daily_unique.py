@@ -0,0 +1,35 @@
+"""One goal check-in per goal per day
+
+Revision ID: 58ec5af5b2d3
+Revises: 5cc7af065373
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "58ec5af5b2d3"
+down_revision: Union[str, Sequence[str], None] = "5cc7af065373"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest check-in of any duplicated (goal_id, date)
+    op.execute(
+        "DELETE FROM goal_checkins WHERE id NOT IN "
+        "(SELECT min(id) FROM goal_checkins GROUP BY goal_id, date)"
+    )
+
+    # The unique index leads with goal_id, so the single-column index is redundant
+    op.drop_index("ix_goal_checkins_goal_id", table_name="goal_checkins")
+    with op.batch_alter_table("goal_checkins") as batch_op:
+        batch_op.create_unique_constraint("uq_goal_checkin_daily", ["goal_id", "date"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("goal_checkins") as batch_op:
+        batch_op.drop_constraint("uq_goal_checkin_daily", type_="unique")
+    op.create_index("ix_goal_checkins_goal_id", "goal_checkins", ["goal_id"], unique=False)
@@ -0,0 +1,142 @@
+"""Partition session_exercises by hash of session_id and goal_checkins by month on PostgreSQL
+
+Revision ID: 5cc7af065373
+Revises: db06c11d5e79
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "5cc7af065373"
+down_revision: Union[str, Sequence[str], None] = "db06c11d5e79"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SESSION_EXERCISE_PARTITIONS = 16
+
+# table -> (partition key, foreign keys as (column, referenced table), indexes)
+TABLES = {
+    "session_exercises": (
+        "session_id",
+        [("session_id", "sessions"), ("movement_id", "movements")],
+        {
+            "ix_session_exercises_session_role_order": ["session_id", "role", "order_in_session"],
+            "ix_session_exercises_movement_id": ["movement_id"],
+        },
+    ),
+    "goal_checkins": (
+        "date",
+        [("goal_id", "goals")],
+        {
+            "ix_goal_checkins_goal_id": ["goal_id"],
+            "ix_goal_checkins_date": ["date"],
+        },
+    ),
+}
+
+# create_goal_checkin_partitions(from_date, to_date): as create_pattern_exposure_partitions
+# (af60c9ea0a53), for goal_checkins and goal_checkins_default; init_db calls it on startup
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_goal_checkin_partitions(from_date date, to_date date)
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', from_date)::date;
+    month_end date;
+    partition_name text;
+BEGIN
+    WHILE month_start <= to_date LOOP
+        month_end := (month_start + interval '1 month')::date;
+        partition_name := 'goal_checkins_' || to_char(month_start, '"y"YYYY"m"MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE goal_checkins INCLUDING DEFAULTS)', partition_name);
+            IF to_regclass('goal_checkins_default') IS NOT NULL THEN
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM goal_checkins_default WHERE date >= %L AND date < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                    month_start, month_end, partition_name
+                );
+            END IF;
+            EXECUTE format(
+                'ALTER TABLE goal_checkins ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, month_end
+            );
+        END IF;
+        month_start := month_end;
+    END LOOP;
+END;
+$$
+"""
+
+
+def _create_partitions(table: str, previous: str) -> None:
+    if table == "session_exercises":
+        for remainder in range(SESSION_EXERCISE_PARTITIONS):
+            op.execute(
+                f"CREATE TABLE session_exercises_p{remainder} PARTITION OF session_exercises "
+                f"FOR VALUES WITH (MODULUS {SESSION_EXERCISE_PARTITIONS}, REMAINDER {remainder})"
+            )
+        return
+
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(
+        "SELECT create_goal_checkin_partitions("
+        f"COALESCE((SELECT min(date) FROM {previous}), CURRENT_DATE), "
+        "(CURRENT_DATE + interval '3 months')::date)"
+    )
+    op.execute("CREATE TABLE goal_checkins_default PARTITION OF goal_checkins DEFAULT")
+
+
+def _swap_table(table: str, partitioned: bool, previous: str) -> None:
+    """Move rows from the renamed table into a freshly created, (un)partitioned copy."""
+    partition_key, foreign_keys, indexes = TABLES[table]
+
+    op.rename_table(table, previous)
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    for name in indexes:
+        op.drop_index(name, table_name=previous)
+    op.drop_constraint(f"{table}_pkey", previous, type_="primary")
+
+    # LIKE carries the current column types, NOT NULLs and defaults (including the id
+    # sequence); keys and indexes are recreated below
+    partition_clause = (
+        f" PARTITION BY {'HASH' if table == 'session_exercises' else 'RANGE'} ({partition_key})"
+        if partitioned
+        else ""
+    )
+    op.execute(f"CREATE TABLE {table} (LIKE {previous} INCLUDING DEFAULTS){partition_clause}")
+
+    # A partitioned table's primary key must include the partition column
+    op.create_primary_key(f"{table}_pkey", table, ["id", partition_key] if partitioned else ["id"])
+    for column, referenced in foreign_keys:
+        op.create_foreign_key(f"{table}_{column}_fkey", table, referenced, [column], ["id"])
+
+    if partitioned:
+        _create_partitions(table, previous)
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {previous}")
+    op.drop_table(previous)
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    for name, columns in indexes.items():
+        op.create_index(name, table, columns, unique=False)
+
+
+def upgrade() -> None:
+    # Declarative partitioning is PostgreSQL-only; SQLite keeps the plain tables
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        _swap_table(table, partitioned=True, previous=f"{table}_unpartitioned")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        _swap_table(table, partitioned=False, previous=f"{table}_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS create_goal_checkin_partitions(date, date)")
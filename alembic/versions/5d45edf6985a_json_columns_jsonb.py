@@ -0,0 +1,71 @@
+"""Store the remaining JSON columns as JSONB
+
+Revision ID: 5d45edf6985a
+Revises: 58ec5af5b2d3
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "5d45edf6985a"
+down_revision: Union[str, Sequence[str], None] = "58ec5af5b2d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSONB_COLUMNS = {
+    "heuristic_configs": ("json_blob",),
+    "conversation_threads": ("accepted_plan_json",),
+    "conversation_turns": ("structured_response_json",),
+    "external_provider_accounts": ("scopes",),
+    "external_ingestion_runs": ("cursor_json",),
+    "external_activity_records": ("raw_payload_json",),
+    "external_metric_streams": ("raw_stream_json",),
+    "movements": ("secondary_muscles", "coaching_cues"),
+    "programs": ("hybrid_definition", "disciplines_json"),
+    "sessions": ("warmup_json", "main_json", "accessory_json", "finisher_json", "cooldown_json"),
+    "goals": ("target_json",),
+    "goal_checkins": ("value_json",),
+    "activity_definitions": ("default_equipment_tags",),
+    "workout_logs": ("feedback_tags",),
+    "recovery_signals": ("raw_payload_json",),
+    "user_profiles": ("discipline_preferences", "discipline_experience", "scheduling_preferences"),
+}
+
+# Columns with a typed '[]' default, dropped around the type change
+DEFAULTED_COLUMNS = {
+    ("movements", "secondary_muscles"),
+    ("movements", "coaching_cues"),
+    ("workout_logs", "feedback_tags"),
+}
+
+
+def _retype(type_, cast: str) -> None:
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            defaulted = (table, column) in DEFAULTED_COLUMNS
+            if defaulted:
+                op.alter_column(table, column, server_default=None)
+            op.alter_column(table, column, type_=type_, postgresql_using=f"{column}::{cast}")
+            if defaulted:
+                op.alter_column(table, column, server_default=sa.text("'[]'"))
+
+
+def upgrade() -> None:
+    # JSON and JSONB are the same type outside PostgreSQL
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _retype(postgresql.JSONB(), "jsonb")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _retype(sa.JSON(), "json")
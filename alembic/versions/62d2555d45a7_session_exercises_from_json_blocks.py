@@ -0,0 +1,111 @@
+"""Backfill session_exercises from session JSON blocks; (session_id, role, order) index
+
+Revision ID: 62d2555d45a7
+Revises: 03100cb83a03
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "62d2555d45a7"
+down_revision: Union[str, Sequence[str], None] = "03100cb83a03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# sessions JSON column -> session_exercises.role (enum member name)
+BLOCK_ROLES = {
+    "warmup_json": "WARMUP",
+    "main_json": "MAIN",
+    "accessory_json": "ACCESSORY",
+    "finisher_json": "FINISHER",
+    "cooldown_json": "COOLDOWN",
+}
+
+sessions = sa.table(
+    "sessions",
+    sa.column("id", sa.Integer()),
+    *(sa.column(column, sa.JSON()) for column in BLOCK_ROLES),
+)
+
+session_exercises = sa.table(
+    "session_exercises",
+    sa.column("session_id", sa.Integer()),
+    sa.column("movement_id", sa.Integer()),
+    sa.column("role", sa.String()),
+    sa.column("order_in_session", sa.Integer()),
+    sa.column("target_sets", sa.Integer()),
+    sa.column("target_rep_range_min", sa.Integer()),
+    sa.column("target_rep_range_max", sa.Integer()),
+    sa.column("target_rpe", sa.Float()),
+    sa.column("target_rir", sa.Integer()),
+    sa.column("target_duration_seconds", sa.Integer()),
+    sa.column("default_rest_seconds", sa.Integer()),
+    sa.column("is_complex_lift", sa.Boolean()),
+    sa.column("substitution_allowed", sa.Boolean()),
+    sa.column("notes", sa.Text()),
+)
+
+
+def _block_exercises(block) -> list[dict]:
+    # Finisher blocks nest their exercises under "exercises"
+    if isinstance(block, dict):
+        block = block.get("exercises") or []
+    if not isinstance(block, list):
+        return []
+    return [exercise for exercise in block if isinstance(exercise, dict)]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_index(
+        "ix_session_exercises_session_role_order",
+        "session_exercises",
+        ["session_id", "role", "order_in_session"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_session_exercises_session_id"), table_name="session_exercises")
+
+    # Backfill sessions that have generated content but no exercise rows yet
+    movement_ids = dict(bind.execute(sa.text("SELECT name, id FROM movements")).all())
+    rows = bind.execute(
+        sa.select(sessions).where(sessions.c.id.not_in(sa.select(session_exercises.c.session_id)))
+    ).mappings()
+
+    exercise_rows = []
+    for row in rows:
+        for column, role in BLOCK_ROLES.items():
+            for position, exercise in enumerate(_block_exercises(row[column])):
+                movement_id = movement_ids.get(exercise.get("movement"))
+                if movement_id is None:
+                    continue
+                exercise_rows.append({
+                    "session_id": row["id"],
+                    "movement_id": movement_id,
+                    "role": role,
+                    "order_in_session": position,
+                    "target_sets": exercise.get("sets") or 1,
+                    "target_rep_range_min": exercise.get("rep_range_min"),
+                    "target_rep_range_max": exercise.get("rep_range_max"),
+                    "target_rpe": exercise.get("target_rpe"),
+                    "target_rir": exercise.get("target_rir"),
+                    "target_duration_seconds": exercise.get("duration_seconds"),
+                    "default_rest_seconds": exercise.get("rest_seconds"),
+                    "is_complex_lift": False,
+                    "substitution_allowed": True,
+                    "notes": exercise.get("notes"),
+                })
+
+    if exercise_rows:
+        op.bulk_insert(session_exercises, exercise_rows)
+
+
+def downgrade() -> None:
+    # Backfilled rows are left in place; the JSON blocks were never modified
+    op.create_index(op.f("ix_session_exercises_session_id"), "session_exercises", ["session_id"], unique=False)
+    op.drop_index("ix_session_exercises_session_role_order", table_name="session_exercises")
@@ -0,0 +1,56 @@
+"""Store circuit template JSON columns as JSONB
+
+Revision ID: 767e83c1845a
+Revises: 4fdc46c38149
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "767e83c1845a"
+down_revision: Union[str, Sequence[str], None] = "4fdc46c38149"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSONB_COLUMNS = ("exercises_json", "bucket_stress", "tags")
+
+
+def upgrade() -> None:
+    # JSON and JSONB are the same type outside PostgreSQL
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in JSONB_COLUMNS:
+        op.alter_column(
+            "circuit_templates",
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+    op.create_index(
+        "ix_circuit_templates_tags_gin",
+        "circuit_templates",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_circuit_templates_tags_gin", table_name="circuit_templates")
+    for column in JSONB_COLUMNS:
+        op.alter_column(
+            "circuit_templates",
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,89 @@
+"""SMALLINT for small program/session counters; session exercise target RPE in tenths
+
+Revision ID: 76ab799defc3
+Revises: 78684a8be868
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "76ab799defc3"
+down_revision: Union[str, Sequence[str], None] = "78684a8be868"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SMALLINT_COLUMNS = {
+    "programs": (
+        "duration_weeks",
+        "goal_weight_1",
+        "goal_weight_2",
+        "goal_weight_3",
+        "days_per_week",
+        "deload_every_n_microcycles",
+    ),
+    "microcycles": ("length_days", "sequence_number"),
+    "sessions": (
+        "day_number",
+        "estimated_duration_minutes",
+        "warmup_duration_minutes",
+        "main_duration_minutes",
+        "accessory_duration_minutes",
+        "finisher_duration_minutes",
+        "cooldown_duration_minutes",
+    ),
+    "session_exercises": (
+        "order_in_session",
+        "superset_group",
+        "target_sets",
+        "target_rep_range_min",
+        "target_rep_range_max",
+        "target_rir",
+        "target_duration_seconds",
+        "default_rest_seconds",
+    ),
+    "goals": ("priority",),
+    "activity_instances": ("perceived_difficulty", "enjoyment_rating"),
+    "workout_logs": ("perceived_difficulty", "enjoyment_rating"),
+}
+
+
+def upgrade() -> None:
+    # INTEGER and SMALLINT share storage on SQLite; only PostgreSQL narrows the columns
+    if op.get_bind().dialect.name == "postgresql":
+        for table, columns in SMALLINT_COLUMNS.items():
+            for column in columns:
+                op.alter_column(table, column, existing_type=sa.Integer(), type_=sa.SmallInteger())
+
+    with op.batch_alter_table("session_exercises") as batch_op:
+        batch_op.add_column(sa.Column("target_rpe_tenths", sa.SmallInteger(), nullable=True))
+
+    op.execute(
+        "UPDATE session_exercises SET target_rpe_tenths = CAST(ROUND(target_rpe * 10) AS SMALLINT) "
+        "WHERE target_rpe IS NOT NULL"
+    )
+
+    with op.batch_alter_table("session_exercises") as batch_op:
+        batch_op.drop_column("target_rpe")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("session_exercises") as batch_op:
+        batch_op.add_column(sa.Column("target_rpe", sa.Float(), nullable=True))
+
+    op.execute(
+        "UPDATE session_exercises SET target_rpe = target_rpe_tenths / 10.0 "
+        "WHERE target_rpe_tenths IS NOT NULL"
+    )
+
+    with op.batch_alter_table("session_exercises") as batch_op:
+        batch_op.drop_column("target_rpe_tenths")
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table, columns in SMALLINT_COLUMNS.items():
+            for column in columns:
+                op.alter_column(table, column, existing_type=sa.SmallInteger(), type_=sa.Integer())
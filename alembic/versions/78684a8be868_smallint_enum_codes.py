@@ -0,0 +1,79 @@
+"""Store session type, exercise role and microcycle status as SMALLINT codes
+
+Revision ID: 78684a8be868
+Revises: 3bb4be2c26c2
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "78684a8be868"
+down_revision: Union[str, Sequence[str], None] = "3bb4be2c26c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, PostgreSQL enum type) -> member names; a member's code is its position
+COLUMNS = {
+    ("sessions", "session_type", "sessiontype"): (
+        "UPPER", "LOWER", "PUSH", "PULL", "LEGS", "FULL_BODY",
+        "CARDIO", "MOBILITY", "RECOVERY", "SKILL", "CUSTOM",
+    ),
+    ("session_exercises", "role", "exerciserole"): (
+        "WARMUP", "MAIN", "ACCESSORY", "SKILL", "FINISHER", "COOLDOWN",
+    ),
+    ("microcycles", "status", "microcyclestatus"): ("PLANNED", "ACTIVE", "COMPLETE"),
+}
+
+
+def _name_to_code(column: str, names: tuple[str, ...]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names))
+    return f"CASE {column} {whens} END"
+
+
+def _code_to_name(column: str, names: tuple[str, ...]) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(names))
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for (table, column, enum_name), names in COLUMNS.items():
+        if is_postgres:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.SmallInteger(),
+                postgresql_using=_name_to_code(column, names),
+            )
+            op.execute(f"DROP TYPE {enum_name}")
+        else:
+            # SQLite: rewrite labels as codes, then the table rebuild casts them
+            op.execute(f"UPDATE {table} SET {column} = {_name_to_code(column, names)}")
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(column, existing_type=sa.String(), type_=sa.SmallInteger())
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for (table, column, enum_name), names in COLUMNS.items():
+        if is_postgres:
+            enum_type = postgresql.ENUM(*names, name=enum_name)
+            enum_type.create(op.get_bind())
+            op.alter_column(
+                table,
+                column,
+                type_=enum_type,
+                postgresql_using=f"({_code_to_name(column, names)})::{enum_name}",
+            )
+        else:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(column, existing_type=sa.SmallInteger(), type_=sa.String(length=20))
+            op.execute(f"UPDATE {table} SET {column} = {_code_to_name(column, names)}")
@@ -0,0 +1,45 @@
+"""Index top set logs by a SMALLINT pattern code
+
+Revision ID: 79429b63ab7b
+Revises: 1fc1f9257269
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "79429b63ab7b"
+down_revision: Union[str, Sequence[str], None] = "1fc1f9257269"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# MovementPattern values in definition order; the position is the code
+MOVEMENT_PATTERNS = (
+    "squat", "hinge", "horizontal_push", "vertical_push", "horizontal_pull",
+    "vertical_pull", "carry", "core", "lunge", "rotation", "plyometric",
+    "olympic", "isolation", "mobility", "isometric", "conditioning", "cardio",
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.add_column(sa.Column("pattern_code", sa.SmallInteger(), nullable=True))
+
+    cases = " ".join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(MOVEMENT_PATTERNS))
+    op.execute(f"UPDATE top_set_logs SET pattern_code = CASE pattern {cases} END")
+
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.alter_column("pattern_code", existing_type=sa.SmallInteger(), nullable=False)
+        batch_op.drop_index(op.f("ix_top_set_logs_pattern"))
+        batch_op.create_index(op.f("ix_top_set_logs_pattern_code"), ["pattern_code"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("top_set_logs") as batch_op:
+        batch_op.drop_index(op.f("ix_top_set_logs_pattern_code"))
+        batch_op.create_index(op.f("ix_top_set_logs_pattern"), ["pattern"], unique=False)
+        batch_op.drop_column("pattern_code")
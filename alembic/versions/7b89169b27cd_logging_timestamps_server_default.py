@@ -0,0 +1,48 @@
+"""Server-side defaults for logging timestamps
+
+Revision ID: 7b89169b27cd
+Revises: 500e6faa7a4c
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "7b89169b27cd"
+down_revision: Union[str, Sequence[str], None] = "500e6faa7a4c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = (
+    "workout_logs",
+    "top_set_logs",
+    "pattern_exposures",
+    "soreness_logs",
+    "recovery_signals",
+)
+
+
+def upgrade() -> None:
+    # Naive UTC, matching the datetime.utcnow values written so far (now() alone is local time on PostgreSQL)
+    utc_now = sa.text("timezone('utc', now())" if op.get_bind().dialect.name == "postgresql" else "CURRENT_TIMESTAMP")
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at",
+                existing_type=sa.DateTime(),
+                server_default=utc_now,
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at",
+                existing_type=sa.DateTime(),
+                server_default=None,
+            )
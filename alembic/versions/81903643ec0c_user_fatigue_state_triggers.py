@@ -0,0 +1,126 @@
+"""Maintain user_fatigue_state incrementally with triggers on PostgreSQL
+
+Revision ID: 81903643ec0c
+Revises: 5d45edf6985a
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "81903643ec0c"
+down_revision: Union[str, Sequence[str], None] = "5d45edf6985a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keeps an activity's mapped muscle magnitudes on its (user, day, muscle) rows: a deleted
+# or edited activity takes back its old contribution, an inserted or edited one adds
+# its new one. Magnitudes are summed per muscle so a muscle mapped twice is one row.
+ACTIVITY_INSTANCE_FUNCTION = """
+CREATE OR REPLACE FUNCTION user_fatigue_state_from_activity()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        IF OLD.activity_definition_id IS NOT NULL AND OLD.performed_start IS NOT NULL THEN
+            UPDATE user_fatigue_state s
+            SET fatigue_score = s.fatigue_score - m.magnitude
+            FROM (
+                SELECT muscle_id, sum(magnitude) AS magnitude
+                FROM activity_muscle_map
+                WHERE activity_definition_id = OLD.activity_definition_id
+                GROUP BY muscle_id
+            ) m
+            WHERE s.user_id = OLD.user_id
+              AND s.date = OLD.performed_start::date
+              AND s.muscle_id = m.muscle_id;
+        END IF;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        IF NEW.activity_definition_id IS NOT NULL AND NEW.performed_start IS NOT NULL THEN
+            INSERT INTO user_fatigue_state (user_id, date, muscle_id, fatigue_score, computed_from)
+            SELECT NEW.user_id, NEW.performed_start::date, m.muscle_id, sum(m.magnitude), 'activity_instances'
+            FROM activity_muscle_map m
+            WHERE m.activity_definition_id = NEW.activity_definition_id
+            GROUP BY m.muscle_id
+            ON CONFLICT (user_id, date, muscle_id)
+            DO UPDATE SET fatigue_score = user_fatigue_state.fatigue_score + EXCLUDED.fatigue_score;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# A mapping added, removed or changed on a definition applies to, or is taken back
+# from, every activity already recorded with that definition
+ACTIVITY_MUSCLE_MAP_FUNCTION = """
+CREATE OR REPLACE FUNCTION user_fatigue_state_from_muscle_map()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE user_fatigue_state s
+        SET fatigue_score = s.fatigue_score - OLD.magnitude * a.activities
+        FROM (
+            SELECT user_id, performed_start::date AS date, count(*) AS activities
+            FROM activity_instances
+            WHERE activity_definition_id = OLD.activity_definition_id AND performed_start IS NOT NULL
+            GROUP BY user_id, performed_start::date
+        ) a
+        WHERE s.user_id = a.user_id AND s.date = a.date AND s.muscle_id = OLD.muscle_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO user_fatigue_state (user_id, date, muscle_id, fatigue_score, computed_from)
+        SELECT a.user_id, a.performed_start::date, NEW.muscle_id, NEW.magnitude * count(*), 'activity_instances'
+        FROM activity_instances a
+        WHERE a.activity_definition_id = NEW.activity_definition_id AND a.performed_start IS NOT NULL
+        GROUP BY a.user_id, a.performed_start::date
+        ON CONFLICT (user_id, date, muscle_id)
+        DO UPDATE SET fatigue_score = user_fatigue_state.fatigue_score + EXCLUDED.fatigue_score;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# table -> (trigger, function, columns whose update changes the contribution)
+TRIGGERS = {
+    "activity_instances": (
+        "trg_activity_instances_fatigue",
+        "user_fatigue_state_from_activity",
+        "user_id, activity_definition_id, performed_start",
+    ),
+    "activity_muscle_map": (
+        "trg_activity_muscle_map_fatigue",
+        "user_fatigue_state_from_muscle_map",
+        "activity_definition_id, muscle_id, magnitude",
+    ),
+}
+
+
+def upgrade() -> None:
+    # uq_user_fatigue_state (def012345678) already keys the table on (user, day, muscle),
+    # which the triggers' ON CONFLICT targets, and it leads with user_id
+    op.drop_index("ix_user_fatigue_state_user_id", table_name="user_fatigue_state")
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(ACTIVITY_INSTANCE_FUNCTION)
+    op.execute(ACTIVITY_MUSCLE_MAP_FUNCTION)
+    for table, (trigger, function, columns) in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {trigger} AFTER INSERT OR UPDATE OF {columns} OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {function}()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table, (trigger, function, _) in TRIGGERS.items():
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+
+    op.create_index("ix_user_fatigue_state_user_id", "user_fatigue_state", ["user_id"], unique=False)
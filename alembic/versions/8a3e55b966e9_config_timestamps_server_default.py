@@ -0,0 +1,52 @@
+"""Server-side defaults for config/integration timestamps
+
+Revision ID: 8a3e55b966e9
+Revises: d134dc7abe0a
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "8a3e55b966e9"
+down_revision: Union[str, Sequence[str], None] = "d134dc7abe0a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = {
+    "heuristic_configs": ("created_at",),
+    "conversation_threads": ("created_at", "updated_at"),
+    "conversation_turns": ("created_at",),
+    "external_provider_accounts": ("created_at", "updated_at"),
+    "external_ingestion_runs": ("started_at", "created_at"),
+    "external_activity_records": ("created_at",),
+    "external_metric_streams": ("created_at",),
+}
+
+
+def upgrade() -> None:
+    # Naive UTC, matching the datetime.utcnow values written so far (now() alone is local time on PostgreSQL)
+    utc_now = sa.text("timezone('utc', now())" if op.get_bind().dialect.name == "postgresql" else "CURRENT_TIMESTAMP")
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=utc_now,
+                )
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=None,
+                )
@@ -0,0 +1,48 @@
+"""Server-side empty defaults for JSON list/dict columns
+
+Revision ID: 8b32db1edfe0
+Revises: af60c9ea0a53
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "8b32db1edfe0"
+down_revision: Union[str, Sequence[str], None] = "af60c9ea0a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> {column: empty JSON literal}
+JSON_DEFAULTS = {
+    "circuit_templates": {"exercises_json": "'[]'", "bucket_stress": "'{}'", "tags": "'[]'"},
+    "movements": {"secondary_muscles": "'[]'", "coaching_cues": "'[]'"},
+    "sessions": {"intent_tags": "'[]'"},
+    "workout_logs": {"feedback_tags": "'[]'"},
+}
+
+
+def upgrade() -> None:
+    for table, columns in JSON_DEFAULTS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, literal in columns.items():
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.JSON(),
+                    server_default=sa.text(literal),
+                )
+
+
+def downgrade() -> None:
+    for table, columns in JSON_DEFAULTS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.JSON(),
+                    server_default=None,
+                )
@@ -0,0 +1,130 @@
+"""Partition pattern_exposures by month on PostgreSQL
+
+Revision ID: af60c9ea0a53
+Revises: 2d2598561e40
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "af60c9ea0a53"
+down_revision: Union[str, Sequence[str], None] = "2d2598561e40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = "id, user_id, microcycle_id, date, pattern, e1rm_value, source_top_set_log_id, created_at"
+
+INDEXES = {
+    "ix_pattern_exposures_microcycle_id": ["microcycle_id"],
+    "ix_pattern_exposures_user_id_date": ["user_id", "date"],
+    "ix_pattern_exposures_user_id_pattern_date": ["user_id", "pattern", "date"],
+}
+
+# create_pattern_exposure_partitions(from_date, to_date) creates any missing monthly
+# partitions covering the range; init_db calls it on startup so upcoming months exist
+# before rows arrive. Rows already in pattern_exposures_default for a month are moved
+# into that month's partition as it is attached, which CREATE TABLE ... PARTITION OF
+# would refuse.
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_pattern_exposure_partitions(from_date date, to_date date)
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', from_date)::date;
+    month_end date;
+    partition_name text;
+BEGIN
+    WHILE month_start <= to_date LOOP
+        month_end := (month_start + interval '1 month')::date;
+        partition_name := 'pattern_exposures_' || to_char(month_start, '"y"YYYY"m"MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE pattern_exposures INCLUDING DEFAULTS)', partition_name);
+            IF to_regclass('pattern_exposures_default') IS NOT NULL THEN
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM pattern_exposures_default WHERE date >= %L AND date < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                    month_start, month_end, partition_name
+                );
+            END IF;
+            EXECUTE format(
+                'ALTER TABLE pattern_exposures ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, month_end
+            );
+        END IF;
+        month_start := month_end;
+    END LOOP;
+END;
+$$
+"""
+
+
+def _create_table(partitioned: bool) -> None:
+    op.create_table(
+        "pattern_exposures",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('pattern_exposures_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("microcycle_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("pattern", sa.String(length=50), nullable=False),
+        sa.Column("e1rm_value", sa.Float(), nullable=False),
+        sa.Column("source_top_set_log_id", sa.Integer(), nullable=False),
+        # Naive UTC, as set by 7b89169b27cd; now() alone would be the session's local time
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=True),
+        sa.ForeignKeyConstraint(["microcycle_id"], ["microcycles.id"]),
+        sa.ForeignKeyConstraint(["source_top_set_log_id"], ["top_set_logs.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        # A partitioned table's primary key must include the partition column
+        sa.PrimaryKeyConstraint(*(("id", "date") if partitioned else ("id",)), name="pattern_exposures_pkey"),
+        **({"postgresql_partition_by": "RANGE (date)"} if partitioned else {}),
+    )
+
+
+def _swap_table(partitioned: bool, previous: str) -> None:
+    """Move rows from the renamed table into a freshly created pattern_exposures."""
+    op.rename_table("pattern_exposures", previous)
+    op.execute("ALTER SEQUENCE pattern_exposures_id_seq OWNED BY NONE")
+    for name in INDEXES:
+        op.drop_index(name, table_name=previous)
+    op.drop_constraint("pattern_exposures_pkey", previous, type_="primary")
+
+    _create_table(partitioned)
+
+    if partitioned:
+        op.execute(CREATE_PARTITIONS_FUNCTION)
+        op.execute(
+            "SELECT create_pattern_exposure_partitions("
+            f"COALESCE((SELECT min(date) FROM {previous}), CURRENT_DATE), "
+            "(CURRENT_DATE + interval '3 months')::date)"
+        )
+        op.execute("CREATE TABLE pattern_exposures_default PARTITION OF pattern_exposures DEFAULT")
+
+    op.execute(f"INSERT INTO pattern_exposures ({COLUMNS}) SELECT {COLUMNS} FROM {previous}")
+    op.drop_table(previous)
+    op.execute("ALTER SEQUENCE pattern_exposures_id_seq OWNED BY pattern_exposures.id")
+
+    for name, columns in INDEXES.items():
+        op.create_index(name, "pattern_exposures", columns, unique=False)
+
+
+def upgrade() -> None:
+    # Declarative range partitioning is PostgreSQL-only; SQLite keeps the plain table
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _swap_table(partitioned=True, previous="pattern_exposures_unpartitioned")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _swap_table(partitioned=False, previous="pattern_exposures_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS create_pattern_exposure_partitions(date, date)")
@@ -0,0 +1,117 @@
+"""ON DELETE CASCADE down the program hierarchy; SET NULL for optional session references
+
+Revision ID: b131d45ad377
+Revises: 81903643ec0c
+Create Date: 2026-10-16
+
+"""
+from contextlib import contextmanager
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+from alembic.operations import BatchOperations
+import sqlalchemy as sa
+
+
+revision: str = "b131d45ad377"
+down_revision: Union[str, Sequence[str], None] = "81903643ec0c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# programs.dominant_goal (0b08100b3ad5): the goal with the highest weight
+DOMINANT_GOAL = (
+    "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+    "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END"
+)
+# sessions.estimated_duration_minutes (db06c11d5e79): the sum of the section durations
+ESTIMATED_DURATION = (
+    "COALESCE(warmup_duration_minutes, 0) + COALESCE(main_duration_minutes, 0) + "
+    "COALESCE(accessory_duration_minutes, 0) + COALESCE(finisher_duration_minutes, 0) + "
+    "COALESCE(cooldown_duration_minutes, 0)"
+)
+
+
+def _generated_columns(table: str) -> list[sa.Column]:
+    """Stored generated columns of table at this revision, as SQLite declares them."""
+    if table == "programs":
+        return [
+            sa.Column("dominant_goal", sa.String(length=13), sa.Computed(DOMINANT_GOAL, persisted=True), nullable=True),
+        ]
+    if table == "sessions":
+        return [
+            sa.Column(
+                "estimated_duration_minutes",
+                sa.SmallInteger(),
+                sa.Computed(ESTIMATED_DURATION, persisted=True),
+                nullable=True,
+            ),
+        ]
+    return []
+
+
+@contextmanager
+def _batch(table: str, **kw) -> Iterator[BatchOperations]:
+    """
+    op.batch_alter_table that keeps the stored generated columns of programs and sessions.
+
+    A SQLite rebuild copies rows with INSERT ... SELECT, which SQLite rejects for
+    generated columns, so they are dropped before the batch's own operations and
+    re-added from their declarations after them, within the same rebuild.
+    Other dialects alter in place.
+    """
+    generated = _generated_columns(table) if op.get_bind().dialect.name == "sqlite" else []
+    with op.batch_alter_table(table, **kw) as batch_op:
+        for column in generated:
+            batch_op.drop_column(column.name)
+        yield batch_op
+        for column in generated:
+            batch_op.add_column(column)
+
+
+# (table, column, referenced table, ON DELETE action)
+FOREIGN_KEYS = (
+    ("programs", "macro_cycle_id", "macro_cycles", "CASCADE"),
+    ("microcycles", "program_id", "programs", "CASCADE"),
+    ("sessions", "microcycle_id", "microcycles", "CASCADE"),
+    ("session_exercises", "session_id", "sessions", "CASCADE"),
+    ("pattern_exposures", "microcycle_id", "microcycles", "CASCADE"),
+    ("goals", "macro_cycle_id", "macro_cycles", "CASCADE"),
+    ("goals", "program_id", "programs", "CASCADE"),
+    ("goal_checkins", "goal_id", "goals", "CASCADE"),
+    ("workout_logs", "session_id", "sessions", "SET NULL"),
+    ("soreness_logs", "inferred_cause_session_id", "sessions", "SET NULL"),
+    ("recovery_signals", "session_id", "sessions", "SET NULL"),
+    ("conversation_threads", "context_session_id", "sessions", "SET NULL"),
+    ("activity_instances", "planned_session_id", "sessions", "SET NULL"),
+)
+
+# Names SQLite's unnamed foreign keys so batch mode can drop them
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _set_ondelete(upgrading: bool) -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column, referenced, ondelete in FOREIGN_KEYS:
+        name = next(
+            (
+                fk["name"]
+                for fk in inspector.get_foreign_keys(table)
+                if fk["constrained_columns"] == [column]
+            ),
+            None,
+        ) or f"fk_{table}_{column}_{referenced}"
+
+        with _batch(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                name, referenced, [column], ["id"], ondelete=ondelete if upgrading else None
+            )
+
+
+def upgrade() -> None:
+    _set_ondelete(upgrading=True)
+
+
+def downgrade() -> None:
+    _set_ondelete(upgrading=False)
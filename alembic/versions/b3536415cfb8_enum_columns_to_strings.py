@@ -0,0 +1,98 @@
+"""Store pattern/formula/source/role enum columns as plain strings
+
+Revision ID: b3536415cfb8
+Revises: 8a3e55b966e9
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "b3536415cfb8"
+down_revision: Union[str, Sequence[str], None] = "8a3e55b966e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Stored enum member name -> enum value
+MOVEMENT_PATTERNS = {
+    name: name.lower()
+    for name in (
+        "SQUAT", "HINGE", "HORIZONTAL_PUSH", "VERTICAL_PUSH", "HORIZONTAL_PULL",
+        "VERTICAL_PULL", "CARRY", "CORE", "LUNGE", "ROTATION", "PLYOMETRIC",
+        "OLYMPIC", "ISOLATION", "MOBILITY", "ISOMETRIC", "CONDITIONING", "CARDIO",
+    )
+}
+E1RM_FORMULAS = {name: name.lower() for name in ("EPLEY", "BRZYCKI", "LOMBARDI", "OCONNER")}
+RECOVERY_SOURCES = {
+    "DUMMY": "dummy",
+    "MANUAL": "manual",
+    "GARMIN": "garmin",
+    "APPLE": "apple",
+    "AURA_RING": "aura ring",
+    "WHOOP_BAND": "whoop band",
+}
+MUSCLE_ROLES = {name: name.lower() for name in ("PRIMARY", "SECONDARY", "STABILIZER")}
+
+# (table, column, PostgreSQL enum type, name -> value mapping)
+ENUM_COLUMNS = (
+    ("top_set_logs", "pattern", "movementpattern", MOVEMENT_PATTERNS),
+    ("top_set_logs", "e1rm_formula", "e1rmformula", E1RM_FORMULAS),
+    ("pattern_exposures", "pattern", "movementpattern", MOVEMENT_PATTERNS),
+    ("recovery_signals", "source", "recoverysource", RECOVERY_SOURCES),
+    ("movement_muscle_map", "role", "musclerole", MUSCLE_ROLES),
+)
+
+# e1rmformula is still used by user_settings.active_e1rm_formula
+DROPPED_TYPES = {
+    "movementpattern": MOVEMENT_PATTERNS,
+    "recoverysource": RECOVERY_SOURCES,
+    "musclerole": MUSCLE_ROLES,
+}
+
+
+def _remap(table: str, column: str, mapping: dict[str, str]) -> None:
+    cases = " ".join(f"WHEN '{old}' THEN '{new}'" for old, new in mapping.items())
+    op.execute(f"UPDATE {table} SET {column} = CASE {column} {cases} ELSE {column} END")
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for table, column, enum_name, mapping in ENUM_COLUMNS:
+        # SQLite already stores these as VARCHAR; only the values change
+        if is_postgres:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(length=50),
+                postgresql_using=f"{column}::text",
+            )
+        _remap(table, column, mapping)
+
+    if is_postgres:
+        for enum_name in DROPPED_TYPES:
+            op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    if is_postgres:
+        for enum_name, mapping in DROPPED_TYPES.items():
+            postgresql.ENUM(*mapping, name=enum_name).create(bind, checkfirst=True)
+
+    for table, column, enum_name, mapping in ENUM_COLUMNS:
+        _remap(table, column, {new: old for old, new in mapping.items()})
+        if is_postgres:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.ENUM(*mapping, name=enum_name, create_type=False),
+                postgresql_using=f"{column}::{enum_name}",
+            )
@@ -0,0 +1,165 @@
+"""Move movement equipment/discipline/general tags into link tables
+
+Revision ID: c52adf2e211f
+Revises: 7b89169b27cd
+Create Date: 2026-10-16
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "c52adf2e211f"
+down_revision: Union[str, Sequence[str], None] = "7b89169b27cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# movements JSON column -> (lookup table, link table, link foreign key column)
+TAG_COLUMNS = {
+    "equipment_tags": ("equipment", "movement_equipment", "equipment_id"),
+    "discipline_tags": ("disciplines", "movement_disciplines", "discipline_id"),
+    "tags": ("tags", "movement_tags", "tag_id"),
+}
+
+def _movements_table(columns) -> sa.TableClause:
+    return sa.table(
+        "movements",
+        sa.column("id", sa.Integer()),
+        *(sa.column(column, sa.JSON()) for column in columns),
+    )
+
+
+def _existing_tag_columns(bind) -> list[str]:
+    # movements.tags is declared on the model but no earlier migration creates it
+    present = {column["name"] for column in sa.inspect(bind).get_columns("movements")}
+    return [column for column in TAG_COLUMNS if column in present]
+
+
+def _lookup_ids(bind, lookup: str) -> dict[str, int]:
+    return dict(bind.execute(sa.text(f"SELECT slug, id FROM {lookup}")).all())
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    # disciplines already exists (activity definitions use it)
+    for lookup in ("equipment", "tags"):
+        op.create_table(
+            lookup,
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("slug", sa.String(length=100), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f(f"ix_{lookup}_slug"), lookup, ["slug"], unique=True)
+
+    for lookup, link, fk_column in TAG_COLUMNS.values():
+        op.create_table(
+            link,
+            sa.Column("movement_id", sa.Integer(), nullable=False),
+            sa.Column(fk_column, sa.Integer(), nullable=False),
+            sa.Column("position", sa.SmallInteger(), nullable=False),
+            sa.ForeignKeyConstraint(["movement_id"], ["movements.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint([fk_column], [f"{lookup}.id"]),
+            sa.PrimaryKeyConstraint("movement_id", fk_column),
+        )
+        op.create_index(op.f(f"ix_{link}_{fk_column}"), link, [fk_column], unique=False)
+
+    # Backfill: one pass over movements, then one executemany per table. Link tables
+    # for tag columns the database never had start empty.
+    tag_columns = _existing_tag_columns(bind)
+    rows = bind.execute(sa.select(_movements_table(tag_columns))).mappings().all()
+    for column in tag_columns:
+        lookup, link, fk_column = TAG_COLUMNS[column]
+        slugs_by_movement = {
+            row["id"]: list(dict.fromkeys(slug for slug in row[column] or [] if slug))
+            for row in rows
+        }
+        ids = _lookup_ids(bind, lookup)
+        missing = sorted({slug for slugs in slugs_by_movement.values() for slug in slugs} - ids.keys())
+        if missing:
+            if lookup == "disciplines":
+                statement = sa.text(
+                    "INSERT INTO disciplines (slug, name, category) VALUES (:slug, :slug, 'TRAINING')"
+                )
+            else:
+                statement = sa.text(f"INSERT INTO {lookup} (slug) VALUES (:slug)")
+            bind.execute(statement, [{"slug": slug} for slug in missing])
+            ids = _lookup_ids(bind, lookup)
+
+        links = [
+            {"movement_id": movement_id, "lookup_id": ids[slug], "position": position}
+            for movement_id, slugs in slugs_by_movement.items()
+            for position, slug in enumerate(slugs)
+        ]
+        if links:
+            bind.execute(
+                sa.text(
+                    f"INSERT INTO {link} (movement_id, {fk_column}, position) "
+                    "VALUES (:movement_id, :lookup_id, :position)"
+                ),
+                links,
+            )
+
+    if is_postgres:
+        for column in tag_columns:
+            op.drop_index(f"ix_movements_{column}_gin", table_name="movements", if_exists=True)
+
+    with op.batch_alter_table("movements") as batch_op:
+        for column in tag_columns:
+            batch_op.drop_column(column)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+    json_type = postgresql.JSONB() if is_postgres else sa.JSON()
+
+    # Restore every tag column the model declared before this revision, skipping any
+    # that are already there
+    present = set(_existing_tag_columns(bind))
+    with op.batch_alter_table("movements") as batch_op:
+        for column in TAG_COLUMNS:
+            if column not in present:
+                batch_op.add_column(sa.Column(column, json_type, nullable=True))
+
+    movements = _movements_table(TAG_COLUMNS)
+    for column, (lookup, link, fk_column) in TAG_COLUMNS.items():
+        slugs_by_movement = defaultdict(list)
+        result = bind.execute(
+            sa.text(
+                f"SELECT l.movement_id, t.slug FROM {link} l "
+                f"JOIN {lookup} t ON t.id = l.{fk_column} "
+                "ORDER BY l.movement_id, l.position"
+            )
+        )
+        for movement_id, slug in result:
+            slugs_by_movement[movement_id].append(slug)
+        for movement_id, slugs in slugs_by_movement.items():
+            bind.execute(
+                movements.update().where(movements.c.id == movement_id).values({column: slugs})
+            )
+
+    if is_postgres:
+        for column in TAG_COLUMNS:
+            op.create_index(
+                f"ix_movements_{column}_gin",
+                "movements",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                if_not_exists=True,
+            )
+
+    for lookup, link, fk_column in TAG_COLUMNS.values():
+        op.drop_index(op.f(f"ix_{link}_{fk_column}"), table_name=link)
+        op.drop_table(link)
+
+    for lookup in ("equipment", "tags"):
+        op.drop_index(op.f(f"ix_{lookup}_slug"), table_name=lookup)
+        op.drop_table(lookup)
@@ -0,0 +1,50 @@
+"""GiST index on session_exercises rep ranges as int4range; rep ranges must be ordered
+
+Revision ID: cd8c2bca771e
+Revises: b131d45ad377
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "cd8c2bca771e"
+down_revision: Union[str, Sequence[str], None] = "b131d45ad377"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # int4range(min, max) raises on min > max, so swap reversed bounds and then forbid them
+    op.execute(
+        "UPDATE session_exercises "
+        "SET target_rep_range_min = target_rep_range_max, target_rep_range_max = target_rep_range_min "
+        "WHERE target_rep_range_min > target_rep_range_max"
+    )
+    with op.batch_alter_table("session_exercises") as batch_op:
+        batch_op.create_check_constraint(
+            "valid_rep_range", "target_rep_range_min <= target_rep_range_max"
+        )
+
+    # Range types and GiST are PostgreSQL-only
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.create_index(
+        "ix_session_exercises_reps_gist",
+        "session_exercises",
+        [sa.text("int4range(target_rep_range_min, target_rep_range_max, '[]')")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_session_exercises_reps_gist", table_name="session_exercises")
+
+    with op.batch_alter_table("session_exercises") as batch_op:
+        batch_op.drop_constraint("valid_rep_range", type_="check")
@@ -0,0 +1,60 @@
+"""Composite (user, metric, date) and (user, date) indexes for biometrics history
+
+Revision ID: cd9cd0ee6ddf
+Revises: 4e2e84fb9350
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "cd9cd0ee6ddf"
+down_revision: Union[str, Sequence[str], None] = "4e2e84fb9350"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE = "user_biometrics_history"
+
+# Composite indexes added: name -> columns
+INDEXES = {
+    "ix_user_biometrics_history_user_metric_date": ["user_id", "metric_type", "date"],
+    "ix_user_biometrics_history_user_date": ["user_id", "date"],
+}
+
+# Single-column indexes they replace
+SINGLE_COLUMN_INDEXES = ("user_id", "metric_type", "date")
+
+
+def _swap_indexes(create: dict, drop: tuple) -> None:
+    # On PostgreSQL build and drop CONCURRENTLY, outside the migration transaction,
+    # so writes to the table are not blocked
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    def run():
+        for name, columns in create.items():
+            op.create_index(name, TABLE, columns, unique=False, postgresql_concurrently=concurrently)
+        for name in drop:
+            op.drop_index(name, table_name=TABLE, postgresql_concurrently=concurrently)
+
+    if concurrently:
+        with op.get_context().autocommit_block():
+            run()
+    else:
+        run()
+
+
+def upgrade() -> None:
+    _swap_indexes(
+        INDEXES,
+        tuple(op.f(f"ix_{TABLE}_{column}") for column in SINGLE_COLUMN_INDEXES),
+    )
+
+
+def downgrade() -> None:
+    _swap_indexes(
+        {op.f(f"ix_{TABLE}_{column}"): [column] for column in SINGLE_COLUMN_INDEXES},
+        tuple(INDEXES),
+    )
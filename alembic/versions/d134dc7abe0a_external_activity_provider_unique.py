@@ -0,0 +1,36 @@
+"""Make (provider, external_id) unique on external activity records
+
+Revision ID: d134dc7abe0a
+Revises: 767e83c1845a
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "d134dc7abe0a"
+down_revision: Union[str, Sequence[str], None] = "767e83c1845a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_external_activity_records_external_id"), table_name="external_activity_records")
+    with op.batch_alter_table("external_activity_records") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_external_activity_records_provider_external_id",
+            ["provider", "external_id"],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("external_activity_records") as batch_op:
+        batch_op.drop_constraint("uq_external_activity_records_provider_external_id", type_="unique")
+    op.create_index(
+        op.f("ix_external_activity_records_external_id"),
+        "external_activity_records",
+        ["external_id"],
+        unique=False,
+    )
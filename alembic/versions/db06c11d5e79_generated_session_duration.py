@@ -0,0 +1,81 @@
+"""Generate sessions.estimated_duration_minutes from the section durations
+
+Revision ID: db06c11d5e79
+Revises: 76ab799defc3
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "db06c11d5e79"
+down_revision: Union[str, Sequence[str], None] = "76ab799defc3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SESSION_SECTIONS = ("warmup", "main", "accessory", "finisher", "cooldown")
+
+# Sum of the section durations; a section without an estimate counts as 0
+ESTIMATED_DURATION = (
+    "COALESCE(warmup_duration_minutes, 0) + COALESCE(main_duration_minutes, 0) + "
+    "COALESCE(accessory_duration_minutes, 0) + COALESCE(finisher_duration_minutes, 0) + "
+    "COALESCE(cooldown_duration_minutes, 0)"
+)
+
+INCLUDE_INDEX = ("ix_sessions_microcycle_day", ["microcycle_id", "day_number"])
+
+
+def _drop_include_index() -> None:
+    # The covering index INCLUDEs estimated_duration_minutes on PostgreSQL
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(INCLUDE_INDEX[0], table_name="sessions")
+
+
+def _create_include_index() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            INCLUDE_INDEX[0],
+            "sessions",
+            INCLUDE_INDEX[1],
+            unique=False,
+            postgresql_include=["session_type", "estimated_duration_minutes"],
+        )
+
+
+def upgrade() -> None:
+    # Totals written without a breakdown (LLM estimates) are kept by attributing them to main
+    op.execute(
+        "UPDATE sessions SET main_duration_minutes = estimated_duration_minutes "
+        "WHERE estimated_duration_minutes IS NOT NULL AND "
+        + " AND ".join(f"{section}_duration_minutes IS NULL" for section in SESSION_SECTIONS)
+    )
+
+    _drop_include_index()
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("estimated_duration_minutes")
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "estimated_duration_minutes",
+                sa.SmallInteger(),
+                sa.Computed(ESTIMATED_DURATION, persisted=True),
+                nullable=True,
+            )
+        )
+    _create_include_index()
+
+
+def downgrade() -> None:
+    _drop_include_index()
+    # A plain ADD COLUMN: a SQLite batch rebuild cannot copy the generated column
+    op.add_column("sessions", sa.Column("estimated_duration_total", sa.SmallInteger(), nullable=True))
+    op.execute("UPDATE sessions SET estimated_duration_total = estimated_duration_minutes")
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("estimated_duration_minutes")
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.alter_column("estimated_duration_total", new_column_name="estimated_duration_minutes")
+    _create_include_index()
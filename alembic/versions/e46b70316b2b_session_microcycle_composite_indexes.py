@@ -0,0 +1,45 @@
+"""Composite indexes for microcycle sessions by day and program microcycles by sequence
+
+Revision ID: e46b70316b2b
+Revises: f50d44406d6f
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e46b70316b2b"
+down_revision: Union[str, Sequence[str], None] = "f50d44406d6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (single-column index replaced, composite index name, columns, INCLUDE columns)
+INDEXES = {
+    "sessions": (
+        "microcycle_id",
+        "ix_sessions_microcycle_day",
+        ["microcycle_id", "day_number"],
+        ["session_type", "estimated_duration_minutes"],
+    ),
+    "microcycles": (
+        "program_id",
+        "ix_microcycles_program_seq",
+        ["program_id", "sequence_number"],
+        [],
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, (column, name, columns, include) in INDEXES.items():
+        op.create_index(name, table, columns, unique=False, postgresql_include=include)
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+
+
+def downgrade() -> None:
+    for table, (column, name, columns, include) in INDEXES.items():
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,34 @@
+"""Add updated_at to circuit_templates
+
+Revision ID: f0326716a703
+Revises: 19c49f97493a
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f0326716a703"
+down_revision: Union[str, Sequence[str], None] = "19c49f97493a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite cannot ADD COLUMN with a non-constant default; rebuild the table there instead
+    dialect = op.get_bind().dialect.name
+    recreate = "always" if dialect == "sqlite" else "auto"
+    # Naive UTC like the other timestamps; now() alone is the session's local time on PostgreSQL
+    utc_now = sa.text("timezone('utc', now())" if dialect == "postgresql" else "CURRENT_TIMESTAMP")
+    with op.batch_alter_table("circuit_templates", recreate=recreate) as batch_op:
+        batch_op.add_column(
+            sa.Column("updated_at", sa.DateTime(), server_default=utc_now, nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("circuit_templates") as batch_op:
+        batch_op.drop_column("updated_at")
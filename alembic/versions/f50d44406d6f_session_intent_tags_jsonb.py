@@ -0,0 +1,53 @@
+"""Store sessions.intent_tags as JSONB with a GIN index
+
+Revision ID: f50d44406d6f
+Revises: 570e8cd6257a
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "f50d44406d6f"
+down_revision: Union[str, Sequence[str], None] = "570e8cd6257a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _retype(type_, cast: str) -> None:
+    # The '[]' default is typed json/jsonb; drop it around the type change
+    op.alter_column("sessions", "intent_tags", server_default=None)
+    op.alter_column(
+        "sessions",
+        "intent_tags",
+        type_=type_,
+        postgresql_using=f"intent_tags::{cast}",
+    )
+    op.alter_column("sessions", "intent_tags", server_default=sa.text("'[]'"))
+
+
+def upgrade() -> None:
+    # JSON and JSONB are the same type outside PostgreSQL
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _retype(postgresql.JSONB(), "jsonb")
+    op.create_index(
+        "ix_sessions_intent_tags_gin",
+        "sessions",
+        ["intent_tags"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_sessions_intent_tags_gin", table_name="sessions")
+    _retype(sa.JSON(), "json")
@@ -0,0 +1,50 @@
+"""Pre-serialized JSON responses for read-heavy endpoints."""
+from typing import Any, Callable, Iterable, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a response model once, in pydantic-core, and return it as is.
+
+    Returning a model lets FastAPI dump it to a dict, validate that dict against
+    the route's response_model again and run jsonable_encoder over the result.
+    The route keeps response_model for its OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json", status_code=status_code)
+
+
+def model_list_response(models: Iterable[BaseModel]) -> Response:
+    """model_response for a JSON array of models."""
+    return Response(
+        content="[" + ",".join(model.model_dump_json() for model in models) + "]",
+        media_type="application/json",
+    )
+
+
+def attr_loader(model: type[ModelT], **sources: str) -> Callable[[Any], ModelT]:
+    """
+    Build a function that copies an ORM row's attributes into a flat response model.
+
+    Uses model_construct, so nothing is validated: the row's column types already
+    match the model's fields. Fields named differently on the row are mapped with
+    ``sources`` (field name -> attribute name); attributes the row lacks fall back
+    to the model's defaults. Only for models without nested model fields.
+    """
+    fields = tuple((name, sources.get(name, name)) for name in model.model_fields)
+
+    def load(obj: Any) -> ModelT:
+        values = {}
+        for name, attr in fields:
+            value = getattr(obj, attr, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+        return model.model_construct(**values)
+
+    return load
@@ -1,7 +1,9 @@
+from datetime import datetime
 from pathlib import Path
 import json
 
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Header
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +20,29 @@ from app.config.settings import get_settings
 router = APIRouter()
 settings = get_settings()
 
+# Rendered CircuitTemplateResponse JSON keyed by (id, updated_at); templates are read-mostly
+RENDERED_CIRCUITS_MAX = 256
+_rendered_circuits: dict[tuple[int, datetime | None], bytes] = {}
+
+
+def render_circuit(circuit: CircuitTemplate) -> bytes:
+    """Serialize a circuit once per version instead of re-validating it on every read."""
+    key = (circuit.id, circuit.updated_at)
+    body = _rendered_circuits.get(key)
+    if body is None:
+        body = orjson.dumps(CircuitTemplateResponse.model_validate(circuit).model_dump(mode="json"))
+        if len(_rendered_circuits) >= RENDERED_CIRCUITS_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _rendered_circuits[next(iter(_rendered_circuits))]
+        _rendered_circuits[key] = body
+    return body
+
+
+def forget_circuit(circuit_id: int) -> None:
+    """Drop cached renders of a circuit; updated_at may not change within one clock tick."""
+    for key in [key for key in _rendered_circuits if key[0] == circuit_id]:
+        del _rendered_circuits[key]
+
 
 async def require_admin(x_admin_token: str | None = Header(default=None)) -> bool:
     if settings.admin_api_token:
@@ -52,7 +77,9 @@ async def list_circuits(
         query = query.where(CircuitTemplate.circuit_type == circuit_type)
     query = query.order_by(CircuitTemplate.name)
     result = await db.execute(query)
-    return result.scalars().all()
+    # Returning a Response skips FastAPI's response_model validation and encoding
+    body = b"[" + b",".join(render_circuit(circuit) for circuit in result.scalars()) + b"]"
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{circuit_id}", response_model=CircuitTemplateResponse)
@@ -63,7 +90,7 @@ async def get_circuit(
     circuit = await db.get(CircuitTemplate, circuit_id)
     if not circuit:
         raise HTTPException(status_code=404, detail="Circuit not found")
-    return circuit
+    return Response(content=render_circuit(circuit), media_type="application/json")
 
 
 @router.get("/admin/{circuit_id}", response_model=CircuitTemplateAdminDetail)
@@ -103,4 +130,5 @@ async def update_circuit_admin(
     circuit.exercises_json = payload.exercises_json
     await db.commit()
     await db.refresh(circuit)
+    forget_circuit(circuit.id)
     return circuit
@@ -8,16 +8,14 @@ from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
+from app.db.queries import daily_plan_stmt
 from app.config.settings import get_settings
 from app.models import (
     Program,
-    Microcycle,
-    Session,
     ConversationThread,
     ConversationTurn,
     SorenessLog,
     RecoverySignal,
-    MicrocycleStatus,
     RecoverySource,
 )
 from app.schemas.daily import (
@@ -55,36 +53,17 @@ async def get_daily_plan(
     
     Returns the session from the active microcycle, or indicates if it's a rest day.
     """
+    # Program, active microcycle and the date's session in one query
+    plan_result = await db.execute(daily_plan_stmt(), {"program_id": program_id, "date": target_date})
+    program, microcycle, session = plan_result.one_or_none() or (None, None, None)
+    
     # Verify program belongs to user
-    program = await db.get(Program, program_id)
     if not program or program.user_id != user_id:
         raise HTTPException(status_code=404, detail="Program not found")
     
-    # Get active microcycle
-    microcycle_result = await db.execute(
-        select(Microcycle).where(
-            and_(
-                Microcycle.program_id == program_id,
-                Microcycle.status == MicrocycleStatus.ACTIVE
-            )
-        )
-    )
-    microcycle = microcycle_result.scalar_one_or_none()
-    
     if not microcycle:
         raise HTTPException(status_code=404, detail="No active microcycle found")
     
-    # Get session for the date
-    session_result = await db.execute(
-        select(Session).where(
-            and_(
-                Session.microcycle_id == microcycle.id,
-                Session.date == target_date
-            )
-        )
-    )
-    session = session_result.scalar_one_or_none()
-    
     if not session:
         # Check if it's a deload day
         should_deload, deload_reason = await deload_service.should_trigger_deload(
@@ -103,20 +82,6 @@ async def get_daily_plan(
             coach_message=coach_message,
         )
     
-    # Estimate duration if not already calculated
-    if not session.estimated_duration_minutes:
-        try:
-            duration_estimate = await time_estimation_service.estimate_session_duration(
-                db, user_id, session.id
-            )
-            session.estimated_duration_minutes = duration_estimate["total_minutes"]
-            session.warmup_duration_minutes = duration_estimate["breakdown"]["warmup_minutes"]
-            session.main_duration_minutes = duration_estimate["breakdown"]["main_minutes"]
-            session.cooldown_duration_minutes = duration_estimate["breakdown"]["cooldown_minutes"]
-        except Exception:
-            # If estimation fails, continue without it
-            pass
-    
     # Convert to response
     session_response = SessionResponse(
         id=session.id,
@@ -130,10 +95,7 @@ async def get_daily_plan(
         accessory=session.accessory_json,
         finisher=session.finisher_json,
         cooldown=session.cooldown_json,
-        estimated_duration_minutes=session.estimated_duration_minutes,
-        warmup_duration_minutes=session.warmup_duration_minutes,
-        main_duration_minutes=session.main_duration_minutes,
-        cooldown_duration_minutes=session.cooldown_duration_minutes,
+        **time_estimation_service.session_durations(session),
         coach_notes=session.coach_notes,
     )
     
@@ -156,8 +118,13 @@ async def adapt_session(
     
     Creates or continues a conversation thread for iterative refinement.
     """
+    # Program, active microcycle and the date's current session in one query
+    plan_result = await db.execute(
+        daily_plan_stmt(), {"program_id": request.program_id, "date": target_date}
+    )
+    program, _, original_session = plan_result.one_or_none() or (None, None, None)
+    
     # Verify program belongs to user
-    program = await db.get(Program, program_id=request.program_id)
     if not program or program.user_id != user_id:
         raise HTTPException(status_code=404, detail="Program not found")
     
@@ -176,29 +143,6 @@ async def adapt_session(
         db.add(thread)
         await db.flush()
     
-    # Get current session if exists
-    microcycle_result = await db.execute(
-        select(Microcycle).where(
-            and_(
-                Microcycle.program_id == request.program_id,
-                Microcycle.status == MicrocycleStatus.ACTIVE
-            )
-        )
-    )
-    microcycle = microcycle_result.scalar_one_or_none()
-    
-    original_session = None
-    if microcycle:
-        session_result = await db.execute(
-            select(Session).where(
-                and_(
-                    Session.microcycle_id == microcycle.id,
-                    Session.date == target_date
-                )
-            )
-        )
-        original_session = session_result.scalar_one_or_none()
-    
     # Get recent soreness logs
     soreness_result = await db.execute(
         select(SorenessLog).where(
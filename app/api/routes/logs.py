@@ -3,10 +3,13 @@ from datetime import date
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, noload, selectinload
 
+from app.api.responses import model_list_response, model_response
 from app.db.database import get_db
+from app.db.queries import STREAM_BATCH_SIZE
 from app.config.settings import get_settings
 from app.models import (
     WorkoutLog,
@@ -36,6 +39,12 @@ from app.services.metrics import calculate_e1rm, E1RM_FORMULAS
 router = APIRouter()
 settings = get_settings()
 
+# Top sets and their movement names in one IN query each, instead of a query per log/set
+TOP_SETS_WITH_MOVEMENT = selectinload(WorkoutLog.top_sets).selectinload(TopSetLog.movement).options(
+    load_only(Movement.name),
+    noload(Movement.equipment_links),
+)
+
 
 def get_current_user_id() -> int:
     """Get current user ID (MVP: hardcoded default user)."""
@@ -75,67 +84,92 @@ async def create_workout_log(
     await db.flush()
     
     # Process top sets
-    top_sets_response = []
-    for top_set in log.top_sets or []:
-        # Get movement for e1RM calculation
-        movement = await db.get(Movement, top_set.movement_id)
+    top_sets = log.top_sets or []
+    
+    # Resolve every referenced movement in one query
+    movements_by_id: dict[int, Movement] = {}
+    if top_sets:
+        result = await db.execute(
+            select(Movement).where(Movement.id.in_({ts.movement_id for ts in top_sets}))
+        )
+        movements_by_id = {m.id: m for m in result.scalars().all()}
+    
+    formula_enum = E1RM_FORMULAS.get(settings.default_e1rm_formula, E1RM_FORMULAS["epley"])
+    top_set_rows = []
+    for top_set in top_sets:
+        movement = movements_by_id.get(top_set.movement_id)
         if not movement:
             raise HTTPException(status_code=404, detail=f"Movement not found: {top_set.movement_id}")
         
-        try:
-            pattern_enum = MovementPattern(movement.pattern)
-        except Exception:
+        if movement.pattern not in MovementPattern.values():
             raise HTTPException(status_code=400, detail=f"Movement has invalid pattern: {movement.pattern}")
+        pattern_enum = MovementPattern(movement.pattern)
         
         # Calculate e1RM using preferred formula
-        formula_enum = E1RM_FORMULAS.get(settings.default_e1rm_formula, E1RM_FORMULAS["epley"])
         e1rm = calculate_e1rm(
             weight=top_set.weight,
             reps=top_set.reps,
             formula=formula_enum,
         )
         
-        top_set_log = TopSetLog(
-            workout_log_id=workout_log.id,
-            movement_id=top_set.movement_id,
-            weight=top_set.weight,
-            reps=top_set.reps,
-            rpe=top_set.rpe,
-            rir=top_set.rir,
-            avg_rest_seconds=top_set.avg_rest_seconds,
-            e1rm_value=e1rm,
-            e1rm_formula=formula_enum,
-            pattern=pattern_enum,
+        # Core-level rows skip the ORM validators, so store enum values/codes directly
+        top_set_rows.append({
+            "workout_log_id": workout_log.id,
+            "movement_id": top_set.movement_id,
+            "weight": top_set.weight,
+            "reps": top_set.reps,
+            "rpe_tenths": TopSetLog.rpe_to_tenths(top_set.rpe),
+            "rir": top_set.rir,
+            "avg_rest_seconds": top_set.avg_rest_seconds,
+            "e1rm_value": e1rm,
+            "e1rm_formula": formula_enum.value,
+            "pattern": pattern_enum.value,
+            "pattern_code": pattern_enum.code,
+        })
+    
+    # One multi-row INSERT ... RETURNING for the top sets, one INSERT for their exposures
+    top_sets_response = []
+    if top_set_rows:
+        result = await db.execute(
+            insert(TopSetLog).returning(
+                TopSetLog.id, TopSetLog.created_at, sort_by_parameter_order=True
+            ),
+            top_set_rows,
         )
-        db.add(top_set_log)
-        await db.flush()
-
+        inserted = result.all()
+        
         if session is not None:
-            exposure = PatternExposure(
-                user_id=user_id,
-                microcycle_id=session.microcycle_id,
-                date=workout_log.date,
-                pattern=pattern_enum,
-                e1rm_value=e1rm,
-                source_top_set_log_id=top_set_log.id,
+            await db.execute(
+                insert(PatternExposure),
+                [
+                    {
+                        "user_id": user_id,
+                        "microcycle_id": session.microcycle_id,
+                        "date": workout_log.date,
+                        "pattern": row["pattern"],
+                        "e1rm_value": row["e1rm_value"],
+                        "source_top_set_log_id": top_set_id,
+                    }
+                    for row, (top_set_id, _) in zip(top_set_rows, inserted)
+                ],
             )
-            db.add(exposure)
-
-        top_sets_response.append(TopSetResponse(
-            id=top_set_log.id,
-            movement_id=top_set.movement_id,
-            movement_name=movement.name,
-            weight=top_set.weight,
-            reps=top_set.reps,
-            rpe=top_set.rpe,
-            rir=top_set.rir,
-            avg_rest_seconds=top_set.avg_rest_seconds,
-            e1rm=e1rm,
-            e1rm_value=e1rm,
-            e1rm_formula=formula_enum,
-            pattern=pattern_enum,
-            created_at=top_set_log.created_at,
-        ))
+        
+        for top_set, row, (top_set_id, created_at) in zip(top_sets, top_set_rows, inserted):
+            top_sets_response.append(TopSetResponse(
+                id=top_set_id,
+                movement_id=top_set.movement_id,
+                movement_name=movements_by_id[top_set.movement_id].name,
+                weight=top_set.weight,
+                reps=top_set.reps,
+                rpe=top_set.rpe,
+                rir=top_set.rir,
+                avg_rest_seconds=top_set.avg_rest_seconds,
+                e1rm=row["e1rm_value"],
+                e1rm_value=row["e1rm_value"],
+                e1rm_formula=formula_enum,
+                pattern=row["pattern"],
+                created_at=created_at,
+            ))
     
     await db.commit()
     
@@ -165,7 +199,11 @@ async def list_workout_logs(
     user_id: int = Depends(get_current_user_id),
 ):
     """List workout logs with optional filtering."""
-    query = select(WorkoutLog).where(WorkoutLog.user_id == user_id)
+    query = (
+        select(WorkoutLog)
+        .where(WorkoutLog.user_id == user_id)
+        .options(TOP_SETS_WITH_MOVEMENT)
+    )
     
     if start_date:
         query = query.where(WorkoutLog.date >= start_date)
@@ -190,19 +228,12 @@ async def list_workout_logs(
     # Build responses
     log_responses = []
     for log in logs:
-        # Get top sets for this log
-        top_sets_result = await db.execute(
-            select(TopSetLog).where(TopSetLog.workout_log_id == log.id)
-        )
-        top_sets = list(top_sets_result.scalars().all())
-        
         top_set_responses = []
-        for ts in top_sets:
-            movement = await db.get(Movement, ts.movement_id)
+        for ts in log.top_sets:
             top_set_responses.append(TopSetResponse(
                 id=ts.id,
                 movement_id=ts.movement_id,
-                movement_name=movement.name if movement else "Unknown",
+                movement_name=ts.movement.name if ts.movement else "Unknown",
                 weight=ts.weight,
                 reps=ts.reps,
                 rpe=ts.rpe,
@@ -228,12 +259,12 @@ async def list_workout_logs(
             created_at=log.created_at,
         ))
     
-    return WorkoutLogListResponse(
+    return model_response(WorkoutLogListResponse(
         logs=log_responses,
         total=total,
         limit=limit,
         offset=offset,
-    )
+    ))
 
 
 @router.get("/workouts/{log_id}", response_model=WorkoutLogResponse)
@@ -243,24 +274,17 @@ async def get_workout_log(
     user_id: int = Depends(get_current_user_id),
 ):
     """Get a specific workout log by ID."""
-    log = await db.get(WorkoutLog, log_id)
+    log = await db.get(WorkoutLog, log_id, options=[TOP_SETS_WITH_MOVEMENT])
     
     if not log or log.user_id != user_id:
         raise HTTPException(status_code=404, detail="Workout log not found")
     
-    # Get top sets
-    top_sets_result = await db.execute(
-        select(TopSetLog).where(TopSetLog.workout_log_id == log.id)
-    )
-    top_sets = list(top_sets_result.scalars().all())
-    
     top_set_responses = []
-    for ts in top_sets:
-        movement = await db.get(Movement, ts.movement_id)
+    for ts in log.top_sets:
         top_set_responses.append(TopSetResponse(
             id=ts.id,
             movement_id=ts.movement_id,
-            movement_name=movement.name if movement else "Unknown",
+            movement_name=ts.movement.name if ts.movement else "Unknown",
             weight=ts.weight,
             reps=ts.reps,
             rpe=ts.rpe,
@@ -273,7 +297,7 @@ async def get_workout_log(
             created_at=ts.created_at,
         ))
     
-    return WorkoutLogResponse(
+    return model_response(WorkoutLogResponse(
         id=log.id,
         user_id=log.user_id,
         session_id=log.session_id,
@@ -285,7 +309,7 @@ async def get_workout_log(
         actual_duration_minutes=log.actual_duration_minutes,
         top_sets=top_set_responses,
         created_at=log.created_at,
-    )
+    ))
 
 
 # Soreness logging
@@ -339,7 +363,7 @@ async def list_soreness_logs(
     result = await db.execute(query)
     logs = list(result.scalars().all())
     
-    return [
+    return model_list_response(
         SorenessLogResponse(
             id=log.id,
             log_date=log.date,
@@ -348,7 +372,7 @@ async def list_soreness_logs(
             notes=log.notes,
         )
         for log in logs
-    ]
+    )
 
 
 # Recovery signals
@@ -416,7 +440,7 @@ async def list_recovery_signals(
     result = await db.execute(query)
     signals = list(result.scalars().all())
     
-    return [
+    return model_list_response(
         RecoverySignalResponse(
             id=sig.id,
             user_id=sig.user_id,
@@ -433,7 +457,7 @@ async def list_recovery_signals(
             created_at=sig.created_at,
         )
         for sig in signals
-    ]
+    )
 
 
 @router.get("/recovery/latest", response_model=RecoverySignalResponse)
@@ -456,7 +480,7 @@ async def get_latest_recovery(
     if not signal:
         raise HTTPException(status_code=404, detail="No recovery signal found")
     
-    return RecoverySignalResponse(
+    return model_response(RecoverySignalResponse(
         id=signal.id,
         user_id=signal.user_id,
         log_date=signal.date,
@@ -470,7 +494,7 @@ async def get_latest_recovery(
         raw_payload=signal.raw_payload_json,
         notes=signal.notes,
         created_at=signal.created_at,
-    )
+    ))
 
 
 # Dashboard stats
@@ -508,30 +532,28 @@ async def get_dashboard_stats(
     workouts_this_month = month_workouts_result.scalar() or 0
     
     # Calculate week streak (consecutive weeks with at least one workout)
-    # Get all workout dates
-    dates_result = await db.execute(
+    # Stream workout dates newest first and stop at the first week without one
+    dates_result = await db.stream_scalars(
         select(WorkoutLog.date)
         .where(WorkoutLog.user_id == user_id)
         .order_by(desc(WorkoutLog.date))
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
     )
-    workout_dates = [row[0] for row in dates_result.fetchall()]
     
     week_streak = 0
-    if workout_dates:
-        # Get current week's Monday
-        current_week_monday = today - timedelta(days=today.weekday())
-        checking_week = current_week_monday
-        
-        while True:
-            week_end = checking_week + timedelta(days=6)
-            has_workout = any(
-                checking_week <= d <= week_end for d in workout_dates
-            )
-            if has_workout:
-                week_streak += 1
-                checking_week -= timedelta(days=7)
-            else:
+    # Start from the current week's Monday
+    checking_week = today - timedelta(days=today.weekday())
+    try:
+        async for workout_date in dates_result:
+            if workout_date > checking_week + timedelta(days=6):
+                # Later than the week being checked (future, or an already counted week)
+                continue
+            if workout_date < checking_week:
                 break
+            week_streak += 1
+            checking_week -= timedelta(days=7)
+    finally:
+        await dates_result.close()
     
     # Heaviest lift (by e1RM)
     heaviest_result = await db.execute(
@@ -625,7 +647,7 @@ async def list_pattern_exposure(
     result = await db.execute(query)
     exposures = list(result.scalars().all())
     
-    return [
+    return model_list_response(
         PatternExposureResponse(
             id=exp.id,
             user_id=exp.user_id,
@@ -637,4 +659,4 @@ async def list_pattern_exposure(
             created_at=exp.created_at,
         )
         for exp in exposures
-    ]
+    )
@@ -4,18 +4,19 @@ from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.api.responses import attr_loader, model_list_response, model_response
 from app.db.database import get_db
+from app.db.queries import active_microcycle_stmt, program_with_sessions_stmt
 from app.config.settings import get_settings
 from app.models import (
     Program,
     Microcycle,
-    Session,
     User,
     UserMovementRule,
     UserEnjoyableActivity,
     MicrocycleStatus,
+    Goal,
 )
 from app.schemas.program import (
     ProgramCreate,
@@ -34,6 +35,11 @@ router = APIRouter()
 settings = get_settings()
 
 
+# ORM rows copied into the flat response models without re-validation
+load_program_response = attr_loader(ProgramResponse, program_start_date="start_date")
+load_microcycle_response = attr_loader(MicrocycleResponse, micro_start_date="start_date")
+
+
 def get_current_user_id() -> int:
     """Get current user ID (MVP: hardcoded default user)."""
     return settings.default_user_id
@@ -123,7 +129,7 @@ async def create_program(
         program.id,
     )
 
-    return program
+    return model_response(load_program_response(program), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{program_id}", response_model=ProgramWithMicrocycleResponse)
@@ -133,7 +139,9 @@ async def get_program(
     user_id: int = Depends(get_current_user_id),
 ):
     """Get program with active microcycle, upcoming sessions, and per-week sessions."""
-    program = await db.get(Program, program_id)
+    # Program, microcycles and sessions in one eager load
+    program_result = await db.execute(program_with_sessions_stmt(), {"program_id": program_id})
+    program = program_result.scalar_one_or_none()
     
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
@@ -141,62 +149,23 @@ async def get_program(
     if program.user_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to view this program")
     
-    # Get active microcycle
-    active_microcycle_result = await db.execute(
-        select(Microcycle)
-        .where(
-            and_(
-                Microcycle.program_id == program_id,
-                Microcycle.status == MicrocycleStatus.ACTIVE
-            )
-        )
-        .options(selectinload(Microcycle.sessions))
-    )
-    active_microcycle = active_microcycle_result.scalar_one_or_none()
-
-    # Get all microcycles with their sessions
-    microcycles_result = await db.execute(
-        select(Microcycle)
-        .where(Microcycle.program_id == program_id)
-        .options(selectinload(Microcycle.sessions))
-        .order_by(Microcycle.sequence_number)
+    microcycles = program.microcycles
+    active_microcycle = next(
+        (mc for mc in microcycles if mc.status == MicrocycleStatus.ACTIVE), None
     )
-    microcycles = list(microcycles_result.scalars().unique().all())
 
     # Get upcoming sessions (next 7 days)
     upcoming_sessions = []
     if active_microcycle:
         today = date.today()
-        sessions_result = await db.execute(
-            select(Session)
-            .where(
-                and_(
-                    Session.microcycle_id == active_microcycle.id,
-                    Session.date >= today
-                )
-            )
-            .order_by(Session.date)
-            .limit(7)
-        )
-        upcoming_sessions = list(sessions_result.scalars().all())
+        upcoming_sessions = sorted(
+            (s for s in active_microcycle.sessions if s.date >= today),
+            key=lambda s: s.date,
+        )[:7]
     
-    # Convert upcoming sessions to response format with duration estimates
+    # Convert upcoming sessions to response format with durations
     session_responses = []
     for session in upcoming_sessions:
-        # Estimate duration if not already calculated
-        if not session.estimated_duration_minutes:
-            try:
-                duration_estimate = await time_estimation_service.estimate_session_duration(
-                    db, user_id, session.id
-                )
-                session.estimated_duration_minutes = duration_estimate["total_minutes"]
-                session.warmup_duration_minutes = duration_estimate["breakdown"]["warmup_minutes"]
-                session.main_duration_minutes = duration_estimate["breakdown"]["main_minutes"]
-                session.cooldown_duration_minutes = duration_estimate["breakdown"]["cooldown_minutes"]
-            except Exception:
-                # If estimation fails, use existing values or defaults
-                pass
-        
         session_responses.append(
             SessionResponse(
                 id=session.id,
@@ -210,12 +179,7 @@ async def get_program(
                 accessory=session.accessory_json,
                 finisher=session.finisher_json,
                 cooldown=session.cooldown_json,
-                estimated_duration_minutes=session.estimated_duration_minutes,
-                warmup_duration_minutes=session.warmup_duration_minutes,
-                main_duration_minutes=session.main_duration_minutes,
-                accessory_duration_minutes=session.accessory_duration_minutes,
-                finisher_duration_minutes=session.finisher_duration_minutes,
-                cooldown_duration_minutes=session.cooldown_duration_minutes,
+                **time_estimation_service.session_durations(session),
                 coach_notes=session.coach_notes,
             )
         )
@@ -230,18 +194,6 @@ async def get_program(
             key=lambda s: (s.day_number, s.date or date.min),
         )
         for session in ordered_sessions:
-            if not session.estimated_duration_minutes:
-                try:
-                    duration_estimate = await time_estimation_service.estimate_session_duration(
-                        db, user_id, session.id
-                    )
-                    session.estimated_duration_minutes = duration_estimate["total_minutes"]
-                    session.warmup_duration_minutes = duration_estimate["breakdown"]["warmup_minutes"]
-                    session.main_duration_minutes = duration_estimate["breakdown"]["main_minutes"]
-                    session.cooldown_duration_minutes = duration_estimate["breakdown"]["cooldown_minutes"]
-                except Exception:
-                    pass
-
             microcycle_sessions.append(
                 SessionResponse(
                     id=session.id,
@@ -255,12 +207,7 @@ async def get_program(
                     accessory=session.accessory_json,
                     finisher=session.finisher_json,
                     cooldown=session.cooldown_json,
-                    estimated_duration_minutes=session.estimated_duration_minutes,
-                    warmup_duration_minutes=session.warmup_duration_minutes,
-                    main_duration_minutes=session.main_duration_minutes,
-                    accessory_duration_minutes=session.accessory_duration_minutes,
-                    finisher_duration_minutes=session.finisher_duration_minutes,
-                    cooldown_duration_minutes=session.cooldown_duration_minutes,
+                    **time_estimation_service.session_durations(session),
                     coach_notes=session.coach_notes,
                 )
             )
@@ -278,30 +225,34 @@ async def get_program(
             )
         )
 
-    return ProgramWithMicrocycleResponse(
-        program=program,
-        active_microcycle=active_microcycle,
+    return model_response(ProgramWithMicrocycleResponse(
+        program=load_program_response(program),
+        active_microcycle=load_microcycle_response(active_microcycle) if active_microcycle else None,
         upcoming_sessions=session_responses,
         microcycles=microcycle_responses,
-    )
+    ))
 
 
 @router.get("", response_model=list[ProgramResponse])
 async def list_programs(
     active_only: bool = False,
+    dominant_goal: Goal | None = None,
     db: AsyncSession = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
-    """List all programs for the current user."""
+    """List all programs for the current user, optionally by their highest-weighted goal."""
     query = select(Program).where(Program.user_id == user_id)
     
     if active_only:
         query = query.where(Program.is_active == True)
     
+    if dominant_goal:
+        query = query.where(Program.dominant_goal == dominant_goal)
+    
     query = query.order_by(Program.created_at.desc())
     
     result = await db.execute(query)
-    return list(result.scalars().all())
+    return model_list_response(map(load_program_response, result.scalars()))
 
 
 @router.post("/{program_id}/microcycles/generate-next", response_model=MicrocycleResponse)
@@ -327,15 +278,7 @@ async def generate_next_microcycle(
         raise HTTPException(status_code=403, detail="Not authorized")
     
     # Get current active microcycle
-    active_result = await db.execute(
-        select(Microcycle)
-        .where(
-            and_(
-                Microcycle.program_id == program_id,
-                Microcycle.status == MicrocycleStatus.ACTIVE
-            )
-        )
-    )
+    active_result = await db.execute(active_microcycle_stmt(), {"program_id": program_id})
     current_microcycle = active_result.scalar_one_or_none()
     
     # Determine sequence number and start date
@@ -371,7 +314,7 @@ async def generate_next_microcycle(
     await db.commit()
     await db.refresh(new_microcycle)
     
-    return new_microcycle
+    return model_response(load_microcycle_response(new_microcycle))
 
 
 @router.delete("/{program_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -413,7 +356,7 @@ async def update_program(
     
     await db.commit()
     await db.refresh(program)
-    return program
+    return model_response(load_program_response(program))
 
 
 @router.patch("/{program_id}/activate", response_model=ProgramResponse)
@@ -448,4 +391,4 @@ async def activate_program(
     await db.commit()
     await db.refresh(program)
     
-    return program
+    return model_response(load_program_response(program))
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
+from app.db.queries import user_movement_rules_stmt, user_settings_stmt
 from app.config.settings import get_settings
 from app.models import (
     User,
@@ -14,6 +15,8 @@ from app.models import (
     UserMovementRule,
     UserEnjoyableActivity,
     Movement,
+    Equipment,
+    MovementEquipment,
     HeuristicConfig,
     MovementPattern,
 )
@@ -32,6 +35,7 @@ from app.schemas.settings import (
     MovementCreate,
     MovementFiltersResponse,
 )
+from app.services.movement_tags import movement_tag_service
 
 router = APIRouter()
 settings = get_settings()
@@ -49,9 +53,7 @@ async def get_user_settings(
     user_id: int = Depends(get_current_user_id),
 ):
     """Get current user settings."""
-    user_settings = await db.execute(
-        select(UserSettings).where(UserSettings.user_id == user_id)
-    )
+    user_settings = await db.execute(user_settings_stmt(), {"user_id": user_id})
     user_settings = user_settings.scalar_one_or_none()
     
     if not user_settings:
@@ -76,15 +78,11 @@ async def get_user_profile(
     user_id: int = Depends(get_current_user_id),
 ):
     """Get current user profile."""
-    # Fetch User and UserProfile
     user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
         
-    # UserProfile is a relationship, so it might be lazy loaded or we join it
-    # But since we use async, we should probably eager load it or query it separately if lazy loading issues arise.
-    # However, standard async access to relationships works if session is open.
-    # Let's check if we need to explicitly query it.
+    # Queried explicitly: a User already in the identity map may not have its profile loaded
     profile = await db.scalar(select(UserProfile).where(UserProfile.user_id == user_id))
     
     return UserProfileResponse(
@@ -165,9 +163,7 @@ async def update_user_settings(
     user_id: int = Depends(get_current_user_id),
 ):
     """Update user settings."""
-    user_settings = await db.execute(
-        select(UserSettings).where(UserSettings.user_id == user_id)
-    )
+    user_settings = await db.execute(user_settings_stmt(), {"user_id": user_id})
     user_settings = user_settings.scalar_one_or_none()
     
     if not user_settings:
@@ -197,14 +193,12 @@ async def list_movement_rules(
     user_id: int = Depends(get_current_user_id),
 ):
     """List all user movement rules (exclusions, substitutions, etc.)."""
-    result = await db.execute(
-        select(UserMovementRule).where(UserMovementRule.user_id == user_id)
-    )
+    result = await db.execute(user_movement_rules_stmt(), {"user_id": user_id})
     rules = list(result.scalars().all())
     
     responses = []
     for rule in rules:
-        movement = await db.get(Movement, rule.movement_id)
+        movement = rule.movement
         
         responses.append(MovementRuleResponse(
             id=rule.id,
@@ -233,18 +227,14 @@ async def create_movement_rule(
         raise HTTPException(status_code=404, detail="Movement not found")
     
     # Parse rule_type enum
-    try:
-        rule_type_enum = MovementRuleType[rule.rule_type.upper()]
-    except KeyError:
+    rule_type_enum = MovementRuleType.try_parse(rule.rule_type)
+    if rule_type_enum is None:
         raise HTTPException(status_code=400, detail=f"Invalid rule_type: {rule.rule_type}")
     
-    # Parse cadence enum if provided
+    # Parse cadence enum if provided (unknown values fall back to the default)
     cadence_enum = RuleCadence.PER_MICROCYCLE
     if rule.cadence:
-        try:
-            cadence_enum = RuleCadence[rule.cadence.upper()]
-        except KeyError:
-            pass  # Use default
+        cadence_enum = RuleCadence.try_parse(rule.cadence) or cadence_enum
     
     movement_rule = UserMovementRule(
         user_id=user_id,
@@ -319,13 +309,9 @@ async def create_enjoyable_activity(
     """Add an enjoyable activity."""
     from app.models.enums import EnjoyableActivity as EnjoyableActivityEnum
 
-    try:
-        activity_type = EnjoyableActivityEnum(activity.activity_type)
-    except ValueError:
-        try:
-            activity_type = EnjoyableActivityEnum[activity.activity_type.upper()]
-        except KeyError:
-            raise HTTPException(status_code=400, detail=f"Invalid activity_type: {activity.activity_type}")
+    activity_type = EnjoyableActivityEnum.try_parse(activity.activity_type)
+    if activity_type is None:
+        raise HTTPException(status_code=400, detail=f"Invalid activity_type: {activity.activity_type}")
 
     new_activity = UserEnjoyableActivity(
         user_id=user_id,
@@ -501,19 +487,21 @@ async def get_movement_filters(
     regions = sorted({m.primary_region for m in movements if m.primary_region})
     disciplines = sorted({getattr(m, "primary_discipline", None) for m in movements if getattr(m, "primary_discipline", None)})
 
-    equipment_set: set[str] = set()
-    for m in movements:
-        tags = getattr(m, "equipment_tags", None) or []
-        for tag in tags:
-            if tag:
-                equipment_set.add(tag)
+    equipment_result = await db.execute(
+        select(Equipment.slug)
+        .join(MovementEquipment, MovementEquipment.equipment_id == Equipment.id)
+        .join(Movement, Movement.id == MovementEquipment.movement_id)
+        .where((Movement.user_id.is_(None)) | (Movement.user_id == user_id))
+        .distinct()
+    )
+    equipment = sorted(equipment_result.scalars().all())
 
     types = ["compound", "accessory"]
 
     return MovementFiltersResponse(
         patterns=patterns,
         regions=regions,
-        equipment=sorted(equipment_set),
+        equipment=equipment,
         primary_disciplines=disciplines,
         types=types,
     )
@@ -544,7 +532,11 @@ async def create_movement(
         cns_load=movement.cns_load or "moderate",
         skill_level=movement.skill_level or "intermediate",
         metric_type=movement.metric_type or "reps",
-        equipment_tags=[movement.default_equipment] if movement.default_equipment else [],
+    )
+    await movement_tag_service.assign(
+        db,
+        new_movement,
+        equipment=[movement.default_equipment] if movement.default_equipment else [],
     )
     
     db.add(new_movement)
@@ -558,7 +550,7 @@ async def create_movement(
         primary_muscles=[new_movement.primary_muscle],
         secondary_muscles=new_movement.secondary_muscles,
         primary_region=new_movement.primary_region,
-        default_equipment=new_movement.equipment_tags[0] if new_movement.equipment_tags else None,
+        default_equipment=movement.default_equipment or None,
         complexity=new_movement.skill_level,
         is_compound=new_movement.compound,
         cns_load=new_movement.cns_load,
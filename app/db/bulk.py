@@ -0,0 +1,52 @@
+"""Bulk row writers for large generated batches."""
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Below this many rows a multi-row INSERT is as fast as COPY and keeps SQLite working
+COPY_THRESHOLD = 100
+
+
+async def bulk_copy(db: AsyncSession, table: Table, rows: list[dict[str, Any]]) -> None:
+    """
+    Insert rows into a table inside the session's transaction.
+
+    Large batches on PostgreSQL are streamed with COPY FROM STDIN, which checks
+    locks and types once per statement instead of once per row. Smaller batches
+    and other dialects use an executemany INSERT.
+
+    Values are converted with each column's bind processor, so enum members and
+    JSON structures can be passed as-is. Python-side column defaults are not
+    applied on the COPY path; rows must carry every column without a server default.
+
+    Args:
+        db: Database session
+        table: Target table (e.g. Session.__table__)
+        rows: Row dicts keyed by column name; all rows share the first row's keys
+    """
+    if not rows:
+        return
+
+    conn = await db.connection()
+    if len(rows) <= COPY_THRESHOLD or conn.dialect.name != "postgresql":
+        await conn.execute(insert(table), rows)
+        return
+
+    columns = list(rows[0])
+    processors = [
+        table.c[name].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+        for name in columns
+    ]
+    records = [
+        tuple(
+            process(row[name]) if process and row[name] is not None else row[name]
+            for name, process in zip(columns, processors)
+        )
+        for row in rows
+    ]
+
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
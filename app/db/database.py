@@ -1,18 +1,70 @@
 """Database connection and session management."""
-from sqlalchemy import text
+import logging
+
+import orjson
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config.settings import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Partition-maintenance functions installed by migrations for monthly-partitioned tables
+MONTHLY_PARTITION_FUNCTIONS = (
+    "create_pattern_exposure_partitions",
+    "create_goal_checkin_partitions",
+)
+
+
+def _json_dumps(value) -> str:
+    """Serialize JSON/JSONB column values with orjson; non-string keys are stringified as json.dumps does."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _pool_options(database_url: str) -> dict:
+    """QueuePool sizing for server databases; SQLite keeps SQLAlchemy's default pool."""
+    if database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        # Test connections on checkout so a database restart doesn't surface as request errors
+        "pool_pre_ping": True,
+    }
+
 
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    # Room for every distinct statement shape the API issues (default is 500)
+    query_cache_size=1200,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    **_pool_options(settings.database_url),
 )
 
+if engine.dialect.name != "sqlite":
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _log_pool_overflow(dbapi_connection, connection_record, connection_proxy):
+        # Overflow connections in use mean pool_size is too small for the load
+        pool = engine.sync_engine.pool
+        if pool.overflow() > 0:
+            logger.warning("Connection pool saturated: %s", pool.status())
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        # ON DELETE CASCADE / SET NULL only run with enforcement on, which SQLite sets per connection
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -49,3 +101,30 @@ async def init_db():
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+    # pattern_exposures and goal_checkins are range-partitioned by month once
+    # migrations have run; keep partitions for the next few months in place ahead of inserts
+    if engine.dialect.name == "postgresql":
+        for function in MONTHLY_PARTITION_FUNCTIONS:
+            await _create_monthly_partitions(function)
+
+
+async def _create_monthly_partitions(function: str) -> None:
+    """
+    Run a partition-maintenance function for the coming months, in its own transaction.
+
+    Rows land in the default partition until their month's partition exists, so a
+    failure here is logged rather than raised: startup must not depend on it.
+    """
+    try:
+        async with engine.begin() as conn:
+            has_partitions = await conn.scalar(text(f"SELECT to_regproc('{function}') IS NOT NULL"))
+            if has_partitions:
+                await conn.execute(
+                    text(
+                        f"SELECT {function}("
+                        "CURRENT_DATE, (CURRENT_DATE + interval '3 months')::date)"
+                    )
+                )
+    except Exception:
+        logger.exception("Partition maintenance failed: %s", function)
@@ -0,0 +1,105 @@
+"""
+Prebuilt statements for the hottest program/session and per-user reads.
+
+Each builder constructs its statement once and returns the same object on
+every call; values are supplied at execution time through named bind
+parameters, e.g. ``db.execute(active_microcycle_stmt(), {"program_id": pid})``.
+Reusing the statement skips rebuilding the expression tree per request and
+always hits the engine's compiled-statement cache.
+"""
+from functools import cache
+
+from sqlalchemy import Select, and_, bindparam, select
+from sqlalchemy.orm import load_only, noload, selectinload
+
+from app.models import Program, Microcycle, Session, Movement, UserMovementRule, UserSettings
+from app.models.enums import MicrocycleStatus
+
+# Rows fetched per round trip when streaming long history scans with
+# execution_options(yield_per=...); keeps memory flat regardless of history length
+STREAM_BATCH_SIZE = 1000
+
+
+@cache
+def active_microcycle_stmt() -> Select:
+    """Active microcycle of a program. Params: program_id."""
+    return select(Microcycle).where(
+        Microcycle.program_id == bindparam("program_id"),
+        Microcycle.status == MicrocycleStatus.ACTIVE,
+    )
+
+
+@cache
+def program_with_sessions_stmt() -> Select:
+    """
+    Program with all microcycles and their sessions. Params: program_id.
+
+    Loads in three queries (program, microcycles, sessions) regardless of
+    program length; collections come back in sequence/day order.
+    """
+    return (
+        select(Program)
+        .where(Program.id == bindparam("program_id"))
+        .options(selectinload(Program.microcycles).selectinload(Microcycle.sessions))
+    )
+
+
+@cache
+def microcycle_sessions_stmt() -> Select:
+    """Sessions of a microcycle by day number. Params: microcycle_id."""
+    return (
+        select(Session)
+        .where(Session.microcycle_id == bindparam("microcycle_id"))
+        .order_by(Session.day_number)
+    )
+
+
+@cache
+def daily_plan_stmt() -> Select:
+    """
+    Program, its active microcycle and that microcycle's session on a date.
+    Params: program_id, date.
+
+    One round trip instead of three; yields a single (Program, Microcycle, Session)
+    row, with Microcycle and/or Session None when there is no active microcycle or
+    no session on the date, and no row when the program does not exist.
+    """
+    return (
+        select(Program, Microcycle, Session)
+        .outerjoin(
+            Microcycle,
+            and_(
+                Microcycle.program_id == Program.id,
+                Microcycle.status == MicrocycleStatus.ACTIVE,
+            ),
+        )
+        .outerjoin(
+            Session,
+            and_(
+                Session.microcycle_id == Microcycle.id,
+                Session.date == bindparam("date"),
+            ),
+        )
+        .where(Program.id == bindparam("program_id"))
+    )
+
+
+@cache
+def user_settings_stmt() -> Select:
+    """A user's settings row. Params: user_id."""
+    return select(UserSettings).where(UserSettings.user_id == bindparam("user_id"))
+
+
+@cache
+def user_movement_rules_stmt() -> Select:
+    """A user's movement rules with each movement's name. Params: user_id."""
+    return (
+        select(UserMovementRule)
+        .where(UserMovementRule.user_id == bindparam("user_id"))
+        .options(
+            selectinload(UserMovementRule.movement).options(
+                load_only(Movement.name),
+                noload(Movement.equipment_links),
+            )
+        )
+    )
@@ -23,6 +23,7 @@ from app.models import (
     PersonaTone,
     PersonaAggression,
 )
+from app.services.movement_tags import movement_tag_service
 
 
 SEED_DATA_DIR = Path(__file__).parent.parent.parent / "seed_data"
@@ -30,13 +31,12 @@ SEED_DATA_DIR = Path(__file__).parent.parent.parent / "seed_data"
 
 def get_enum_value(enum_class, value):
     """Get enum value, handling both string and int values."""
-    if isinstance(value, int):
-        return enum_class(value)
-    try:
-        return enum_class(value)
-    except ValueError:
-        # Try uppercase
-        return enum_class(value.upper())
+    if isinstance(value, str) and hasattr(enum_class, "try_parse"):
+        member = enum_class.try_parse(value)
+        if member is not None:
+            return member
+    # Int values, and unknown strings (raises ValueError)
+    return enum_class(value)
 
 
 async def seed_movements(db: AsyncSession) -> int:
@@ -85,12 +85,16 @@ async def seed_movements(db: AsyncSession) -> int:
             is_complex_lift=m.get("is_complex_lift", False),
             is_unilateral=m.get("is_unilateral", False),
             metric_type=metric_type.value,
-            discipline_tags=m.get("discipline_tags", []),
-            equipment_tags=m.get("equipment_tags", []),
             substitution_group=m.get("substitution_group"),
             description=m.get("description"),
             coaching_cues=m.get("coaching_cues", []),
         )
+        await movement_tag_service.assign(
+            db,
+            movement,
+            equipment=m.get("equipment_tags", []),
+            disciplines=m.get("discipline_tags", []),
+        )
         db.add(movement)
         created_count += 1
     
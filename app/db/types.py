@@ -0,0 +1,103 @@
+"""Shared column types and defaults for database models."""
+from enum import Enum
+
+from sqlalchemy import JSON, DateTime, SmallInteger, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+# Binary, indexable JSONB on PostgreSQL; plain JSON elsewhere (SQLite tests/dev)
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, for server defaults and onupdate.
+
+    Timestamps are naive UTC, as datetime.utcnow() wrote them. On PostgreSQL
+    now() cast to a naive timestamp is the session's local time, so the UTC
+    wall-clock time is taken explicitly; SQLite's CURRENT_TIMESTAMP is UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Python enum stored as a SMALLINT code.
+
+    Int-valued enums (enum.IntEnum) are stored as their value. Other enums are
+    stored as the member's position in definition order; those codes are
+    persisted, so new members go at the end of the enum class and existing
+    members are never reordered or removed.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_cls = enum_cls
+        if issubclass(enum_cls, int):
+            self._codes = {member: member.value for member in enum_cls}
+        else:
+            self._codes = {member: code for code, member in enumerate(enum_cls)}
+        self._members = {code: member for member, code in self._codes.items()}
+
+    @property
+    def python_type(self) -> type[Enum]:
+        return self.enum_cls
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # Accept members and raw values alike, as SQLEnum does
+        return self._codes[self.enum_cls(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
+class StringEnum(TypeDecorator):
+    """
+    Python str-valued enum stored as its value in a VARCHAR.
+
+    Unlike a native enum type, adding a member needs no migration; the enum class
+    is the only place allowed values are defined.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum], length: int = 32, **kwargs):
+        super().__init__(length=length, **kwargs)
+        self.enum_cls = enum_cls
+
+    @property
+    def python_type(self) -> type[Enum]:
+        return self.enum_cls
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # Accept members and raw values alike, as SQLEnum does
+        return self.enum_cls(value).value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value)
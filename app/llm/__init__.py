@@ -11,6 +11,7 @@ from app.llm.ollama_provider import (
     OllamaProvider,
     SESSION_PLAN_SCHEMA,
     ADAPTATION_RESPONSE_SCHEMA,
+    MICROCYCLE_PLAN_SCHEMA,
 )
 from app.llm.prompts import (
     JEROME_SYSTEM_PROMPT,
@@ -27,6 +28,7 @@ __all__ = [
     "OllamaProvider",
     "SESSION_PLAN_SCHEMA",
     "ADAPTATION_RESPONSE_SCHEMA",
+    "MICROCYCLE_PLAN_SCHEMA",
     "get_llm_provider",
     "cleanup_llm_provider",
 ]
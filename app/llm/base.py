@@ -9,6 +9,10 @@ class Message:
     """Chat message."""
     role: str  # "system", "user", "assistant"
     content: str
+    # Marks the end of a static prompt prefix worth caching between requests.
+    # Ollama reuses the prefix's KV cache only while the model stays loaded, so
+    # requests with such a message ask it to stay loaded (keep_alive).
+    cache_prefix: bool = False
 
 
 @dataclass
@@ -31,9 +35,9 @@ class LLMResponse:
     finish_reason: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamChunk:
-    """Chunk from streaming response."""
+    """Chunk from streaming response (slotted, one is allocated per NDJSON line)."""
     content: str
     done: bool = False
     usage: dict | None = None
@@ -13,6 +13,8 @@ from app.llm.base import (
     StreamChunk,
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaProvider(LLMProvider):
     """
@@ -32,9 +34,13 @@ class OllamaProvider(LLMProvider):
         self.base_url = base_url or settings.ollama_base_url
         self.default_model = default_model or settings.ollama_model
         self.timeout = timeout or settings.ollama_timeout
+        self.keep_alive = settings.ollama_keep_alive
         
         # Async HTTP client
         self._client: httpx.AsyncClient | None = None
+        
+        # Serialized request prefixes keyed by config shape (see _build_body)
+        self._payload_prefixes: dict[tuple, tuple[dict | None, bytes]] = {}
     
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
@@ -54,37 +60,81 @@ class OllamaProvider(LLMProvider):
         """Convert Message objects to Ollama format."""
         return [{"role": m.role, "content": m.content} for m in messages]
     
-    async def chat(
-        self,
-        messages: list[Message],
-        config: LLMConfig,
-    ) -> LLMResponse:
+    def _payload_prefix(self, config: LLMConfig, stream: bool, keep_alive: bool) -> bytes:
         """
-        Send chat request to Ollama.
+        Get the serialized, message-independent part of a chat payload.
         
-        Uses the /api/chat endpoint with optional JSON format schema
-        for structured output.
+        Everything except the messages is fixed for a given model/options/schema
+        combination, so it is encoded once and reused. Schemas are keyed by
+        identity (they are module-level constants) and re-checked on lookup.
         """
-        client = await self._get_client()
+        schema = config.json_schema or None
+        key = (
+            config.model or self.default_model,
+            config.temperature,
+            config.max_tokens,
+            stream,
+            keep_alive,
+            id(schema),
+        )
+        cached = self._payload_prefixes.get(key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
         
         payload = {
-            "model": config.model or self.default_model,
-            "messages": self._build_messages(messages),
-            "stream": False,
+            "model": key[0],
+            "stream": stream,
             "options": {
                 "temperature": config.temperature,
             },
         }
         
+        # Keep the model loaded so the cached prompt prefix is reused by the next call
+        if keep_alive:
+            payload["keep_alive"] = self.keep_alive
+        
         # Add max tokens if specified
         if config.max_tokens:
             payload["options"]["num_predict"] = config.max_tokens
         
         # Add JSON schema for structured output
-        if config.json_schema:
-            payload["format"] = config.json_schema
+        # Note: Streaming with JSON format may not work well
+        # as partial JSON isn't valid
+        if schema:
+            payload["format"] = schema
+        
+        prefix = json.dumps(payload)[:-1].encode() + b', "messages": '
+        
+        # Guard against unbounded growth from ad-hoc schema dicts
+        if len(self._payload_prefixes) >= 64:
+            self._payload_prefixes.clear()
+        self._payload_prefixes[key] = (schema, prefix)
+        return prefix
+    
+    def _build_body(self, messages: list[Message], config: LLMConfig, stream: bool) -> bytes:
+        """Build the JSON request body for /api/chat."""
+        keep_alive = any(m.cache_prefix for m in messages)
+        return (
+            self._payload_prefix(config, stream, keep_alive)
+            + json.dumps(self._build_messages(messages)).encode()
+            + b"}"
+        )
+    
+    async def chat(
+        self,
+        messages: list[Message],
+        config: LLMConfig,
+    ) -> LLMResponse:
+        """
+        Send chat request to Ollama.
+        
+        Uses the /api/chat endpoint with optional JSON format schema
+        for structured output.
+        """
+        client = await self._get_client()
+        body = self._build_body(messages, config, stream=False)
         
-        response = await client.post("/api/chat", json=payload)
+        response = await client.post("/api/chat", content=body, headers=_JSON_HEADERS)
         response.raise_for_status()
         
         data = response.json()
@@ -104,6 +154,7 @@ class OllamaProvider(LLMProvider):
             structured_data=structured_data,
             usage={
                 "prompt_tokens": data.get("prompt_eval_count"),
+                "prompt_eval_duration_ns": data.get("prompt_eval_duration"),
                 "completion_tokens": data.get("eval_count"),
                 "total_duration_ns": data.get("total_duration"),
             },
@@ -122,25 +173,9 @@ class OllamaProvider(LLMProvider):
         Uses the /api/chat endpoint with stream=true.
         """
         client = await self._get_client()
+        body = self._build_body(messages, config, stream=True)
         
-        payload = {
-            "model": config.model or self.default_model,
-            "messages": self._build_messages(messages),
-            "stream": True,
-            "options": {
-                "temperature": config.temperature,
-            },
-        }
-        
-        if config.max_tokens:
-            payload["options"]["num_predict"] = config.max_tokens
-        
-        # Note: Streaming with JSON format may not work well
-        # as partial JSON isn't valid
-        if config.json_schema:
-            payload["format"] = config.json_schema
-        
-        async with client.stream("POST", "/api/chat", json=payload) as response:
+        async with client.stream("POST", "/api/chat", content=body, headers=_JSON_HEADERS) as response:
             response.raise_for_status()
             
             async for line in response.aiter_lines():
@@ -155,18 +190,22 @@ class OllamaProvider(LLMProvider):
                 content = data.get("message", {}).get("content", "")
                 done = data.get("done", False)
                 
-                usage = None
-                if done:
-                    usage = {
+                if not done:
+                    # Empty keep-alive events carry nothing for the consumer
+                    if not content:
+                        continue
+                    yield StreamChunk(content)
+                    continue
+                
+                yield StreamChunk(
+                    content,
+                    True,
+                    {
                         "prompt_tokens": data.get("prompt_eval_count"),
+                        "prompt_eval_duration_ns": data.get("prompt_eval_duration"),
                         "completion_tokens": data.get("eval_count"),
                         "total_duration_ns": data.get("total_duration"),
-                    }
-                
-                yield StreamChunk(
-                    content=content,
-                    done=done,
-                    usage=usage,
+                    },
                 )
     
     async def health_check(self) -> bool:
@@ -302,3 +341,15 @@ ADAPTATION_RESPONSE_SCHEMA = {
     },
     "required": ["adapted_plan", "changes_made", "reasoning"]
 }
+
+
+MICROCYCLE_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "sessions": {
+            "type": "array",
+            "items": SESSION_PLAN_SCHEMA
+        }
+    },
+    "required": ["sessions"]
+}
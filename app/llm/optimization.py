@@ -1,6 +1,9 @@
 """
 LLM optimization utilities for faster session generation.
 """
+import copy
+import hashlib
+import time
 from typing import Dict, List, Any, Optional
 from app.models.enums import SessionType, Goal
 
@@ -78,29 +81,28 @@ class LLMOptimizer:
         if not movement_rules:
             return movements_by_pattern
         
-        # Get user preferences
+        # Get user preferences (must_include and prefer share the same priority)
         avoid_movements = set(movement_rules.get("avoid", []))
-        must_include = set(movement_rules.get("must_include", []))
-        prefer_movements = set(movement_rules.get("prefer", []))
+        priority_set = set(movement_rules.get("must_include", []))
+        priority_set.update(movement_rules.get("prefer", []))
         
-        # Apply preferences to each pattern
+        # Apply preferences to each pattern in a single pass
         filtered_patterns = {}
         for pattern, movements in movements_by_pattern.items():
-            # Remove avoided movements
-            available_movements = [m for m in movements if m not in avoid_movements]
-            
-            # Prioritize preferred and must-include movements at the top
             priority_movements = []
             regular_movements = []
             
-            for movement in available_movements:
-                if movement in must_include or movement in prefer_movements:
+            for movement in movements:
+                if movement in avoid_movements:
+                    continue
+                if movement in priority_set:
                     priority_movements.append(movement)
                 else:
                     regular_movements.append(movement)
             
             # Combine: priority movements first, then regular movements
-            filtered_patterns[pattern] = priority_movements + regular_movements
+            priority_movements.extend(regular_movements)
+            filtered_patterns[pattern] = priority_movements
         
         return filtered_patterns
     
@@ -213,10 +215,52 @@ class LLMOptimizer:
 
 class PromptCache:
     """
-    Provides intelligent warmup/cooldown suggestions based on session patterns.
+    Provides intelligent warmup/cooldown suggestions based on session patterns,
+    and a client-side cache of LLM responses keyed on the rendered prompt.
     """
     
-    _cache: Dict[str, str] = {}
+    # Response cache: key -> (expires_at monotonic seconds, parsed response)
+    _cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+    RESPONSE_TTL_SECONDS = 3600
+    MAX_CACHED_RESPONSES = 256
+    
+    @staticmethod
+    def response_key(messages: List[Any], model: str, temperature: float, max_tokens: Optional[int]) -> str:
+        """
+        Hash a fully rendered prompt plus sampling config into a cache key.
+        
+        The session prompt is deterministic in its inputs, so identical
+        messages mean an identical request (retries, UI refreshes, previews).
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{model}\x00{temperature}\x00{max_tokens}".encode())
+        for message in messages:
+            h.update(b"\x00")
+            h.update(message.role.encode())
+            h.update(b"\x00")
+            h.update(message.content.encode())
+        return h.hexdigest()
+    
+    @classmethod
+    def get_response(cls, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached LLM response, or None if missing/expired."""
+        entry = cls._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            cls._cache.pop(key, None)
+            return None
+        # Callers mutate the parsed response while validating it
+        return copy.deepcopy(value)
+    
+    @classmethod
+    def set_response(cls, key: str, value: Dict[str, Any], ttl: int | None = None) -> None:
+        """Cache a parsed LLM response for ttl seconds (oldest entry evicted when full)."""
+        if key not in cls._cache and len(cls._cache) >= cls.MAX_CACHED_RESPONSES:
+            cls._cache.pop(next(iter(cls._cache)))
+        expires_at = time.monotonic() + (ttl if ttl is not None else cls.RESPONSE_TTL_SECONDS)
+        cls._cache[key] = (expires_at, copy.deepcopy(value))
     
     @classmethod
     def get_pattern_based_warmup(cls, intent_tags: List[str], session_type: SessionType) -> List[Dict[str, Any]]:
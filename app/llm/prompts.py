@@ -1,8 +1,14 @@
 """System prompts for LLM-powered features."""
+from functools import lru_cache
+from string import Formatter
 
 from app.llm.optimization import LLMOptimizer, PromptCache, ModelOptimizer
 from app.models.enums import SessionType, Goal
 
+# Value -> member lookups for the per-call enum conversions below
+_GOAL_BY_VALUE = {g.value: g for g in Goal}
+_SESSION_TYPE_BY_VALUE = {s.value: s for s in SessionType}
+
 # Jerome - the AI coach persona (OPTIMIZED - reduced by 40%)
 JEROME_SYSTEM_PROMPT = """You are Jerome, an expert strength coach. Design evidence-based programs that balance effectiveness with sustainability.
 
@@ -26,17 +32,11 @@ JEROME_SYSTEM_PROMPT = """You are Jerome, an expert strength coach. Design evide
 
 ## Deload: Reduce volume 40%, intensity 10-20%, maintain patterns."""
 
+# Static instructions come before the per-call context so consecutive calls
+# share the longest possible prompt prefix (reused by the provider's prompt cache)
 SESSION_GENERATION_PROMPT = """## Task
 Generate workout session based on program goals and guidance.
 
-{program_context}
-
-{session_context}
-
-{guidance_context}
-
-{interference_context}
-
 ## CRITICAL RULES (Must Follow)
 - NEVER repeat same movement within session
 - NEVER use accessories from previous day (if specified)
@@ -64,9 +64,171 @@ Generate workout session based on program goals and guidance.
   "reasoning": "Brief explanation"
 }}
 
+{program_context}
+
+{session_context}
+
+{guidance_context}
+
+{interference_context}
+
 Respond ONLY with valid JSON."""
 
 
+MICROCYCLE_GENERATION_PROMPT = """## Task
+Generate {session_count} workout sessions for one microcycle based on program goals and guidance.
+
+## CRITICAL RULES (Must Follow)
+- NEVER repeat same movement within a session
+- NEVER reuse an accessory across sessions of this microcycle
+- Sessions on consecutive days: don't load muscles the previous session trained hard
+- Use variations of one movement (its substitution group) in at most two sessions
+- Main lifts should prioritize each session's specified patterns
+- Respect user movement preferences (avoid, must_include, prefer)
+- Follow rep/set guidelines from system prompt
+
+## LLM Decision Areas (Use Your Expertise)
+- Exercise selection from available movements
+- Sets, reps, and RPE based on goals
+- Whether to include finisher and its format (AMRAP, EMOM, RFT, Ladder)
+- Superset combinations for efficiency
+
+## Output Format (JSON ONLY)
+{{
+  "sessions": [
+    {{
+      "warmup": [{{"movement": "Name", "sets": 2, "reps": 10}}],
+      "main": [{{"movement": "Name", "sets": 4, "rep_range_min": 6, "rep_range_max": 8, "target_rpe": 7.5, "rest_seconds": 120}}],
+      "accessory": [{{"movement": "Name", "sets": 3, "rep_range_min": 10, "rep_range_max": 15, "target_rpe": 7, "rest_seconds": 60}}],
+      "finisher": {{"type": "AMRAP|EMOM|RFT|Ladder", "duration_minutes": 8, "exercises": [{{"movement": "Name", "reps": 10}}]}},
+      "cooldown": [{{"movement": "Stretch", "duration_seconds": 60}}],
+      "estimated_duration_minutes": 55,
+      "reasoning": "Brief explanation"
+    }}
+  ]
+}}
+Return exactly one session object per session below, in the same order.
+
+{program_context}
+
+{sessions_context}
+{movement_context}
+
+Respond ONLY with valid JSON."""
+
+def _split_template(template: str, fields: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Pre-parse a str.format template into its literal segments.
+    
+    Returns len(fields) + 1 literals with escaped braces already resolved, so
+    rendering is a single "".join() instead of re-parsing the template per call.
+    """
+    literals = []
+    found = []
+    current = ""
+    for literal, field_name, _, _ in Formatter().parse(template):
+        current += literal
+        if field_name is not None:
+            literals.append(current)
+            found.append(field_name)
+            current = ""
+    literals.append(current)
+    if tuple(found) != fields:
+        raise ValueError(f"Template fields {found} do not match expected {list(fields)}")
+    return tuple(literals)
+
+
+# Runtime form of SESSION_GENERATION_PROMPT (the template above stays the readable source)
+_SESSION_PROMPT_PARTS = _split_template(
+    SESSION_GENERATION_PROMPT,
+    ("program_context", "session_context", "guidance_context", "interference_context"),
+)
+_MICROCYCLE_PROMPT_PARTS = _split_template(
+    MICROCYCLE_GENERATION_PROMPT,
+    ("session_count", "program_context", "sessions_context", "movement_context"),
+)
+
+
+def _goals_from_program(program: dict) -> tuple[Goal, ...]:
+    """Resolve the program's three goal values to Goal members."""
+    goals = []
+    for key in ('goal_1', 'goal_2', 'goal_3'):
+        goal = _GOAL_BY_VALUE.get(program[key])
+        # Fall back to Enum lookup for its ValueError on unknown values
+        goals.append(goal if goal is not None else Goal(program[key]))
+    return tuple(goals)
+
+
+def _session_type_from_value(session_type: str) -> SessionType:
+    """Resolve a session type value to its SessionType member."""
+    member = _SESSION_TYPE_BY_VALUE.get(session_type)
+    return member if member is not None else SessionType(session_type)
+
+
+def _program_key(program: dict) -> tuple:
+    """Hashable view of the program fields used in the program context block."""
+    return (
+        program['goal_1'], program['goal_weight_1'],
+        program['goal_2'], program['goal_weight_2'],
+        program['goal_3'], program['goal_weight_3'],
+        program['split_template'],
+        program.get('days_per_week', 'N/A'),
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_program_ctx(program_key: tuple) -> str:
+    """Render the compact program context (shared by every session of a program)."""
+    goal_1, weight_1, goal_2, weight_2, goal_3, weight_3, split_template, days_per_week = program_key
+    return f"""## Program Context
+Goals: {goal_1}({weight_1}), {goal_2}({weight_2}), {goal_3}({weight_3})
+Split: {split_template} ({days_per_week}d/wk)"""
+
+
+@lru_cache(maxsize=128)
+def _render_guidance_ctx(
+    session_type: SessionType,
+    goals: tuple[Goal, ...],
+    intent_tags: tuple[str, ...],
+    is_deload: bool,
+    used_accessories: tuple[str, ...] = (),
+) -> str:
+    """Render the guidance block; the same day shape recurs every microcycle."""
+    return LLMOptimizer.build_guidance_context(
+        session_type, list(goals), list(intent_tags), is_deload, list(used_accessories)
+    )
+
+
+def _render_prefs_ctx(
+    discipline_preferences: dict | None,
+    scheduling_preferences: dict | None,
+) -> str:
+    """Render the advanced preferences block (JSON profile data, so not cached)."""
+    prefs_ctx = "\n## User Preferences (Apply Logic)\n"
+    if discipline_preferences:
+        prefs_ctx += f"Discipline Priorities (0-10): {discipline_preferences}\n"
+    if scheduling_preferences:
+        prefs_ctx += f"Scheduling Rules: {scheduling_preferences}\n"
+        # Add specific logic instructions based on preferences
+        if scheduling_preferences.get("mix_disciplines"):
+            prefs_ctx += "- INTEGRATE high-priority disciplines into warmup/finisher/accessory\n"
+        if scheduling_preferences.get("cardio_preference") == "finisher":
+            prefs_ctx += "- ADD cardio finisher (10-20m) if compatible with session\n"
+    return prefs_ctx
+
+
+def _slice_movements(
+    movements_by_pattern: dict[str, list[str]],
+    patterns: frozenset[str],
+) -> dict[str, list[str]]:
+    """Restrict the movement library to the given patterns, keeping library order."""
+    return {
+        pattern: movements
+        for pattern, movements in movements_by_pattern.items()
+        if pattern in patterns
+    }
+
+
 def build_optimized_session_prompt(
     program: dict,
     session_type: str,
@@ -94,55 +256,40 @@ def build_optimized_session_prompt(
     5. Goal-specific suggestions
     """
     # Convert string session_type to enum for optimization
-    session_type_enum = SessionType(session_type)
+    session_type_enum = _session_type_from_value(session_type)
     
     # Extract goals for optimization
-    goals = [
-        Goal(program['goal_1']),
-        Goal(program['goal_2']),
-        Goal(program['goal_3'])
-    ]
+    goals = _goals_from_program(program)
     
-    # OPTIMIZATION 1: Apply user movement preferences (prioritize user choices)
+    # OPTIMIZATION 1: Apply user movement preferences (prioritize user choices),
+    # only to the patterns this session actually lists
+    session_movements = _slice_movements(movements_by_pattern, frozenset(intent_tags))
     user_filtered_movements = LLMOptimizer.apply_user_movement_preferences(
-        movements_by_pattern, movement_rules
+        session_movements, movement_rules
     )
     
     # OPTIMIZATION 2: Get guidance (not hard constraints) for LLM decision-making
     used_accessories = []
     if used_accessory_movements:
         # Avoid accessories used in ANY previous day of this microcycle
-        for day, movements in used_accessory_movements.items():
-            if day < day_number:
-                used_accessories.extend(movements)
-        
-        # Deduplicate
-        used_accessories = list(set(used_accessories))
-    
-    guidance_context = LLMOptimizer.build_guidance_context(
-        session_type_enum, goals, intent_tags, is_deload, used_accessories
+        # (order-preserving dedup, first occurrence wins)
+        used_accessories = list(dict.fromkeys(
+            movement
+            for day, movements in used_accessory_movements.items()
+            if day < day_number
+            for movement in movements
+        ))
+    
+    guidance_context = _render_guidance_ctx(
+        session_type_enum, goals, tuple(intent_tags), is_deload, tuple(used_accessories)
     )
     
-    # OPTIMIZATION 3: Compact program context (essential info only)
-    program_ctx = f"""## Program Context
-Goals: {program['goal_1']}({program['goal_weight_1']}), {program['goal_2']}({program['goal_weight_2']}), {program['goal_3']}({program['goal_weight_3']})
-Split: {program['split_template']} ({program.get('days_per_week', 'N/A')}d/wk)"""
+    # OPTIMIZATION 3: Compact program context (essential info only, cached per program)
+    program_ctx = _render_program_ctx(_program_key(program))
 
     # Add Advanced Preferences Context if available
     if discipline_preferences or scheduling_preferences:
-        prefs_ctx = "\n## User Preferences (Apply Logic)\n"
-        if discipline_preferences:
-            prefs_ctx += f"Discipline Priorities (0-10): {discipline_preferences}\n"
-        if scheduling_preferences:
-            prefs_ctx += f"Scheduling Rules: {scheduling_preferences}\n"
-            # Add specific logic instructions based on preferences
-            if scheduling_preferences.get("mix_disciplines"):
-                prefs_ctx += "- INTEGRATE high-priority disciplines into warmup/finisher/accessory\n"
-            if scheduling_preferences.get("cardio_preference") == "finisher":
-                prefs_ctx += "- ADD cardio finisher (10-20m) if compatible with session\n"
-        program_ctx += prefs_ctx
-    
-    # OPTIMIZATION 4: Compact session context
+        program_ctx += _render_prefs_ctx(discipline_preferences, scheduling_preferences)
     
     # OPTIMIZATION 4: Compact session context
     session_ctx = f"""## Session Context
@@ -151,34 +298,103 @@ Patterns: {', '.join(intent_tags)}
 Day: {day_number}/{microcycle_number}"""
     
     # OPTIMIZATION 5: Minimal interference context (only critical info)
-    interference_ctx = ""
+    interference_parts = []
     
     # Only include critical interference warnings
     if used_accessories:
-        interference_ctx += f"\n## CRITICAL: Avoid These Accessories\n{', '.join(used_accessories)}"
+        interference_parts.append(f"\n## CRITICAL: Avoid These Accessories\n{', '.join(used_accessories)}")
     
     if used_movement_groups:
         overused = [g for g, c in used_movement_groups.items() if c >= 2]
         if overused:
-            interference_ctx += f"\n## CRITICAL: Overused Groups\n{', '.join(overused)}"
+            interference_parts.append(f"\n## CRITICAL: Overused Groups\n{', '.join(overused)}")
     
     if fatigued_muscles:
-        interference_ctx += f"\n## Fatigued Muscles\n{', '.join(fatigued_muscles)}"
+        interference_parts.append(f"\n## Fatigued Muscles\n{', '.join(fatigued_muscles)}")
+    
+    interference_ctx = "".join(interference_parts)
     
     # OPTIMIZATION 6: Include full movement library with user preferences applied
     movement_ctx = ""
-    if user_filtered_movements:
-        movement_ctx = "\n## Available Movements (User Preferences Applied)\n"
-        for pattern, movements in user_filtered_movements.items():
-            if pattern in intent_tags:  # Only show relevant patterns
-                movement_ctx += f"- {pattern}: {', '.join(movements)}\n"
-    
-    return SESSION_GENERATION_PROMPT.format(
-        program_context=program_ctx,
-        session_context=session_ctx,
-        guidance_context=guidance_context,
-        interference_context=interference_ctx + movement_ctx,
-    )
+    if movements_by_pattern:
+        movement_lines = ["\n## Available Movements (User Preferences Applied)\n"]
+        movement_lines.extend(
+            f"- {pattern}: {', '.join(movements)}\n"
+            for pattern, movements in user_filtered_movements.items()
+        )
+        movement_ctx = "".join(movement_lines)
+    
+    pre, after_program, after_session, after_guidance, post = _SESSION_PROMPT_PARTS
+    return "".join((
+        pre, program_ctx,
+        after_program, session_ctx,
+        after_session, guidance_context,
+        after_guidance, interference_ctx, movement_ctx,
+        post,
+    ))
+
+
+def build_batched_microcycle_prompt(
+    program: dict,
+    sessions: list[dict],
+    is_deload: bool,
+    microcycle_number: int,
+    movements_by_pattern: dict[str, list[str]],
+    movement_rules: dict[str, list[str]] | None = None,
+    discipline_preferences: dict | None = None,
+    scheduling_preferences: dict | None = None,
+) -> str:
+    """
+    Build a single prompt that generates every training session of a microcycle.
+    
+    The program context and movement library are sent once; each session only
+    adds its own session/guidance block. Each entry in sessions needs
+    session_type, intent_tags and day_number. The expected response is
+    {"sessions": [...]} with one session object per entry, in order.
+    """
+    goals = _goals_from_program(program)
+    
+    program_ctx = _render_program_ctx(_program_key(program))
+    if discipline_preferences or scheduling_preferences:
+        program_ctx += _render_prefs_ctx(discipline_preferences, scheduling_preferences)
+    
+    session_blocks = []
+    session_patterns = set()
+    for index, spec in enumerate(sessions, start=1):
+        session_type = spec["session_type"]
+        intent_tags = spec.get("intent_tags") or []
+        session_patterns.update(intent_tags)
+        guidance_context = _render_guidance_ctx(
+            _session_type_from_value(session_type), goals, tuple(intent_tags), is_deload
+        )
+        session_blocks.append(f"""## Session {index}
+Type: {session_type}{'(DELOAD)' if is_deload else ''}
+Patterns: {', '.join(intent_tags)}
+Day: {spec['day_number']}/{microcycle_number}
+{guidance_context}
+""")
+    
+    # One movement library covering every pattern used in the microcycle
+    movement_ctx = ""
+    if movements_by_pattern:
+        user_filtered_movements = LLMOptimizer.apply_user_movement_preferences(
+            _slice_movements(movements_by_pattern, frozenset(session_patterns)),
+            movement_rules,
+        )
+        movement_lines = [
+            f"- {pattern}: {', '.join(movements)}\n"
+            for pattern, movements in user_filtered_movements.items()
+        ]
+        movement_ctx = "## Available Movements (User Preferences Applied)\n" + "".join(movement_lines)
+    
+    pre, after_count, after_program, after_sessions, post = _MICROCYCLE_PROMPT_PARTS
+    return "".join((
+        pre, str(len(sessions)),
+        after_count, program_ctx,
+        after_program, "\n".join(session_blocks),
+        after_sessions, movement_ctx,
+        post,
+    ))
 
 
 # Legacy function for backward compatibility
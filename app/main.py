@@ -2,8 +2,16 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.routes import (
+    programs_router,
+    days_router,
+    logs_router,
+    settings_router,
+    circuits_router,
+)
 from app.config.settings import get_settings
 from app.db.database import init_db
 
@@ -28,6 +36,8 @@ def create_app() -> FastAPI:
         description="AI-enabled workout coach that creates adaptive strength/fitness programs",
         version="0.1.0",
         lifespan=lifespan,
+        # orjson encodes the jsonable_encoder output several times faster than stdlib json
+        default_response_class=ORJSONResponse,
     )
     
     # CORS middleware
@@ -60,14 +70,7 @@ def create_app() -> FastAPI:
             "model": settings.ollama_model,
         }
     
-    # Import and include routers
-    from app.api.routes import (
-        programs_router,
-        days_router,
-        logs_router,
-        settings_router,
-        circuits_router,
-    )
+    # Include routers
     app.include_router(programs_router, prefix="/programs", tags=["Programs"])
     app.include_router(days_router, prefix="/days", tags=["Daily Planning"])
     app.include_router(logs_router, prefix="/logs", tags=["Logging"])
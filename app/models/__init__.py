@@ -36,7 +36,17 @@ from app.models.enums import (
     ActivitySource,
     MuscleRole,
 )
-from app.models.movement import Movement, MovementRelationship, Muscle, MovementMuscleMap
+from app.models.movement import (
+    Movement,
+    MovementRelationship,
+    Muscle,
+    MovementMuscleMap,
+    Equipment,
+    Tag,
+    MovementEquipment,
+    MovementDiscipline,
+    MovementTag,
+)
 from app.models.user import (
     User,
     UserMovementRule,
@@ -114,6 +124,11 @@ __all__ = [
     "MovementRelationship",
     "Muscle",
     "MovementMuscleMap",
+    "Equipment",
+    "Tag",
+    "MovementEquipment",
+    "MovementDiscipline",
+    "MovementTag",
     "User",
     "UserMovementRule",
     "UserEnjoyableActivity",
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, JSON, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, Enum as SQLEnum, text
 
 from app.db.database import Base
+from app.db.types import JSONVariant, utcnow
 from app.models.enums import CircuitType
 
 
@@ -12,13 +12,20 @@ class CircuitTemplate(Base):
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=True)
     circuit_type = Column(SQLEnum(CircuitType), nullable=False)
-    exercises_json = Column(JSON, nullable=False, default=list)
+    # JSON columns are only ever reassigned whole, so no MutableDict/MutableList tracking.
+    # Empty defaults are written by the database, not built and serialized per row in Python
+    exercises_json = Column(JSONVariant, nullable=False, server_default=text("'[]'"))
     default_rounds = Column(Integer, nullable=True)
     default_duration_seconds = Column(Integer, nullable=True)
-    bucket_stress = Column(JSON, nullable=False, default=dict)
-    tags = Column(JSON, default=list)
+    bucket_stress = Column(JSONVariant, nullable=False, server_default=text("'{}'"))
+    tags = Column(JSONVariant, server_default=text("'[]'"))
     difficulty_tier = Column(Integer, default=1)
+    # Part of the rendered-response cache key in the circuits API
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+
+    __table_args__ = (
+        Index("ix_circuit_templates_tags_gin", tags, postgresql_using="gin"),
+    )
 
     def __repr__(self):
         return f"<CircuitTemplate(id={self.id}, name='{self.name}', type={self.circuit_type})>"
-
@@ -1,12 +1,12 @@
 """Configuration and conversation models."""
-from datetime import datetime
 from sqlalchemy import (
     Boolean, Column, Integer, String, DateTime,
-    ForeignKey, Text, JSON, Enum as SQLEnum
+    ForeignKey, Text, Enum as SQLEnum, UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.types import JSONVariant, utcnow
 from app.models.enums import ExternalProvider, IngestionRunStatus
 
 
@@ -21,14 +21,14 @@ class HeuristicConfig(Base):
     version = Column(Integer, nullable=False)
     
     # Config data
-    json_blob = Column(JSON, nullable=False)
+    json_blob = Column(JSONVariant, nullable=False)
     description = Column(Text, nullable=True)
     
     # Status
     active = Column(Boolean, default=False, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     def __repr__(self):
         return f"<HeuristicConfig(name='{self.name}', version={self.version}, active={self.active})>"
@@ -39,27 +39,27 @@ class ConversationThread(Base):
     __tablename__ = "conversation_threads"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Thread context
     context_type = Column(String(50), nullable=False)  # e.g., "daily_adaptation", "program_setup"
     context_date = Column(DateTime, nullable=True)  # For daily adaptation, the target date
-    context_session_id = Column(Integer, ForeignKey("sessions.id"), nullable=True)
+    context_session_id = Column(Integer, ForeignKey("sessions.id", ondelete="SET NULL"), nullable=True)
     
     # Status
     is_active = Column(Boolean, default=True)
     final_plan_accepted = Column(Boolean, default=False)
     
     # Final accepted plan (JSON snapshot)
-    accepted_plan_json = Column(JSON, nullable=True)
+    accepted_plan_json = Column(JSONVariant, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="conversation_threads")
-    turns = relationship("ConversationTurn", back_populates="thread", cascade="all, delete-orphan")
+    turns = relationship("ConversationTurn", back_populates="thread", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<ConversationThread(id={self.id}, type='{self.context_type}')>"
@@ -70,7 +70,7 @@ class ConversationTurn(Base):
     __tablename__ = "conversation_turns"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    thread_id = Column(Integer, ForeignKey("conversation_threads.id"), nullable=False, index=True)
+    thread_id = Column(Integer, ForeignKey("conversation_threads.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Turn data
     turn_number = Column(Integer, nullable=False)
@@ -78,10 +78,10 @@ class ConversationTurn(Base):
     content = Column(Text, nullable=False)
     
     # For assistant turns, the structured response
-    structured_response_json = Column(JSON, nullable=True)
+    structured_response_json = Column(JSONVariant, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     thread = relationship("ConversationThread", back_populates="turns")
@@ -98,7 +98,7 @@ class ExternalProviderAccount(Base):
 
     provider = Column(SQLEnum(ExternalProvider), nullable=False, index=True)
     external_user_id = Column(String(255), nullable=True)
-    scopes = Column(JSON, nullable=True)
+    scopes = Column(JSONVariant, nullable=True)
 
     access_token_encrypted = Column(Text, nullable=True)
     refresh_token_encrypted = Column(Text, nullable=True)
@@ -106,8 +106,8 @@ class ExternalProviderAccount(Base):
 
     status = Column(String(50), nullable=False, default="active", index=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
 
 class ExternalIngestionRun(Base):
@@ -117,14 +117,14 @@ class ExternalIngestionRun(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     provider = Column(SQLEnum(ExternalProvider), nullable=False, index=True)
 
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, server_default=utcnow())
     finished_at = Column(DateTime, nullable=True)
     status = Column(SQLEnum(IngestionRunStatus), nullable=False, default=IngestionRunStatus.RUNNING, index=True)
 
     error = Column(Text, nullable=True)
-    cursor_json = Column(JSON, nullable=True)
+    cursor_json = Column(JSONVariant, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
 
 class ExternalActivityRecord(Base):
@@ -133,17 +133,22 @@ class ExternalActivityRecord(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     provider = Column(SQLEnum(ExternalProvider), nullable=False, index=True)
-    external_id = Column(String(255), nullable=False, index=True)
+    external_id = Column(String(255), nullable=False)
 
     activity_type_raw = Column(String(255), nullable=True)
     start_time = Column(DateTime, nullable=True, index=True)
     end_time = Column(DateTime, nullable=True)
     timezone = Column(String(64), nullable=True)
 
-    raw_payload_json = Column(JSON, nullable=True)
+    raw_payload_json = Column(JSONVariant, nullable=True)
     ingestion_run_id = Column(Integer, ForeignKey("external_ingestion_runs.id"), nullable=True, index=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+
+    __table_args__ = (
+        # Ingestion dedupes on (provider, external_id); the constraint's index serves those lookups
+        UniqueConstraint("provider", "external_id", name="uq_external_activity_records_provider_external_id"),
+    )
 
 
 class ExternalMetricStream(Base):
@@ -152,5 +157,5 @@ class ExternalMetricStream(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     external_activity_record_id = Column(Integer, ForeignKey("external_activity_records.id"), nullable=False, index=True)
     stream_type = Column(String(100), nullable=False, index=True)
-    raw_stream_json = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    raw_stream_json = Column(JSONVariant, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow())
@@ -1,8 +1,66 @@
 """Enum definitions for database models."""
-from enum import Enum
+import sys
+from enum import EnumType, IntEnum, StrEnum
+from functools import cache
+from typing import Self
 
 
-class MovementPattern(str, Enum):
+@cache
+def _member_values(enum_cls: type[StrEnum]) -> frozenset[str]:
+    return frozenset(enum_cls._value2member_map_)
+
+
+@cache
+def _member_choices(enum_cls: type[StrEnum]) -> tuple[tuple[str, str], ...]:
+    return tuple((member.name, member.value) for member in enum_cls)
+
+
+@cache
+def _member_lookup(enum_cls: type[StrEnum]) -> dict[str, StrEnum]:
+    lookup = {member.name.lower(): member for member in enum_cls}
+    lookup.update((member.value.lower(), member) for member in enum_cls)
+    return lookup
+
+
+class _FastEnumType(EnumType):
+    """Resolve Cls(value) with a single dict lookup before falling back to EnumType."""
+
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Interned values let == against source literals short-circuit on identity
+        for member in cls:
+            if isinstance(member._value_, str):
+                member._value_ = sys.intern(member._value_)
+
+    def __call__(cls, value, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value, *args, **kwargs)
+
+
+class _StrEnum(StrEnum, metaclass=_FastEnumType):
+    """StrEnum with cached member values/choices and a fast value lookup."""
+
+    @classmethod
+    def values(cls) -> frozenset[str]:
+        """Member values, for membership checks without constructing members."""
+        return _member_values(cls)
+
+    @classmethod
+    def choices(cls) -> tuple[tuple[str, str], ...]:
+        """(name, value) pairs in definition order, e.g. for select lists."""
+        return _member_choices(cls)
+
+    @classmethod
+    def try_parse(cls, value: str) -> Self | None:
+        """Case-insensitive match on member value or name; None instead of raising."""
+        return _member_lookup(cls).get(value.lower())
+
+
+class MovementPattern(_StrEnum):
     """Movement pattern categories."""
     SQUAT = "squat"
     HINGE = "hinge"
@@ -22,7 +80,22 @@ class MovementPattern(str, Enum):
     CONDITIONING = "conditioning"
     CARDIO = "cardio"
 
-class PrimaryRegion(str, Enum):
+    @property
+    def code(self) -> int:
+        """Stable small-integer code (stored in TopSetLog.pattern_code)."""
+        return _MOVEMENT_PATTERN_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> "MovementPattern":
+        return _MOVEMENT_PATTERNS_BY_CODE[code]
+
+
+# Codes are persisted: add new patterns at the end of MovementPattern, never reorder
+_MOVEMENT_PATTERNS_BY_CODE = tuple(MovementPattern)
+_MOVEMENT_PATTERN_CODES = {pattern: code for code, pattern in enumerate(_MOVEMENT_PATTERNS_BY_CODE)}
+
+
+class PrimaryRegion(_StrEnum):
     ANTERIOR_LOWER = "anterior lower"
     POSTERIOR_LOWER = "posterior lower"
     SHOULDER = "shoulder"
@@ -32,7 +105,7 @@ class PrimaryRegion(str, Enum):
     LOWER_BODY = "lower body" 
     UPPER_BODY = "upper body"
 
-class PrimaryMuscle(str, Enum):
+class PrimaryMuscle(_StrEnum):
     """Primary muscle groups."""
     QUADRICEPS = "quadriceps"    
     HAMSTRINGS = "hamstrings"
@@ -55,7 +128,7 @@ class PrimaryMuscle(str, Enum):
     FULL_BODY = "full_body"
 
 
-class MetricType(str, Enum):
+class MetricType(_StrEnum):
     """How the movement is measured."""
     REPS = "reps"
     TIME = "time"
@@ -63,7 +136,7 @@ class MetricType(str, Enum):
     DISTANCE = "distance"
 
 
-class SkillLevel(str, Enum):
+class SkillLevel(_StrEnum):
     """Movement skill/complexity level."""
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
@@ -72,7 +145,7 @@ class SkillLevel(str, Enum):
     ELITE = "elite"
 
 
-class CNSLoad(str, Enum):
+class CNSLoad(_StrEnum):
     """Central nervous system load category."""
     VERY_LOW = "very_low"
     LOW = "low"
@@ -81,7 +154,7 @@ class CNSLoad(str, Enum):
     VERY_HIGH = "very_high"
 
 
-class Goal(str, Enum):
+class Goal(_StrEnum):
     """Training goals."""
     STRENGTH = "strength"
     HYPERTROPHY = "hypertrophy"
@@ -92,7 +165,7 @@ class Goal(str, Enum):
     SPEED = "speed"
 
 
-class SplitTemplate(str, Enum):
+class SplitTemplate(_StrEnum):
     """Program split templates."""
     UPPER_LOWER = "upper_lower"
     PPL = "ppl"  # Push/Pull/Legs
@@ -100,7 +173,7 @@ class SplitTemplate(str, Enum):
     HYBRID = "hybrid"  # User-customizable
 
 
-class ProgressionStyle(str, Enum):
+class ProgressionStyle(_StrEnum):
     """Progression methodologies."""
     SINGLE_PROGRESSION = "single_progression"  # Increase weight when hitting rep target
     DOUBLE_PROGRESSION = "double_progression"  # Increase reps then weight
@@ -109,21 +182,21 @@ class ProgressionStyle(str, Enum):
     WAVE_LOADING = "wave_loading"  # Vary load/reps in waves (e.g. 7-5-3)
 
 
-class MovementRuleType(str, Enum):
+class MovementRuleType(_StrEnum):
     """User movement preference rules."""
     HARD_NO = "hard_no"  # Never include
     HARD_YES = "hard_yes"  # Must appear at least once per microcycle
     PREFERRED = "preferred"  # Must appear at least once every 2 weeks
 
 
-class RuleCadence(str, Enum):
+class RuleCadence(_StrEnum):
     """Cadence for movement rules."""
     PER_MICROCYCLE = "per_microcycle"
     WEEKLY = "weekly"
     BIWEEKLY = "biweekly"
 
 
-class EnjoyableActivity(str, Enum):
+class EnjoyableActivity(_StrEnum):
     """Enjoyable activities for recommendations."""
     TENNIS = "tennis"
     BOULDERING = "bouldering"
@@ -138,7 +211,7 @@ class EnjoyableActivity(str, Enum):
     OTHER = "other"
 
 
-class SessionType(str, Enum):
+class SessionType(_StrEnum):
     """Types of training sessions."""
     UPPER = "upper"
     LOWER = "lower"
@@ -153,7 +226,7 @@ class SessionType(str, Enum):
     CUSTOM = "custom"
 
 
-class ExerciseRole(str, Enum):
+class ExerciseRole(_StrEnum):
     """Role of exercise within a session."""
     WARMUP = "warmup"
     MAIN = "main"
@@ -163,14 +236,14 @@ class ExerciseRole(str, Enum):
     COOLDOWN = "cooldown"
 
 
-class MicrocycleStatus(str, Enum):
+class MicrocycleStatus(_StrEnum):
     """Status of a microcycle."""
     PLANNED = "planned"
     ACTIVE = "active"
     COMPLETE = "complete"
 
 
-class E1RMFormula(str, Enum):
+class E1RMFormula(_StrEnum):
     """Estimated 1RM calculation formulas."""
     EPLEY = "epley"
     BRZYCKI = "brzycki"
@@ -178,7 +251,7 @@ class E1RMFormula(str, Enum):
     OCONNER = "oconner"
 
 
-class RecoverySource(str, Enum):
+class RecoverySource(_StrEnum):
     """Source of recovery signals."""
     DUMMY = "dummy"
     MANUAL = "manual"
@@ -187,7 +260,7 @@ class RecoverySource(str, Enum):
     AURA_RING = "aura ring"
     WHOOP_BAND = "whoop band"
 
-class PersonaTone(str, Enum):
+class PersonaTone(_StrEnum):
     """Coach communication tone presets."""
     DRILL_SERGEANT = "drill_sergeant"
     SUPPORTIVE = "supportive"
@@ -196,7 +269,7 @@ class PersonaTone(str, Enum):
     MINIMALIST = "minimalist"
 
 
-class RelationshipType(str, Enum):
+class RelationshipType(_StrEnum):
     """Types of relationships between movements."""
     PROGRESSION = "progression"   # Target is harder/more complex
     REGRESSION = "regression"     # Target is easier/less complex
@@ -205,7 +278,7 @@ class RelationshipType(str, Enum):
     PREP = "prep"                # Warmup/activation for target
 
 
-class CircuitType(str, Enum):
+class CircuitType(_StrEnum):
     """Types of circuit structures."""
     ROUNDS_FOR_TIME = "rounds_for_time"  # e.g., 3 rounds of X, Y, Z
     AMRAP = "amrap"                      # As many rounds as possible in time T
@@ -216,7 +289,7 @@ class CircuitType(str, Enum):
     STATION = "station"                  # Hyrox/race station (Run 1km + 100 Wall balls)
 
 
-class StressBucket(str, Enum):
+class StressBucket(_StrEnum):
     """Buckets for normalizing training stress."""
     STRENGTH = "strength"         # Neuromuscular/mechanical load
     CONDITIONING = "conditioning" # Metabolic/cardiovascular load
@@ -225,7 +298,7 @@ class StressBucket(str, Enum):
     CNS = "cns"                   # Central nervous system fatigue
 
 
-class PersonaAggression(int, Enum):
+class PersonaAggression(IntEnum):
     """Programming aggressiveness level (1-5)."""
     CONSERVATIVE = 1
     MODERATE_CONSERVATIVE = 2
@@ -234,7 +307,7 @@ class PersonaAggression(int, Enum):
     AGGRESSIVE = 5
 
 
-class ExperienceLevel(str, Enum):
+class ExperienceLevel(_StrEnum):
     """User experience level."""
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
@@ -242,14 +315,14 @@ class ExperienceLevel(str, Enum):
     EXPERT = "expert"
 
 
-class Visibility(str, Enum):
+class Visibility(_StrEnum):
     """Content visibility level."""
     PRIVATE = "private"  # Only creator
     FRIENDS = "friends"  # Creator + friends/team
     PUBLIC = "public"    # Everyone
 
 
-class Sex(str, Enum):
+class Sex(_StrEnum):
     """User sex for biometric and health calculations."""
     FEMALE = "female"
     MALE = "male"
@@ -257,14 +330,14 @@ class Sex(str, Enum):
     UNSPECIFIED = "unspecified"
 
 
-class DataSource(str, Enum):
+class DataSource(_StrEnum):
     """Source of time-series or ingested records."""
     MANUAL = "manual"
     PROVIDER = "provider"
     ESTIMATED = "estimated"
 
 
-class BiometricMetricType(str, Enum):
+class BiometricMetricType(_StrEnum):
     """Types of biometric measurements tracked over time."""
     WEIGHT_KG = "weight_kg"
     BODY_FAT_PERCENT = "body_fat_percent"
@@ -274,7 +347,7 @@ class BiometricMetricType(str, Enum):
     VO2_MAX = "vo2_max"
 
 
-class GoalType(str, Enum):
+class GoalType(_StrEnum):
     """High-level goal category; detailed targets live in target_json."""
     PERFORMANCE = "performance"
     BODY_COMPOSITION = "body_composition"
@@ -284,7 +357,7 @@ class GoalType(str, Enum):
     OTHER = "other"
 
 
-class GoalStatus(str, Enum):
+class GoalStatus(_StrEnum):
     """Lifecycle status of a goal."""
     ACTIVE = "active"
     PAUSED = "paused"
@@ -292,7 +365,7 @@ class GoalStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class ExternalProvider(str, Enum):
+class ExternalProvider(_StrEnum):
     """External health/fitness provider."""
     STRAVA = "strava"
     GARMIN = "garmin"
@@ -302,14 +375,14 @@ class ExternalProvider(str, Enum):
     OTHER = "other"
 
 
-class IngestionRunStatus(str, Enum):
+class IngestionRunStatus(_StrEnum):
     """Status for an ingestion run."""
     RUNNING = "running"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
 
 
-class DisciplineCategory(str, Enum):
+class DisciplineCategory(_StrEnum):
     """High-level grouping for disciplines."""
     TRAINING = "training"
     SPORT = "sport"
@@ -317,7 +390,7 @@ class DisciplineCategory(str, Enum):
     OTHER = "other"
 
 
-class ActivityCategory(str, Enum):
+class ActivityCategory(_StrEnum):
     """High-level grouping for activity definitions."""
     STRENGTH = "strength"
     CARDIO = "cardio"
@@ -327,14 +400,14 @@ class ActivityCategory(str, Enum):
     OTHER = "other"
 
 
-class ActivitySource(str, Enum):
+class ActivitySource(_StrEnum):
     """How an activity instance was created."""
     PLANNED = "planned"
     MANUAL = "manual"
     PROVIDER = "provider"
 
 
-class MuscleRole(str, Enum):
+class MuscleRole(_StrEnum):
     """Role of a muscle in an activity or movement."""
     PRIMARY = "primary"
     SECONDARY = "secondary"
@@ -1,12 +1,16 @@
 """Workout logging and metrics models."""
-from datetime import date, datetime
+from functools import cache
+
 from sqlalchemy import (
     Boolean, Column, Integer, String, Date, DateTime,
-    ForeignKey, Text, Float, Enum as SQLEnum, JSON
+    ForeignKey, Float, Enum as SQLEnum, Numeric, SmallInteger, Index
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import text
 
 from app.db.database import Base
+from app.db.types import JSONVariant, utcnow
 from app.models.enums import (
     E1RMFormula,
     MovementPattern,
@@ -15,23 +19,49 @@ from app.models.enums import (
 )
 
 
+# Validators run on every assignment; resolve each raw string to its member once
+@cache
+def _to_pattern(value: str) -> MovementPattern:
+    return MovementPattern(value)
+
+
+@cache
+def _to_formula(value: str) -> E1RMFormula:
+    return E1RMFormula(value)
+
+
+@cache
+def _to_source(value: str) -> RecoverySource:
+    return RecoverySource(value)
+
+
+# Bounded so notes stay inline in the row instead of being TOASTed on PostgreSQL
+NOTES_MAX_LENGTH = 2048
+
+
+def _bounded_notes(value: str | None) -> str | None:
+    if value is not None and len(value) > NOTES_MAX_LENGTH:
+        raise ValueError(f"notes must be at most {NOTES_MAX_LENGTH} characters")
+    return value
+
+
 class WorkoutLog(Base):
     """Log of a completed workout session."""
     __tablename__ = "workout_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    session_id = Column(Integer, ForeignKey("sessions.id"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="SET NULL"), nullable=True, index=True)
     
     # Completion
-    date = Column(Date, nullable=False, index=True)
+    date = Column(Date, nullable=False)
     completed = Column(Boolean, nullable=False, default=True)
     
     # User feedback
-    notes = Column(Text, nullable=True)
-    perceived_difficulty = Column(Integer, nullable=True)  # 1-10
-    enjoyment_rating = Column(Integer, nullable=True)  # 1-5
-    feedback_tags = Column(JSON, default=list)  # e.g. ["too_hard", "boring"]
+    notes = Column(String(NOTES_MAX_LENGTH), nullable=True)
+    perceived_difficulty = Column(SmallInteger, nullable=True)  # 1-10
+    enjoyment_rating = Column(SmallInteger, nullable=True)  # 1-5
+    feedback_tags = Column(JSONVariant, server_default=text("'[]'"))  # e.g. ["too_hard", "boring"]
     
     # Timing
     actual_duration_minutes = Column(Integer, nullable=True)
@@ -39,15 +69,26 @@ class WorkoutLog(Base):
     # Access Control
     visibility = Column(SQLEnum(Visibility), default=Visibility.PRIVATE, nullable=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="workout_logs")
     session = relationship("Session", back_populates="workout_logs")
-    top_sets = relationship("TopSetLog", back_populates="workout_log", cascade="all, delete-orphan")
+    top_sets = relationship("TopSetLog", back_populates="workout_log", cascade="all, delete-orphan", passive_deletes=True)
+
+    @validates("notes")
+    def _validate_notes(self, key, value):
+        return _bounded_notes(value)
+
+    # Log history is always read per user over a date range
+    __table_args__ = (
+        Index("ix_workout_logs_user_id_date", "user_id", "date"),
+    )
 
     def __repr__(self):
-        return f"<WorkoutLog(id={self.id}, user_id={self.user_id}, date={self.date})>"
+        # Read loaded state directly: no descriptor overhead, and never triggers a refresh
+        state = self.__dict__
+        return f"<WorkoutLog(id={state.get('id')}, user_id={state.get('user_id')}, date={state.get('date')})>"
 
 
 class TopSetLog(Base):
@@ -55,34 +96,64 @@ class TopSetLog(Base):
     __tablename__ = "top_set_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    workout_log_id = Column(Integer, ForeignKey("workout_logs.id"), nullable=False, index=True)
+    workout_log_id = Column(Integer, ForeignKey("workout_logs.id", ondelete="CASCADE"), nullable=False, index=True)
     movement_id = Column(Integer, ForeignKey("movements.id"), nullable=False, index=True)
     
     # Performance data
     weight = Column(Float, nullable=False)  # In user's preferred unit
     reps = Column(Integer, nullable=False)
-    rpe = Column(Float, nullable=True)  # 6-10 scale
+    rpe_tenths = Column(SmallInteger, nullable=True)  # RPE x 10 (6-10 scale); read/write via rpe
     rir = Column(Integer, nullable=True)  # Reps in reserve
     
     # Optional rest tracking
     avg_rest_seconds = Column(Integer, nullable=True)
     
-    # Calculated metrics
-    e1rm_value = Column(Float, nullable=True)
-    e1rm_formula = Column(SQLEnum(E1RMFormula), nullable=True)
+    # Calculated metrics (fixed-point: exact two-decimal values, read back as float)
+    e1rm_value = Column(Numeric(7, 2, asdecimal=False), nullable=True)
+    e1rm_formula = Column(String(50), nullable=True)  # Stores E1RMFormula value
     
-    # Denormalized for fast PSI queries
-    pattern = Column(SQLEnum(MovementPattern), nullable=False, index=True)
+    # Denormalized for fast PSI queries; pattern_code (MovementPattern.code) carries the index
+    pattern = Column(String(50), nullable=False)  # Stores MovementPattern value
+    pattern_code = Column(SmallInteger, nullable=False, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     workout_log = relationship("WorkoutLog", back_populates="top_sets")
     movement = relationship("Movement", back_populates="top_set_logs")
 
+    @validates("pattern")
+    def _validate_pattern(self, key, value):
+        pattern = _to_pattern(value)
+        self.pattern_code = pattern.code
+        return pattern.value
+
+    @hybrid_property
+    def rpe(self) -> float | None:
+        return None if self.rpe_tenths is None else self.rpe_tenths / 10
+
+    @rpe.inplace.setter
+    def _rpe_setter(self, value: float | None) -> None:
+        self.rpe_tenths = self.rpe_to_tenths(value)
+
+    @rpe.inplace.expression
+    @classmethod
+    def _rpe_expression(cls):
+        return cls.rpe_tenths / 10.0
+
+    @staticmethod
+    def rpe_to_tenths(value: float | None) -> int | None:
+        """Storage form of an RPE, for Core inserts that bypass the rpe setter."""
+        return None if value is None else round(value * 10)
+
+    @validates("e1rm_formula")
+    def _validate_e1rm_formula(self, key, value):
+        return None if value is None else _to_formula(value).value
+
     def __repr__(self):
-        return f"<TopSetLog(id={self.id}, movement_id={self.movement_id}, weight={self.weight}x{self.reps})>"
+        state = self.__dict__
+        return f"<TopSetLog(id={state.get('id')}, movement_id={state.get('movement_id')}, weight={state.get('weight')}x{state.get('reps')})>"
 
 
 class PatternExposure(Base):
@@ -93,27 +164,41 @@ class PatternExposure(Base):
     __tablename__ = "pattern_exposures"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    microcycle_id = Column(Integer, ForeignKey("microcycles.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    microcycle_id = Column(Integer, ForeignKey("microcycles.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Pattern and date
-    date = Column(Date, nullable=False, index=True)
-    pattern = Column(SQLEnum(MovementPattern), nullable=False, index=True)
+    date = Column(Date, nullable=False)
+    pattern = Column(String(50), nullable=False)  # Stores MovementPattern value
     
     # e1RM value for this exposure
-    e1rm_value = Column(Float, nullable=False)
+    e1rm_value = Column(Numeric(7, 2, asdecimal=False), nullable=False)
     
     # Source tracking
     source_top_set_log_id = Column(Integer, ForeignKey("top_set_logs.id"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     microcycle = relationship("Microcycle", back_populates="pattern_exposures")
 
+    # PSI and history queries filter by user (and usually pattern), newest first.
+    # On PostgreSQL the table is range-partitioned by month on date (see migration
+    # af60c9ea0a53), with a physical primary key of (id, date). PostgreSQL cannot
+    # enforce a unique id across partitions, so only the id sequence keeps it unique.
+    __table_args__ = (
+        Index("ix_pattern_exposures_user_id_date", "user_id", "date"),
+        Index("ix_pattern_exposures_user_id_pattern_date", "user_id", "pattern", "date"),
+    )
+
+    @validates("pattern")
+    def _validate_pattern(self, key, value):
+        return _to_pattern(value).value
+
     def __repr__(self):
-        return f"<PatternExposure(id={self.id}, pattern={self.pattern}, e1rm={self.e1rm_value})>"
+        state = self.__dict__
+        return f"<PatternExposure(id={state.get('id')}, pattern={state.get('pattern')}, e1rm={state.get('e1rm_value')})>"
 
 
 class SorenessLog(Base):
@@ -121,7 +206,7 @@ class SorenessLog(Base):
     __tablename__ = "soreness_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Soreness data
     date = Column(Date, nullable=False, index=True)
@@ -129,19 +214,24 @@ class SorenessLog(Base):
     soreness_1_5 = Column(Integer, nullable=False)  # 1 = none, 5 = severe
     
     # DOMS attribution (system-inferred)
-    inferred_cause_session_id = Column(Integer, ForeignKey("sessions.id"), nullable=True)
+    inferred_cause_session_id = Column(Integer, ForeignKey("sessions.id", ondelete="SET NULL"), nullable=True)
     
     # Notes
-    notes = Column(Text, nullable=True)
+    notes = Column(String(NOTES_MAX_LENGTH), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="soreness_logs")
 
+    @validates("notes")
+    def _validate_notes(self, key, value):
+        return _bounded_notes(value)
+
     def __repr__(self):
-        return f"<SorenessLog(id={self.id}, body_part='{self.body_part}', level={self.soreness_1_5})>"
+        state = self.__dict__
+        return f"<SorenessLog(id={state.get('id')}, body_part='{state.get('body_part')}', level={state.get('soreness_1_5')})>"
 
 
 class RecoverySignal(Base):
@@ -149,14 +239,14 @@ class RecoverySignal(Base):
     __tablename__ = "recovery_signals"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Timing
     date = Column(Date, nullable=False, index=True)
-    session_id = Column(Integer, ForeignKey("sessions.id"), nullable=True)
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="SET NULL"), nullable=True)
     
     # Source
-    source = Column(SQLEnum(RecoverySource), nullable=False, default=RecoverySource.DUMMY)
+    source = Column(String(50), nullable=False, default=RecoverySource.DUMMY.value)  # Stores RecoverySource value
     
     # Metrics (nullable - not all sources provide all)
     hrv = Column(Float, nullable=True)  # Heart rate variability
@@ -164,16 +254,25 @@ class RecoverySignal(Base):
     sleep_score = Column(Float, nullable=True)  # 0-100
     sleep_hours = Column(Float, nullable=True)
     readiness = Column(Float, nullable=True)  # 0-100 overall readiness
-    raw_payload_json = Column(JSON, nullable=True)
+    raw_payload_json = Column(JSONVariant, nullable=True)
     
     # Notes
-    notes = Column(Text, nullable=True)
+    notes = Column(String(NOTES_MAX_LENGTH), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="recovery_signals")
 
+    @validates("source")
+    def _validate_source(self, key, value):
+        return _to_source(value).value
+
+    @validates("notes")
+    def _validate_notes(self, key, value):
+        return _bounded_notes(value)
+
     def __repr__(self):
-        return f"<RecoverySignal(id={self.id}, date={self.date}, source={self.source})>"
+        state = self.__dict__
+        return f"<RecoverySignal(id={state.get('id')}, date={state.get('date')}, source={state.get('source')})>"
@@ -1,20 +1,27 @@
 """Movement repository models."""
-from datetime import datetime
-from sqlalchemy import Boolean, Column, Integer, String, Text, JSON, ForeignKey
-from sqlalchemy import DateTime, Float, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from functools import cache
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, text
+from sqlalchemy import DateTime, Float, PrimaryKeyConstraint, SmallInteger
+from sqlalchemy.orm import deferred, relationship, validates
 
 from app.db.database import Base
-from app.models.enums import (
-    MovementPattern,
-    PrimaryMuscle,
-    PrimaryRegion,
-    MetricType,
-    SkillLevel,
-    CNSLoad,
-    RelationshipType,
-    MuscleRole,
-)
+from app.db.types import JSONVariant, utcnow
+from app.models.enums import MuscleRole
+
+
+@cache
+def _to_role(value: str) -> MuscleRole:
+    return MuscleRole(value)
+
+
+# Bounded so descriptions/notes stay inline in the row instead of being TOASTed on PostgreSQL
+TEXT_MAX_LENGTH = 4096
+
+
+def _bounded_text(key: str, value: str | None) -> str | None:
+    if value is not None and len(value) > TEXT_MAX_LENGTH:
+        raise ValueError(f"{key} must be at most {TEXT_MAX_LENGTH} characters")
+    return value
 
 
 class MovementRelationship(Base):
@@ -25,12 +32,16 @@ class MovementRelationship(Base):
     source_movement_id = Column(Integer, ForeignKey("movements.id"), nullable=False, index=True)
     target_movement_id = Column(Integer, ForeignKey("movements.id"), nullable=False, index=True)
     relationship_type = Column(String(50), nullable=False, index=True)  # Stores RelationshipType enum
-    notes = Column(Text, nullable=True)
+    notes = Column(String(TEXT_MAX_LENGTH), nullable=True)
 
     # Relationships
     source_movement = relationship("Movement", foreign_keys=[source_movement_id], back_populates="outgoing_relationships")
     target_movement = relationship("Movement", foreign_keys=[target_movement_id], back_populates="incoming_relationships")
 
+    @validates("notes")
+    def _validate_notes(self, key, value):
+        return _bounded_text(key, value)
+
 
 class Movement(Base):
     """Movement/exercise definition."""
@@ -44,7 +55,7 @@ class Movement(Base):
     pattern = Column(String(50), nullable=False, index=True)  # Stores enum value
     primary_muscle = Column(String(50), nullable=False, index=True)  # Stores enum value
     primary_region = Column(String(50), nullable=False, index=True)  # Stores enum value
-    secondary_muscles = Column(JSON, default=list)  # List of PrimaryMuscle values
+    secondary_muscles = Column(JSONVariant, server_default=text("'[]'"))  # List of PrimaryMuscle values
     
     # Load and complexity
     cns_load = Column(String(50), nullable=False, default="moderate")  # Stores enum value
@@ -59,14 +70,15 @@ class Movement(Base):
     metric_type = Column(String(50), nullable=False, default="reps")  # Stores enum value
     
     # Categorization
+    # Columns in the "details" group are only loaded on access (or with undefer_group("details")),
+    # so movement lists and name/pattern lookups skip the text payloads
     primary_discipline = Column(String(50), nullable=False, default="All", server_default="All")
-    discipline_tags = Column(JSON, default=list)  # e.g., ["powerlifting", "olympic", "calisthenics"]
-    equipment_tags = Column(JSON, default=list)  # e.g., ["barbell", "dumbbell", "bodyweight"]
-    tags = Column(JSON, default=list)  # General tags e.g. ["crossfit", "athletic", "mobility"]
+    # Discipline/equipment/general tags live in the movement_disciplines, movement_equipment
+    # and movement_tags link tables; see the *_links relationships below
     
     # Description and notes
-    description = Column(Text, nullable=True)
-    coaching_cues = Column(JSON, default=list)  # List of coaching cues
+    description = deferred(Column(String(TEXT_MAX_LENGTH), nullable=True), group="details")
+    coaching_cues = deferred(Column(JSONVariant, server_default=text("'[]'")), group="details")  # List of coaching cues
     
     # Substitution helpers
     substitution_group = Column(String(100), nullable=True, index=True)  # e.g., "single_arm_row"
@@ -76,6 +88,26 @@ class Movement(Base):
     session_exercises = relationship("SessionExercise", back_populates="movement")
     top_set_logs = relationship("TopSetLog", back_populates="movement")
 
+    # Tag links, ordered as entered (the first equipment tag is the movement's default).
+    # Equipment is part of every movement response, so it is loaded with the movement;
+    # disciplines and general tags load on request (selectinload(Movement.tag_links), ...)
+    equipment_links = relationship(
+        "MovementEquipment",
+        order_by="MovementEquipment.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+    discipline_links = relationship(
+        "MovementDiscipline",
+        order_by="MovementDiscipline.position",
+        cascade="all, delete-orphan",
+    )
+    tag_links = relationship(
+        "MovementTag",
+        order_by="MovementTag.position",
+        cascade="all, delete-orphan",
+    )
+
     # Movement Relationships
     outgoing_relationships = relationship(
         "MovementRelationship",
@@ -90,6 +122,22 @@ class Movement(Base):
         cascade="all, delete-orphan"
     )
 
+    @validates("description")
+    def _validate_description(self, key, value):
+        return _bounded_text(key, value)
+
+    @property
+    def equipment_tags(self) -> list[str]:
+        return [link.equipment.slug for link in self.equipment_links]
+
+    @property
+    def discipline_tags(self) -> list[str]:
+        return [link.discipline.slug for link in self.discipline_links]
+
+    @property
+    def tags(self) -> list[str]:
+        return [link.tag.slug for link in self.tag_links]
+
     def __repr__(self):
         return f"<Movement(id={self.id}, name='{self.name}', pattern={self.pattern})>"
 
@@ -101,7 +149,7 @@ class Muscle(Base):
     slug = Column(String(100), nullable=False, unique=True, index=True)
     name = Column(String(200), nullable=False)
     region = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
 
 class MovementMuscleMap(Base):
@@ -110,5 +158,59 @@ class MovementMuscleMap(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     movement_id = Column(Integer, ForeignKey("movements.id"), nullable=False, index=True)
     muscle_id = Column(Integer, ForeignKey("muscles.id"), nullable=False, index=True)
-    role = Column(SQLEnum(MuscleRole), nullable=False, index=True)
+    role = Column(String(50), nullable=False, index=True)  # Stores MuscleRole value
     magnitude = Column(Float, nullable=False, default=1.0)
+
+    @validates("role")
+    def _validate_role(self, key, value):
+        return _to_role(value).value
+
+
+class Equipment(Base):
+    __tablename__ = "equipment"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    slug = Column(String(100), nullable=False, unique=True, index=True)
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    slug = Column(String(100), nullable=False, unique=True, index=True)
+
+
+class MovementEquipment(Base):
+    __tablename__ = "movement_equipment"
+
+    movement_id = Column(Integer, ForeignKey("movements.id", ondelete="CASCADE"), nullable=False)
+    equipment_id = Column(Integer, ForeignKey("equipment.id"), nullable=False, index=True)
+    position = Column(SmallInteger, nullable=False, default=0)
+
+    equipment = relationship("Equipment", lazy="joined")
+
+    __table_args__ = (PrimaryKeyConstraint("movement_id", "equipment_id"),)
+
+
+class MovementDiscipline(Base):
+    __tablename__ = "movement_disciplines"
+
+    movement_id = Column(Integer, ForeignKey("movements.id", ondelete="CASCADE"), nullable=False)
+    discipline_id = Column(Integer, ForeignKey("disciplines.id"), nullable=False, index=True)
+    position = Column(SmallInteger, nullable=False, default=0)
+
+    discipline = relationship("Discipline", lazy="joined")
+
+    __table_args__ = (PrimaryKeyConstraint("movement_id", "discipline_id"),)
+
+
+class MovementTag(Base):
+    __tablename__ = "movement_tags"
+
+    movement_id = Column(Integer, ForeignKey("movements.id", ondelete="CASCADE"), nullable=False)
+    tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False, index=True)
+    position = Column(SmallInteger, nullable=False, default=0)
+
+    tag = relationship("Tag", lazy="joined")
+
+    __table_args__ = (PrimaryKeyConstraint("movement_id", "tag_id"),)
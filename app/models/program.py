@@ -1,13 +1,16 @@
 """Program planning models."""
-from datetime import date, datetime
+from datetime import date
 from sqlalchemy import (
     Boolean, Column, Integer, String, Date, DateTime, 
-    ForeignKey, Text, JSON, Enum as SQLEnum, Float,
-    CheckConstraint
+    ForeignKey, Text, Enum as SQLEnum, Float,
+    CheckConstraint, Computed, Index, SmallInteger, UniqueConstraint, func, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import INT4RANGE
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, validates
 
 from app.db.database import Base
+from app.db.types import JSONVariant, SmallIntEnum, StringEnum, utcnow
 from app.models.enums import (
     Goal,
     SplitTemplate,
@@ -27,65 +30,118 @@ from app.models.enums import (
 )
 
 
+# (goal column, weight column) per program goal slot
+GOAL_SLOTS = (
+    ("goal_1", "goal_weight_1"),
+    ("goal_2", "goal_weight_2"),
+    ("goal_3", "goal_weight_3"),
+)
+
+
 class Program(Base):
     """Training program (8-12 weeks)."""
     __tablename__ = "programs"
 
+    # Columns are declared in PostgreSQL alignment order so tuples carry little padding:
+    # 8-byte (timestamp), then 4-byte (integer, date, enum), 2-byte (smallint) and
+    # 1-byte (boolean) columns, then variable-length ones. id leads by convention.
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    macro_cycle_id = Column(Integer, ForeignKey("macro_cycles.id"), nullable=True, index=True)
-    name = Column(String(100), nullable=True)  # Added for historic programs
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    macro_cycle_id = Column(Integer, ForeignKey("macro_cycles.id", ondelete="CASCADE"), nullable=True, index=True)
     
     # Program duration
     start_date = Column(Date, nullable=False)
-    duration_weeks = Column(Integer, nullable=False)  # 8-12
     
     # Goals with ten-dollar method weights (must sum to 10)
     goal_1 = Column(SQLEnum(Goal), nullable=False)
     goal_2 = Column(SQLEnum(Goal), nullable=False)
     goal_3 = Column(SQLEnum(Goal), nullable=False)
-    goal_weight_1 = Column(Integer, nullable=False)
-    goal_weight_2 = Column(Integer, nullable=False)
-    goal_weight_3 = Column(Integer, nullable=False)
+    # Highest-weighted goal (earlier slot wins ties), maintained by the database
+    dominant_goal = Column(
+        SQLEnum(Goal),
+        Computed(
+            "CASE WHEN goal_weight_1 >= goal_weight_2 AND goal_weight_1 >= goal_weight_3 THEN goal_1 "
+            "WHEN goal_weight_2 >= goal_weight_3 THEN goal_2 ELSE goal_3 END",
+            persisted=True,
+        ),
+    )
     
     # Program structure
     split_template = Column(SQLEnum(SplitTemplate), nullable=False)
-    days_per_week = Column(Integer, nullable=False)  # User's training frequency (2-7)
     progression_style = Column(SQLEnum(ProgressionStyle), nullable=False)
     
-    # Hybrid split definition (for SplitTemplate.HYBRID)
-    # Stores the custom day-by-day structure or block composition
-    hybrid_definition = Column(JSON, nullable=True)
+    visibility = Column(SQLEnum(Visibility), default=Visibility.PRIVATE, nullable=False)
     
-    # Disciplines/Training styles snapshot (ten-dollar method weights)
-    # Format: [{"discipline": "powerlifting", "weight": 5}, {"discipline": "crossfit", "weight": 5}]
-    disciplines_json = Column(JSON, nullable=True)
+    duration_weeks = Column(SmallInteger, nullable=False)  # 8-12
+    goal_weight_1 = Column(SmallInteger, nullable=False)
+    goal_weight_2 = Column(SmallInteger, nullable=False)
+    goal_weight_3 = Column(SmallInteger, nullable=False)
+    days_per_week = Column(SmallInteger, nullable=False)  # User's training frequency (2-7)
     
     # Deload configuration
-    deload_every_n_microcycles = Column(Integer, nullable=False, default=4)
+    deload_every_n_microcycles = Column(SmallInteger, nullable=False, default=4)
     
-    # Persona snapshot (copied from user at program creation)
-    persona_tone = Column(SQLEnum(PersonaTone), nullable=False)
-    persona_aggression = Column(SQLEnum(PersonaAggression), nullable=False)
+    # Persona snapshot (copied from user at program creation); tone is in the
+    # variable-length group below
+    persona_aggression = Column(SmallIntEnum(PersonaAggression), nullable=False)
     
     # Status
     is_active = Column(Boolean, default=True)
     is_template = Column(Boolean, default=False)  # Reusable template
-    visibility = Column(SQLEnum(Visibility), default=Visibility.PRIVATE, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    name = Column(String(100), nullable=True)  # Added for historic programs
+    persona_tone = Column(StringEnum(PersonaTone), nullable=False)
+    # Goal values with non-zero weight, kept in sync with the slots above so
+    # "programs containing goal X" is one GIN-indexed containment test on PostgreSQL:
+    # Program.goal_vec.contains([Goal.HYPERTROPHY.value])
+    goal_vec = Column(JSONVariant, nullable=False, server_default=text("'[]'"))
+    
+    # Hybrid split definition (for SplitTemplate.HYBRID)
+    # Stores the custom day-by-day structure or block composition
+    hybrid_definition = Column(JSONVariant, nullable=True)
+    
+    # Disciplines/Training styles snapshot (ten-dollar method weights)
+    # Format: [{"discipline": "powerlifting", "weight": 5}, {"discipline": "crossfit", "weight": 5}]
+    disciplines_json = Column(JSONVariant, nullable=True)
     
     # Constraints
     __table_args__ = (
         CheckConstraint('duration_weeks >= 8 AND duration_weeks <= 12', name='valid_duration'),
         CheckConstraint('goal_weight_1 + goal_weight_2 + goal_weight_3 = 10', name='goals_sum_to_ten'),
         CheckConstraint('goal_weight_1 >= 0 AND goal_weight_2 >= 0 AND goal_weight_3 >= 0', name='positive_weights'),
+        Index(
+            "ix_programs_active_dominant_goal",
+            "dominant_goal",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        Index("ix_programs_goal_vec_gin", goal_vec, postgresql_using="gin"),
     )
+
+    @validates(*(column for slot in GOAL_SLOTS for column in slot))
+    def _sync_goal_vec(self, key, value):
+        slots = {column: getattr(self, column) for slot in GOAL_SLOTS for column in slot}
+        slots[key] = value
+        self.goal_vec = [
+            Goal(slots[goal]).value
+            for goal, weight in GOAL_SLOTS
+            if slots[goal] is not None and (slots[weight] or 0) > 0
+        ]
+        return value
     
     # Relationships
     user = relationship("User", back_populates="programs")
     macro_cycle = relationship("MacroCycle", back_populates="programs")
-    microcycles = relationship("Microcycle", back_populates="program", cascade="all, delete-orphan")
-    goals = relationship("UserGoal", back_populates="program", cascade="all, delete-orphan")
+    # Child rows are removed by ON DELETE CASCADE; passive_deletes skips loading them first
+    microcycles = relationship(
+        "Microcycle",
+        back_populates="program",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Microcycle.sequence_number",
+    )
+    goals = relationship("UserGoal", back_populates="program", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Program(id={self.id}, user_id={self.user_id}, split={self.split_template})>"
@@ -96,26 +152,36 @@ class Microcycle(Base):
     __tablename__ = "microcycles"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    program_id = Column(Integer, ForeignKey("programs.id"), nullable=False, index=True)
+    program_id = Column(Integer, ForeignKey("programs.id", ondelete="CASCADE"), nullable=False)
     
     # Timing
     start_date = Column(Date, nullable=False)
-    length_days = Column(Integer, nullable=False)  # 7-10
-    sequence_number = Column(Integer, nullable=False)  # 1, 2, 3, etc.
+    length_days = Column(SmallInteger, nullable=False)  # 7-10
+    sequence_number = Column(SmallInteger, nullable=False)  # 1, 2, 3, etc.
     
     # Status
-    status = Column(SQLEnum(MicrocycleStatus), nullable=False, default=MicrocycleStatus.PLANNED)
+    status = Column(SmallIntEnum(MicrocycleStatus), nullable=False, default=MicrocycleStatus.PLANNED)
     is_deload = Column(Boolean, default=False)
     
     # Constraints
     __table_args__ = (
         CheckConstraint('length_days >= 7 AND length_days <= 10', name='valid_length'),
+        # Program microcycles in sequence; the leading column also serves program_id lookups
+        Index("ix_microcycles_program_seq", "program_id", "sequence_number"),
     )
     
     # Relationships
     program = relationship("Program", back_populates="microcycles")
-    sessions = relationship("Session", back_populates="microcycle", cascade="all, delete-orphan")
-    pattern_exposures = relationship("PatternExposure", back_populates="microcycle", cascade="all, delete-orphan")
+    sessions = relationship(
+        "Session",
+        back_populates="microcycle",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Session.day_number",
+    )
+    pattern_exposures = relationship(
+        "PatternExposure", back_populates="microcycle", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Microcycle(id={self.id}, program_id={self.program_id}, seq={self.sequence_number})>"
@@ -135,50 +201,87 @@ class Session(Base):
     """
     __tablename__ = "sessions"
 
+    # Columns are declared in PostgreSQL alignment order (4-byte, 2-byte, then
+    # variable-length) so tuples carry little padding; id leads by convention
     id = Column(Integer, primary_key=True, autoincrement=True)
-    microcycle_id = Column(Integer, ForeignKey("microcycles.id"), nullable=False, index=True)
-    
-    # Scheduling
-    date = Column(Date, nullable=False, index=True)
-    day_number = Column(Integer, nullable=False)  # Day within microcycle (1-10)
-    
-    # Session type and intent
-    session_type = Column(SQLEnum(SessionType), nullable=False)
-    intent_tags = Column(JSON, default=list)  # e.g., ["strength", "hypertrophy"]
-    
-    # Session content (JSON blocks) - ALL OPTIONAL
-    # Each section can be None if not needed for this session type
-    warmup_json = Column(JSON, nullable=True)  # Optional: general preparation
-    main_json = Column(JSON, nullable=True)  # Optional: primary work
-    accessory_json = Column(JSON, nullable=True)  # Optional: supporting work
-    finisher_json = Column(JSON, nullable=True)  # Optional: brief high-effort completion
-    cooldown_json = Column(JSON, nullable=True)  # Optional: active recovery
+    microcycle_id = Column(Integer, ForeignKey("microcycles.id", ondelete="CASCADE"), nullable=False)
     
     # Circuit Integration
     # If this session IS a circuit (Hyrox/Crossfit day), these fields are used
     main_circuit_id = Column(Integer, ForeignKey("circuit_templates.id"), nullable=True)
     finisher_circuit_id = Column(Integer, ForeignKey("circuit_templates.id"), nullable=True)
     
+    # Scheduling
+    date = Column(Date, nullable=False)
+    day_number = Column(SmallInteger, nullable=False)  # Day within microcycle (1-10)
+    
+    # Session type
+    session_type = Column(SmallIntEnum(SessionType), nullable=False)
+    
     # Time estimation
-    estimated_duration_minutes = Column(Integer, nullable=True)
-    warmup_duration_minutes = Column(Integer, nullable=True)
-    main_duration_minutes = Column(Integer, nullable=True)
-    accessory_duration_minutes = Column(Integer, nullable=True)
-    finisher_duration_minutes = Column(Integer, nullable=True)
-    cooldown_duration_minutes = Column(Integer, nullable=True)
+    # Sum of the section durations, maintained by the database
+    estimated_duration_minutes = Column(
+        SmallInteger,
+        Computed(
+            "COALESCE(warmup_duration_minutes, 0) + COALESCE(main_duration_minutes, 0) "
+            "+ COALESCE(accessory_duration_minutes, 0) + COALESCE(finisher_duration_minutes, 0) "
+            "+ COALESCE(cooldown_duration_minutes, 0)",
+            persisted=True,
+        ),
+    )
+    warmup_duration_minutes = Column(SmallInteger, nullable=True)
+    main_duration_minutes = Column(SmallInteger, nullable=True)
+    accessory_duration_minutes = Column(SmallInteger, nullable=True)
+    finisher_duration_minutes = Column(SmallInteger, nullable=True)
+    cooldown_duration_minutes = Column(SmallInteger, nullable=True)
+    
+    # Session intent
+    intent_tags = Column(JSONVariant, server_default=text("'[]'"))  # e.g., ["strength", "hypertrophy"]
+    
+    # Session content (JSON blocks) - ALL OPTIONAL
+    # Each section can be None if not needed for this session type.
+    # Deprecated: generation also writes each block's exercises as SessionExercise
+    # rows (role = block); these columns remain the serving format for one release.
+    warmup_json = Column(JSONVariant, nullable=True)  # Optional: general preparation
+    main_json = Column(JSONVariant, nullable=True)  # Optional: primary work
+    accessory_json = Column(JSONVariant, nullable=True)  # Optional: supporting work
+    finisher_json = Column(JSONVariant, nullable=True)  # Optional: brief high-effort completion
+    cooldown_json = Column(JSONVariant, nullable=True)  # Optional: active recovery
     
     # Coach reasoning
     coach_notes = Column(Text, nullable=True)
     
     # Relationships
     microcycle = relationship("Microcycle", back_populates="sessions")
-    exercises = relationship("SessionExercise", back_populates="session", cascade="all, delete-orphan")
-    workout_logs = relationship("WorkoutLog", back_populates="session")
+    exercises = relationship(
+        "SessionExercise", back_populates="session", cascade="all, delete-orphan", passive_deletes=True
+    )
+    # Left out of program eager loads: large and only needed by the logging endpoints.
+    # Logs outlive their session; the database clears session_id (ON DELETE SET NULL)
+    workout_logs = relationship("WorkoutLog", back_populates="session", passive_deletes=True)
     
     # Circuit Relationships
     main_circuit = relationship("CircuitTemplate", foreign_keys=[main_circuit_id])
     finisher_circuit = relationship("CircuitTemplate", foreign_keys=[finisher_circuit_id])
 
+    __table_args__ = (
+        # Tag membership (intent_tags @> '["strength"]') on PostgreSQL
+        Index("ix_sessions_intent_tags_gin", intent_tags, postgresql_using="gin"),
+        # Microcycle sessions by day; INCLUDE lets the calendar view read type and
+        # duration from the index alone on PostgreSQL
+        Index(
+            "ix_sessions_microcycle_day",
+            "microcycle_id",
+            "day_number",
+            postgresql_include=["session_type", "estimated_duration_minutes"],
+        ),
+        # Date range scans; BRIN on PostgreSQL, where sessions arrive roughly in date order
+        Index("ix_sessions_date_brin", "date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+    # Fetch the generated estimated_duration_minutes with RETURNING on UPDATE as well,
+    # instead of expiring it (an async lazy refresh would fail)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<Session(id={self.id}, date={self.date}, type={self.session_type})>"
 
@@ -188,24 +291,24 @@ class SessionExercise(Base):
     __tablename__ = "session_exercises"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(Integer, ForeignKey("sessions.id"), nullable=False, index=True)
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False)
     movement_id = Column(Integer, ForeignKey("movements.id"), nullable=False, index=True)
     
-    # Exercise role and order
-    role = Column(SQLEnum(ExerciseRole), nullable=False)
-    order_in_session = Column(Integer, nullable=False)
-    superset_group = Column(Integer, nullable=True)  # Exercises with same number are supersetted
+    # Exercise role (the session block it belongs to) and order within that block
+    role = Column(SmallIntEnum(ExerciseRole), nullable=False)
+    order_in_session = Column(SmallInteger, nullable=False)
+    superset_group = Column(SmallInteger, nullable=True)  # Exercises with same number are supersetted
     
     # Prescription
-    target_sets = Column(Integer, nullable=False)
-    target_rep_range_min = Column(Integer, nullable=True)
-    target_rep_range_max = Column(Integer, nullable=True)
-    target_rpe = Column(Float, nullable=True)  # 6-10 scale
-    target_rir = Column(Integer, nullable=True)  # Reps in reserve (alternative to RPE)
-    target_duration_seconds = Column(Integer, nullable=True)  # For time-based exercises
+    target_sets = Column(SmallInteger, nullable=False)
+    target_rep_range_min = Column(SmallInteger, nullable=True)
+    target_rep_range_max = Column(SmallInteger, nullable=True)
+    target_rpe_tenths = Column(SmallInteger, nullable=True)  # RPE x 10 (6-10 scale); read/write via target_rpe
+    target_rir = Column(SmallInteger, nullable=True)  # Reps in reserve (alternative to RPE)
+    target_duration_seconds = Column(SmallInteger, nullable=True)  # For time-based exercises
     
     # Rest
-    default_rest_seconds = Column(Integer, nullable=True)
+    default_rest_seconds = Column(SmallInteger, nullable=True)
     
     # Substitution info
     is_complex_lift = Column(Boolean, default=False)
@@ -218,6 +321,53 @@ class SessionExercise(Base):
     session = relationship("Session", back_populates="exercises")
     movement = relationship("Movement", back_populates="session_exercises")
 
+    # On PostgreSQL the table is hash-partitioned 16 ways on session_id (see migration
+    # 5cc7af065373), with a physical primary key of (id, session_id). Nothing enforces
+    # id by itself there: rows must take their id from the sequence, never set it.
+    __table_args__ = (
+        # Serves per-session reads (leading column) and per-block scans in block order
+        Index("ix_session_exercises_session_role_order", "session_id", "role", "order_in_session"),
+        # int4range rejects a lower bound above the upper one
+        CheckConstraint('target_rep_range_min <= target_rep_range_max', name='valid_rep_range'),
+        # Rep-range containment/overlap via target_reps; range types are PostgreSQL-only
+        Index(
+            "ix_session_exercises_reps_gist",
+            func.int4range(target_rep_range_min, target_rep_range_max, text("'[]'")),
+            postgresql_using="gist",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    @hybrid_property
+    def target_reps(self) -> tuple[int | None, int | None]:
+        """Inclusive rep range; in queries an int4range, e.g. target_reps.contains(10)."""
+        return self.target_rep_range_min, self.target_rep_range_max
+
+    @target_reps.inplace.expression
+    @classmethod
+    def _target_reps_expression(cls):
+        # Same expression as ix_session_exercises_reps_gist, so range predicates can use it
+        return func.int4range(
+            cls.target_rep_range_min, cls.target_rep_range_max, text("'[]'"), type_=INT4RANGE
+        )
+
+    @hybrid_property
+    def target_rpe(self) -> float | None:
+        return None if self.target_rpe_tenths is None else self.target_rpe_tenths / 10
+
+    @target_rpe.inplace.setter
+    def _target_rpe_setter(self, value: float | None) -> None:
+        self.target_rpe_tenths = self.rpe_to_tenths(value)
+
+    @target_rpe.inplace.expression
+    @classmethod
+    def _target_rpe_expression(cls):
+        return cls.target_rpe_tenths / 10.0
+
+    @staticmethod
+    def rpe_to_tenths(value: float | None) -> int | None:
+        """Storage form of a target RPE, for Core inserts that bypass the target_rpe setter."""
+        return None if value is None else round(value * 10)
+
     def __repr__(self):
         return f"<SessionExercise(id={self.id}, session_id={self.session_id}, movement_id={self.movement_id})>"
 
@@ -226,54 +376,65 @@ class MacroCycle(Base):
     __tablename__ = "macro_cycles"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     name = Column(String(200), nullable=True)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     user = relationship("User", back_populates="macro_cycles")
-    programs = relationship("Program", back_populates="macro_cycle", cascade="all, delete-orphan")
-    goals = relationship("UserGoal", back_populates="macro_cycle", cascade="all, delete-orphan")
+    programs = relationship("Program", back_populates="macro_cycle", cascade="all, delete-orphan", passive_deletes=True)
+    goals = relationship("UserGoal", back_populates="macro_cycle", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class UserGoal(Base):
     __tablename__ = "goals"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    macro_cycle_id = Column(Integer, ForeignKey("macro_cycles.id"), nullable=True, index=True)
-    program_id = Column(Integer, ForeignKey("programs.id"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    macro_cycle_id = Column(Integer, ForeignKey("macro_cycles.id", ondelete="CASCADE"), nullable=True, index=True)
+    program_id = Column(Integer, ForeignKey("programs.id", ondelete="CASCADE"), nullable=True, index=True)
 
     goal_type = Column(SQLEnum(GoalType), nullable=False)
-    target_json = Column(JSON, nullable=True)
-    priority = Column(Integer, nullable=False, default=3)
+    target_json = Column(JSONVariant, nullable=True)
+    priority = Column(SmallInteger, nullable=False, default=3)
     status = Column(SQLEnum(GoalStatus), nullable=False, default=GoalStatus.ACTIVE)
 
-    effective_from = Column(DateTime, nullable=False, default=datetime.utcnow)
+    effective_from = Column(DateTime, nullable=False, server_default=utcnow())
     effective_to = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     user = relationship("User", back_populates="goals")
     macro_cycle = relationship("MacroCycle", back_populates="goals")
     program = relationship("Program", back_populates="goals")
-    checkins = relationship("GoalCheckin", back_populates="goal", cascade="all, delete-orphan")
+    checkins = relationship("GoalCheckin", back_populates="goal", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class GoalCheckin(Base):
     __tablename__ = "goal_checkins"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    goal_id = Column(Integer, ForeignKey("goals.id"), nullable=False, index=True)
+    goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False)
 
-    date = Column(Date, nullable=False, index=True)
-    value_json = Column(JSON, nullable=True)
+    date = Column(Date, nullable=False)
+    value_json = Column(JSONVariant, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     goal = relationship("UserGoal", back_populates="checkins")
 
+    # On PostgreSQL the table is range-partitioned by month on date (see migration
+    # 5cc7af065373), with a physical primary key of (id, date), so as for session
+    # exercises, id is unique only by coming from its sequence.
+    __table_args__ = (
+        # One check-in per goal per day; the conflict target for idempotent writes
+        # and the index for per-goal reads
+        UniqueConstraint("goal_id", "date", name="uq_goal_checkin_daily"),
+        # Date range scans; check-ins are written in date order
+        Index("ix_goal_checkins_date_brin", "date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+
 
 class Discipline(Base):
     __tablename__ = "disciplines"
@@ -282,7 +443,7 @@ class Discipline(Base):
     slug = Column(String(100), nullable=False, unique=True, index=True)
     name = Column(String(200), nullable=False)
     category = Column(SQLEnum(DisciplineCategory), nullable=False, default=DisciplineCategory.TRAINING)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
 
 class ActivityDefinition(Base):
@@ -293,8 +454,8 @@ class ActivityDefinition(Base):
     category = Column(SQLEnum(ActivityCategory), nullable=False, index=True)
     discipline_id = Column(Integer, ForeignKey("disciplines.id"), nullable=True, index=True)
     default_metric_type = Column(SQLEnum(MetricType), nullable=True)
-    default_equipment_tags = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    default_equipment_tags = Column(JSONVariant, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     discipline = relationship("Discipline")
     activity_instances = relationship("ActivityInstance", back_populates="activity_definition")
@@ -304,25 +465,36 @@ class ActivityInstance(Base):
     __tablename__ = "activity_instances"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    planned_session_id = Column(Integer, ForeignKey("sessions.id"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    planned_session_id = Column(Integer, ForeignKey("sessions.id", ondelete="SET NULL"), nullable=True, index=True)
     source = Column(SQLEnum(ActivitySource), nullable=False, index=True)
 
     activity_definition_id = Column(Integer, ForeignKey("activity_definitions.id"), nullable=True, index=True)
-    performed_start = Column(DateTime, nullable=True, index=True)
+    performed_start = Column(DateTime, nullable=True)
     performed_end = Column(DateTime, nullable=True)
     duration_seconds = Column(Integer, nullable=True)
 
     notes = Column(Text, nullable=True)
-    perceived_difficulty = Column(Integer, nullable=True)
-    enjoyment_rating = Column(Integer, nullable=True)
+    perceived_difficulty = Column(SmallInteger, nullable=True)
+    enjoyment_rating = Column(SmallInteger, nullable=True)
     visibility = Column(SQLEnum(Visibility), default=Visibility.PRIVATE, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     activity_definition = relationship("ActivityDefinition", back_populates="activity_instances")
     user = relationship("User", back_populates="activity_instances")
 
+    __table_args__ = (
+        # Activities are recorded roughly in time order, so a BRIN index serves
+        # time-window scans on PostgreSQL at a fraction of a B-tree's size
+        Index(
+            "ix_activity_instances_performed_start_brin",
+            "performed_start",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
 
 class ActivityMuscleMap(Base):
     __tablename__ = "activity_muscle_map"
@@ -332,26 +504,35 @@ class ActivityMuscleMap(Base):
     muscle_id = Column(Integer, ForeignKey("muscles.id"), nullable=False, index=True)
     magnitude = Column(Float, nullable=False, default=1.0)
     cns_impact = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
 
 class UserFatigueState(Base):
     __tablename__ = "user_fatigue_state"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     date = Column(Date, nullable=False, index=True)
     muscle_id = Column(Integer, ForeignKey("muscles.id"), nullable=False, index=True)
     fatigue_score = Column(Float, nullable=False)
     computed_from = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+
+    # On PostgreSQL, triggers on activity_instances and activity_muscle_map keep each
+    # (user, day, muscle) row at the sum of its activities' mapped magnitudes as
+    # activities and mappings are inserted, edited or deleted (see migration 81903643ec0c)
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", "muscle_id", name="uq_user_fatigue_state"),
+    )
 
 
 class ActivityInstanceLink(Base):
     __tablename__ = "activity_instance_links"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    activity_instance_id = Column(Integer, ForeignKey("activity_instances.id"), nullable=False, index=True)
+    activity_instance_id = Column(
+        Integer, ForeignKey("activity_instances.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     external_activity_record_id = Column(Integer, ForeignKey("external_activity_records.id"), nullable=True, index=True)
-    workout_log_id = Column(Integer, ForeignKey("workout_logs.id"), nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    workout_log_id = Column(Integer, ForeignKey("workout_logs.id", ondelete="SET NULL"), nullable=True, index=True)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
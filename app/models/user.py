@@ -1,10 +1,10 @@
 """User and user configuration models."""
-from datetime import datetime
-from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Enum as SQLEnum, Text
-from sqlalchemy import Date, DateTime, Float, JSON
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Date, DateTime, Float, Index
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.types import JSONVariant, SmallIntEnum, StringEnum, utcnow
 from app.models.enums import (
     ExperienceLevel,
     PersonaTone,
@@ -29,37 +29,57 @@ class User(Base):
     
     # Experience and defaults
     experience_level = Column(
-        SQLEnum(ExperienceLevel),
+        StringEnum(ExperienceLevel),
         nullable=False,
         default=ExperienceLevel.INTERMEDIATE
     )
     
     # Global persona settings
     persona_tone = Column(
-        SQLEnum(PersonaTone),
+        StringEnum(PersonaTone),
         nullable=False,
         default=PersonaTone.SUPPORTIVE
     )
     persona_aggression = Column(
-        SQLEnum(PersonaAggression),
+        SmallIntEnum(PersonaAggression),
         nullable=False,
         default=PersonaAggression.BALANCED
     )
     
     # Relationships
-    movement_rules = relationship("UserMovementRule", back_populates="user", cascade="all, delete-orphan")
-    enjoyable_activities = relationship("UserEnjoyableActivity", back_populates="user", cascade="all, delete-orphan")
-    programs = relationship("Program", back_populates="user", cascade="all, delete-orphan")
-    workout_logs = relationship("WorkoutLog", back_populates="user", cascade="all, delete-orphan")
-    soreness_logs = relationship("SorenessLog", back_populates="user", cascade="all, delete-orphan")
-    recovery_signals = relationship("RecoverySignal", back_populates="user", cascade="all, delete-orphan")
-    settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    conversation_threads = relationship("ConversationThread", back_populates="user", cascade="all, delete-orphan")
-    profile = relationship("UserProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    biometrics_history = relationship("UserBiometricHistory", back_populates="user", cascade="all, delete-orphan")
-    macro_cycles = relationship("MacroCycle", back_populates="user", cascade="all, delete-orphan")
-    goals = relationship("UserGoal", back_populates="user", cascade="all, delete-orphan")
-    activity_instances = relationship("ActivityInstance", back_populates="user", cascade="all, delete-orphan")
+    # Child rows are removed by ON DELETE CASCADE; passive_deletes skips loading them first.
+    # Configuration is loaded lazily; queries that read it add selectinload()/joinedload().
+    movement_rules = relationship(
+        "UserMovementRule", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    enjoyable_activities = relationship(
+        "UserEnjoyableActivity", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    programs = relationship("Program", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    workout_logs = relationship("WorkoutLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    soreness_logs = relationship(
+        "SorenessLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    recovery_signals = relationship(
+        "RecoverySignal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    settings = relationship(
+        "UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
+    conversation_threads = relationship(
+        "ConversationThread", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    profile = relationship(
+        "UserProfile", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
+    biometrics_history = relationship(
+        "UserBiometricHistory", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    macro_cycles = relationship("MacroCycle", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    goals = relationship("UserGoal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    activity_instances = relationship(
+        "ActivityInstance", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<User(id={self.id}, name='{self.name}')>"
@@ -70,11 +90,11 @@ class UserMovementRule(Base):
     __tablename__ = "user_movement_rules"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     movement_id = Column(Integer, ForeignKey("movements.id"), nullable=False, index=True)
     
-    rule_type = Column(SQLEnum(MovementRuleType), nullable=False)
-    cadence = Column(SQLEnum(RuleCadence), nullable=False, default=RuleCadence.PER_MICROCYCLE)
+    rule_type = Column(StringEnum(MovementRuleType), nullable=False)
+    cadence = Column(StringEnum(RuleCadence), nullable=False, default=RuleCadence.PER_MICROCYCLE)
     notes = Column(Text, nullable=True)
     
     # Relationships
@@ -90,9 +110,9 @@ class UserEnjoyableActivity(Base):
     __tablename__ = "user_enjoyable_activities"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
-    activity_type = Column(SQLEnum(EnjoyableActivity), nullable=False)
+    activity_type = Column(StringEnum(EnjoyableActivity), nullable=False)
     custom_name = Column(String(100), nullable=True)  # For "other" activities
     recommend_every_days = Column(Integer, nullable=False, default=28)
     enabled = Column(Boolean, default=True)
@@ -110,11 +130,11 @@ class UserSettings(Base):
     __tablename__ = "user_settings"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
     
     # e1RM calculation preference
     active_e1rm_formula = Column(
-        SQLEnum(E1RMFormula),
+        StringEnum(E1RMFormula),
         nullable=False,
         default=E1RMFormula.EPLEY
     )
@@ -132,22 +152,22 @@ class UserSettings(Base):
 class UserProfile(Base):
     __tablename__ = "user_profiles"
 
-    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     date_of_birth = Column(Date, nullable=True)
-    sex = Column(SQLEnum(Sex), nullable=True)
+    sex = Column(StringEnum(Sex), nullable=True)
     height_cm = Column(Integer, nullable=True)
     
     # Advanced Preferences
-    discipline_preferences = Column(JSON, nullable=True)  # {"mobility": 5, "calisthenics": 3, ...}
-    discipline_experience = Column(JSON, nullable=True)  # {"mobility": "intermediate", "crossfit": "beginner"}
-    scheduling_preferences = Column(JSON, nullable=True)  # {"mix_disciplines": true, "cardio_preference": "finisher"}
+    discipline_preferences = Column(JSONVariant, nullable=True)  # {"mobility": 5, "calisthenics": 3, ...}
+    discipline_experience = Column(JSONVariant, nullable=True)  # {"mobility": "intermediate", "crossfit": "beginner"}
+    scheduling_preferences = Column(JSONVariant, nullable=True)  # {"mix_disciplines": true, "cardio_preference": "finisher"}
 
     # Long Term Goals
     long_term_goal_category = Column(String(50), nullable=True)
     long_term_goal_description = Column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     user = relationship("User", back_populates="profile")
 
@@ -156,14 +176,21 @@ class UserBiometricHistory(Base):
     __tablename__ = "user_biometrics_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
-    date = Column(Date, nullable=False, index=True)
-    metric_type = Column(SQLEnum(BiometricMetricType), nullable=False, index=True)
+    date = Column(Date, nullable=False)
+    metric_type = Column(StringEnum(BiometricMetricType), nullable=False)
     value = Column(Float, nullable=False)
-    source = Column(SQLEnum(DataSource), nullable=False, default=DataSource.MANUAL)
+    source = Column(StringEnum(DataSource), nullable=False, default=DataSource.MANUAL)
     external_reference = Column(String(255), nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     user = relationship("User", back_populates="biometrics_history")
+
+    # History is read per user over time, for one metric or all of them; both
+    # indexes lead with user_id, which also serves the foreign key
+    __table_args__ = (
+        Index("ix_user_biometrics_history_user_metric_date", "user_id", "metric_type", "date"),
+        Index("ix_user_biometrics_history_user_date", "user_id", "date"),
+    )
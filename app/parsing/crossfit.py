@@ -1,18 +1,169 @@
 import re
 import json
-from typing import Any, Dict, List, Optional, Set, Tuple
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Below this many workouts parse_many stays in-process; worker start-up would dominate
+PARALLEL_MIN_WORKOUTS = 500
+
+# Patterns are compiled once at import; flags are baked in so per-line calls skip
+# re's pattern-cache lookup.
+
+# Workout structure
+_PAT_ROUNDS = re.compile(r'^(\d+)\s+rounds\b', re.IGNORECASE)
+_PAT_ROUNDS_LINE = re.compile(r'^(\d+)\s+rounds', re.MULTILINE)
+_PAT_TIME_CAP = re.compile(r'in (\d+)\s*[- ]?(minute|min)')
+_PAT_INTERVAL = re.compile(r'on a (\d+)\s*[- ]?(second|minute|sec|min)')
+_PAT_JUNK_ONCLOCK = re.compile(r'on a \d+\s*[- ]?(second|seconds|minute|minutes|min|sec|secs)\s+clock')
+
+# Metrics and their removal from the movement name
+_PAT_DIST = re.compile(r'(\d+(?:,\d+)?)\s*[- ]?\b(meter|meters|m|ft|foot|feet|km|row|run|swim|yard|yards)\b', re.IGNORECASE)
+_PAT_DIST_STRIP = re.compile(r'\d+(?:,\d+)?\s*[- ]?\b(meter|meters|m|ft|foot|feet|km|yard|yards)\b[- ]?', re.IGNORECASE)
+_PAT_TIME = re.compile(r'(\d+)\s*[- ]?\b(minute|minutes|min|mins|second|seconds|sec|secs|s)\b', re.IGNORECASE)
+_PAT_TIME_STRIP = re.compile(r'\d+\s*[- ]?\b(minute|minutes|min|mins|second|seconds|sec|secs|s)\b[- ]?', re.IGNORECASE)
+_PAT_CAL = re.compile(r'(\d+)(?:/(\d+))?\s*[- ]?(calorie|cal|cals)', re.IGNORECASE)
+_PAT_CAL_STRIP = re.compile(r'(\d+)(?:/(\d+))?\s*[- ]+(calorie|cal|cals)', re.IGNORECASE)
+_PAT_REPS = re.compile(r'^(\d+)\s*[- ]*\s*')
+_PAT_LADDER = re.compile(r'^(\d+(?:-\d+)+)\s+')
+
+# Closed vocabularies shared by every parsed line (metric_type, rx_weight unit)
+_M_REPS, _M_TIME, _M_DIST, _M_CAL, _M_UNK = map(sys.intern, ('reps', 'time', 'distance', 'calories', 'unknown'))
+_U_LB, _U_KG = map(sys.intern, ('lb', 'kg'))
+
+# Rx weights
+_PAT_GENDER_FM = re.compile(r'[♀|Women]\s*(\d+)\s*[- ]?(lb|kg).*?[♂|Men]\s*(\d+)\s*[- ]?(lb|kg)', re.IGNORECASE)
+_PAT_GENDER_MF = re.compile(r'[♂|Men]\s*(\d+)\s*[- ]?(lb|kg).*?[♀|Women]\s*(\d+)\s*[- ]?(lb|kg)', re.IGNORECASE)
+_PAT_FEMALE_LABEL = re.compile(r'[♀|Women]', re.IGNORECASE)
+_PAT_FEMALE = re.compile(r'[♀|Women]\s*(\d+)\s*[- ]?(lb|kg)', re.IGNORECASE)
+_PAT_MALE = re.compile(r'[♂|Men]\s*(\d+)\s*[- ]?(lb|kg)', re.IGNORECASE)
+_PAT_PARENS = re.compile(r'\((\d+)/(\d+)\s*(lb|kg|lbs)?\)')
+_PAT_SINGLE_AT = re.compile(r'[@\(]\s*(\d+)\s*(lb|kg|lbs)', re.IGNORECASE)
+# Weight clauses removed from the name in one pass: parenthesized notes, "@ ..." clauses
+# and (for gender-labelled weights) the labelled weights themselves
+_PAT_RX_STRIP = re.compile(r'\(.*?\)|@[^,]+')
+_PAT_RX_GENDER_STRIP = re.compile(r'\(.*?\)|@[^,]+|[♀♂|Women|Men]\s*\d+\s*[- ]?(?:lb|kg)', re.IGNORECASE)
+
+# Movement name cleanup
+_PAT_DASHES_WS = re.compile(r'[-–—\s]+')
+# A leading "max reps" and/or "max", and unit words anywhere
+_PAT_NAME_STRIP = re.compile(r'^(?:max\s+reps?\s*(?:max\s+)?|max\s+)|\b(?:reps|rep|calories|cal)\b', re.IGNORECASE)
+_PAT_NORMALIZE = re.compile(r'[^a-z0-9\s]')
+_PAT_DIGIT = re.compile(r'\d')
+# str.translate equivalent of _PAT_NORMALIZE for ASCII text: deletes every ASCII
+# character that is not a lowercase letter, digit or whitespace
+_NORMALIZE_ASCII_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isspace() or 'a' <= chr(i) <= 'z' or '0' <= chr(i) <= '9')
+}
+
+# Joins movement names into one searchable string; never survives _normalize
+_MOVEMENT_SEP = '\x00'
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of words with shared prefixes factored out.
+    
+    re walks the resulting trie once per text position instead of trying every
+    word, so a search costs O(len(text)) rather than O(len(text) * len(words)).
+    Longer words are preferred where one is a prefix of another.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end of word
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Lowercase and strip everything but letters, digits and whitespace."""
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_NORMALIZE_ASCII_TABLE).strip()
+    # Gender symbols, dashes, accents, etc.
+    return _PAT_NORMALIZE.sub('', text).strip()
+
+
+@dataclass(slots=True)
+class ParsedExercise:
+    """One parsed workout line; field order is the order of to_dict() keys."""
+    original: str
+    movement: str = ""
+    movement_id: Optional[int] = None  # To be filled by caller or fuzzy matcher
+    is_new: bool = True
+    sets: Optional[int] = None
+    reps: Optional[int] = None
+    duration_seconds: Optional[int] = None
+    distance_meters: Optional[int] = None
+    rx_weight: Optional[Dict[str, Any]] = None  # {"male": float | None, "female": float | None, "unit": "lb" | "kg"}
+    metric_type: str = _M_UNK  # "reps" | "time" | "distance" | "calories" | "unknown"
+    notes: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow, unlike dataclasses.asdict: rx_weight is passed through, not deep-copied
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class CrossFitParser:
     """
     Parser for CrossFit workout text into structured ExerciseBlocks.
     """
     
-    def __init__(self, existing_movements: Set[str]):
+    def __init__(self, existing_movements: Iterable[str]):
         """
         Args:
-            existing_movements: Set of known movement names (lowercase) for fuzzy matching.
+            existing_movements: Known movement names (lowercase) for fuzzy matching.
+                Copied into a frozenset, so later changes to the caller's collection
+                do not affect this parser.
         """
-        self.existing_movements = existing_movements
+        self.existing_movements = frozenset(existing_movements)
+        # Fuzzy-match indexes. "movement in candidate": one regex over all names.
+        # "candidate in movement": one str.find over all names joined shortest-first,
+        # with each name's start offset to map a hit back to its name.
+        names = sorted((m for m in self.existing_movements if m), key=lambda m: (len(m), m))
+        self._movement_pattern = re.compile(_trie_pattern(names)) if names else None
+        self._movement_names = names
+        self._movement_haystack = _MOVEMENT_SEP.join(names)
+        self._movement_offsets = []
+        offset = 0
+        for name in names:
+            self._movement_offsets.append(offset)
+            offset += len(name) + len(_MOVEMENT_SEP)
+
+    def parse_many(self, raw_texts: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse many workouts; results are in input order.
+        
+        Regex matching holds the GIL, so large batches are spread across worker
+        processes rather than threads. Batches smaller than PARALLEL_MIN_WORKOUTS
+        (or workers=1) are parsed in-process.
+        
+        Args:
+            raw_texts: Raw workout texts
+            workers: Worker processes (default: one per CPU)
+        """
+        if workers == 1 or len(raw_texts) < PARALLEL_MIN_WORKOUTS:
+            return [self.parse_workout(text) for text in raw_texts]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse_workout, raw_texts, chunksize=32))
 
     def parse_workout(self, raw_text: str) -> Dict[str, Any]:
         """
@@ -45,7 +196,7 @@ class CrossFitParser:
             if not line:
                 continue
             
-            rounds_match = re.match(r'^(\d+)\s+rounds\b', line, re.IGNORECASE)
+            rounds_match = _PAT_ROUNDS.match(line)
             if rounds_match:
                 if metadata.get("rounds") is None:
                     metadata["rounds"] = int(rounds_match.group(1))
@@ -63,7 +214,7 @@ class CrossFitParser:
         exercises = self._merge_orphan_weights(exercises)
                 
         return {
-            "exercises": exercises,
+            "exercises": [exercise.to_dict() for exercise in exercises],
             **metadata
         }
 
@@ -83,21 +234,21 @@ class CrossFitParser:
         if "amrap" in text_lower or "complete as many rounds" in text_lower:
             meta["circuit_type"] = "AMRAP"
             # Look for time cap "in 20 minutes"
-            time_match = re.search(r'in (\d+)\s*[- ]?(minute|min)', text_lower)
+            time_match = _PAT_TIME_CAP.search(text_lower)
             if time_match:
                 meta["time_cap"] = f"{time_match.group(1)} min"
                 
         elif "emom" in text_lower or "every minute" in text_lower or "on a" in text_lower and "clock" in text_lower:
             meta["circuit_type"] = "EMOM"
             # Look for interval "On a 90-second clock"
-            interval_match = re.search(r'on a (\d+)\s*[- ]?(second|minute|sec|min)', text_lower)
+            interval_match = _PAT_INTERVAL.search(text_lower)
             if interval_match:
                 meta["interval_notes"] = f"Interval: {interval_match.group(1)} {interval_match.group(2)}"
                 
         elif "rounds for time" in text_lower or "rounds of" in text_lower:
             meta["circuit_type"] = "Rounds For Time"
             # Look for rounds "3 rounds for time"
-            rounds_match = re.search(r'^(\d+)\s+rounds', text_lower, re.MULTILINE)
+            rounds_match = _PAT_ROUNDS_LINE.search(text_lower)
             if rounds_match:
                 meta["rounds"] = int(rounds_match.group(1))
                 
@@ -107,7 +258,7 @@ class CrossFitParser:
         return meta
 
 
-    def _merge_orphan_weights(self, exercises: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _merge_orphan_weights(self, exercises: List[ParsedExercise]) -> List[ParsedExercise]:
         """
         Merge exercises that are just weight specifications into the previous valid exercise.
         """
@@ -118,9 +269,9 @@ class CrossFitParser:
         for ex in exercises:
             # Check if this is a weight-only line (has weight, no metrics, generic name)
             is_weight_line = (
-                ex['rx_weight'] is not None 
-                and ex['metric_type'] == 'unknown'
-                and (not ex['movement'] or len(ex['movement']) < 20) # arbitrary length check for "dumbbells" etc
+                ex.rx_weight is not None 
+                and ex.metric_type == _M_UNK
+                and (not ex.movement or len(ex.movement) < 20) # arbitrary length check for "dumbbells" etc
             )
             
             if is_weight_line and merged:
@@ -128,11 +279,11 @@ class CrossFitParser:
                 target = None
                 
                 # 1. Look for matching equipment name backwards
-                if ex['movement']:
-                    equip_keyword = ex['movement'].lower().replace('s', '') # simple singularize
+                if ex.movement:
+                    equip_keyword = ex.movement.lower().replace('s', '') # simple singularize
                     for i in range(len(merged) - 1, -1, -1):
                         cand = merged[i]
-                        if equip_keyword in cand['movement'].lower() or equip_keyword in (cand.get('original') or '').lower():
+                        if equip_keyword in cand.movement.lower() or equip_keyword in (cand.original or '').lower():
                             target = cand
                             break
                 
@@ -141,15 +292,15 @@ class CrossFitParser:
                     target = merged[-1]
                 
                 # Merge logic
-                if target['rx_weight'] is None:
-                    target['rx_weight'] = ex['rx_weight']
+                if target.rx_weight is None:
+                    target.rx_weight = ex.rx_weight
                     # Append original text to notes for audit
-                    old_notes = target['notes'] or ""
-                    target['notes'] = (old_notes + f" ({ex['original']})").strip()
-                elif target['rx_weight'] and ex['rx_weight']:
+                    old_notes = target.notes or ""
+                    target.notes = (old_notes + f" ({ex.original})").strip()
+                elif target.rx_weight and ex.rx_weight:
                     # If target already has weight (e.g. from Female line), and this is Male line, merge them
-                    t_w = target['rx_weight']
-                    s_w = ex['rx_weight']
+                    t_w = target.rx_weight
+                    s_w = ex.rx_weight
                     
                     if s_w['male'] and not t_w['male']:
                         t_w['male'] = s_w['male']
@@ -157,9 +308,9 @@ class CrossFitParser:
                         t_w['female'] = s_w['female']
                     
                     # Update notes too
-                    old_notes = target['notes'] or ""
-                    if ex['original'] not in old_notes:
-                        target['notes'] = (old_notes + f" ({ex['original']})").strip()
+                    old_notes = target.notes or ""
+                    if ex.original not in old_notes:
+                        target.notes = (old_notes + f" ({ex.original})").strip()
                         
                 continue # Skip adding this weight-line to merged list
                 
@@ -179,7 +330,7 @@ class CrossFitParser:
         if line_lower.startswith("complete as many rounds"):
             return True
         
-        if re.match(r'on a \d+\s*[- ]?(second|seconds|minute|minutes|min|sec|secs)\s+clock', line_lower):
+        if _PAT_JUNK_ONCLOCK.match(line_lower):
             return True
             
         if len(line) < 3:
@@ -198,44 +349,52 @@ class CrossFitParser:
         # For now, we'll rely on line-parsing, but this is a placeholder if we need global context.
         return {}
 
-    def _parse_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_line(self, line: str) -> Optional[ParsedExercise]:
         """
-        Parse a single line into an exercise structure.
-        Schema:
-        {
-            "original": str,
-            "movement": str,
-            "movement_id": int | None,  # To be filled by caller or fuzzy matcher
-            "is_new": bool,
-            "sets": int | None,
-            "reps": int | None,
-            "duration_seconds": int | None,
-            "distance_meters": int | None,
-            "rx_weight": { "male": float | None, "female": float | None, "unit": "lb" | "kg" } | None,
-            "metric_type": "reps" | "time" | "distance" | "calories" | "unknown",
-            "notes": str | None
-        }
+        Parse a single line into an exercise structure (see ParsedExercise).
         """
-        # Initialize result
-        result = {
-            "original": line,
-            "movement": "",
-            "movement_id": None,
-            "is_new": True,
-            "sets": None,
-            "reps": None,
-            "duration_seconds": None,
-            "distance_meters": None,
-            "rx_weight": None,
-            "metric_type": "unknown",
-            "notes": None
-        }
+        result = ParsedExercise(original=line)
 
         clean_line = line
+        # Every metric and weight pattern needs a digit; plain movement lines skip them all
+        if _PAT_DIGIT.search(line):
+            clean_line = self._extract_quantities(line, result)
+
+        name = clean_line.strip()
+        name = _PAT_DASHES_WS.sub(' ', name) # dashes to space, collapse whitespace
+        name = _PAT_NAME_STRIP.sub('', name).strip()
+        
+        result.movement = name
+        
+        matched_id, matched_name = self._fuzzy_match_movement(name)
+        if matched_id:
+            result.movement_id = matched_id
+            result.movement = matched_name # Use canonical name
+            result.is_new = False
+        else:
+            result.is_new = True
         
-        dist_match = re.search(r'(\d+(?:,\d+)?)\s*[- ]?\b(meter|meters|m|ft|foot|feet|km|row|run|swim|yard|yards)\b', clean_line, re.IGNORECASE)
+        line_lower = line.lower()
+        if line_lower.startswith("max-reps") or line_lower.startswith("max reps") or line_lower.startswith("max-") or line_lower.startswith("max "):
+            result.metric_type = _M_REPS
+            if result.reps is None:
+                result.reps = 999
+            if result.notes:
+                if "max" not in result.notes.lower():
+                    result.notes = (result.notes + " max").strip()
+            else:
+                result.notes = "max"
+        
+        return result
+
+    def _extract_quantities(self, line: str, result: ParsedExercise) -> str:
+        """
+        Fill metrics and Rx weight on result from line.
+        Returns the line with those parts stripped, for movement name matching.
+        """
+        clean_line = line
         
-        detached_match = re.search(r'^(\d+)-\s+([A-Za-z]+)', clean_line)
+        dist_match = _PAT_DIST.search(clean_line)
         
         if dist_match:
             val_str = dist_match.group(1).replace(',', '')
@@ -243,151 +402,121 @@ class CrossFitParser:
             val = float(val_str)
             
             if 'km' in unit:
-                result['distance_meters'] = int(val * 1000)
+                result.distance_meters = int(val * 1000)
             elif 'ft' in unit or 'foot' in unit or 'feet' in unit:
-                result['distance_meters'] = int(val * 0.3048)
+                result.distance_meters = int(val * 0.3048)
             elif 'yard' in unit:
-                 result['distance_meters'] = int(val * 0.9144)
+                 result.distance_meters = int(val * 0.9144)
             else:
-                result['distance_meters'] = int(val)
+                result.distance_meters = int(val)
             
-            result['metric_type'] = 'distance'
+            result.metric_type = _M_DIST
             # Strip the whole matched pattern including trailing hyphens
-            clean_line = re.sub(r'\d+(?:,\d+)?\s*[- ]?\b(meter|meters|m|ft|foot|feet|km|yard|yards)\b[- ]?', '', clean_line, flags=re.IGNORECASE)
+            clean_line = _PAT_DIST_STRIP.sub('', clean_line)
 
-        time_match = re.search(r'(\d+)\s*[- ]?\b(minute|minutes|min|mins|second|seconds|sec|secs|s)\b', clean_line, re.IGNORECASE)
+        time_match = _PAT_TIME.search(clean_line)
         if time_match:
             val = int(time_match.group(1))
             unit = time_match.group(2).lower()
             if 'min' in unit:
-                result['duration_seconds'] = val * 60
+                result.duration_seconds = val * 60
             else:
-                result['duration_seconds'] = val
-            result['metric_type'] = 'time'
-            clean_line = re.sub(r'\d+\s*[- ]?\b(minute|minutes|min|mins|second|seconds|sec|secs|s)\b[- ]?', '', clean_line, flags=re.IGNORECASE)
+                result.duration_seconds = val
+            result.metric_type = _M_TIME
+            clean_line = _PAT_TIME_STRIP.sub('', clean_line)
 
-        cal_match = re.search(r'(\d+)(?:/(\d+))?\s*[- ]?(calorie|cal|cals)', clean_line, re.IGNORECASE)
+        cal_match = _PAT_CAL.search(clean_line)
         if cal_match:
             m_cals = int(cal_match.group(1))
             f_cals = int(cal_match.group(2)) if cal_match.group(2) else None
             
-            result['reps'] = m_cals
-            result['metric_type'] = 'calories'
-            result['notes'] = f"Calories: M {m_cals}" + (f" / F {f_cals}" if f_cals else "")
+            result.reps = m_cals
+            result.metric_type = _M_CAL
+            result.notes = f"Calories: M {m_cals}" + (f" / F {f_cals}" if f_cals else "")
             
             # Fix: regex to capture trailing hyphen before "calorie"
-            clean_line = re.sub(r'(\d+)(?:/(\d+))?\s*[- ]+(calorie|cal|cals)', '', clean_line, flags=re.IGNORECASE)
+            clean_line = _PAT_CAL_STRIP.sub('', clean_line)
 
-        if result['metric_type'] == 'unknown':
-            reps_match = re.search(r'^(\d+)\s*[- ]*\s*', clean_line)
-            ladder_match = re.search(r'^(\d+(?:-\d+)+)\s+', clean_line)
+        if result.metric_type == _M_UNK:
+            reps_match = _PAT_REPS.search(clean_line)
+            ladder_match = _PAT_LADDER.search(clean_line)
             
             if ladder_match:
-                result['notes'] = f"Rep scheme: {ladder_match.group(1)}"
-                result['metric_type'] = 'reps'
-                clean_line = re.sub(r'^(\d+(?:-\d+)+)\s+', '', clean_line)
+                result.notes = f"Rep scheme: {ladder_match.group(1)}"
+                result.metric_type = _M_REPS
+                clean_line = _PAT_LADDER.sub('', clean_line)
             elif reps_match:
-                result['reps'] = int(reps_match.group(1))
-                result['metric_type'] = 'reps'
+                result.reps = int(reps_match.group(1))
+                result.metric_type = _M_REPS
                 # Strip number and potential trailing hyphen/space
-                clean_line = re.sub(r'^(\d+)\s*[- ]*\s*', '', clean_line)
+                clean_line = _PAT_REPS.sub('', clean_line)
 
 
-        weight_data = {"male": None, "female": None, "unit": "lb"}
+        weight_data = {"male": None, "female": None, "unit": _U_LB}
         found_weight = False
         
         # Gender symbol pattern - Combined
-        gender_match = re.search(r'[♀|Women]\s*(\d+)\s*[- ]?(lb|kg).*?[♂|Men]\s*(\d+)\s*[- ]?(lb|kg)', line, re.IGNORECASE)
+        gender_match = _PAT_GENDER_FM.search(line)
         if not gender_match:
-             gender_match = re.search(r'[♂|Men]\s*(\d+)\s*[- ]?(lb|kg).*?[♀|Women]\s*(\d+)\s*[- ]?(lb|kg)', line, re.IGNORECASE)
+             gender_match = _PAT_GENDER_MF.search(line)
         
         if gender_match:
              # Try to determine which group is which based on label proximity
              full_match = gender_match.group(0)
-             if re.match(r'[♀|Women]', full_match, re.IGNORECASE):
+             if _PAT_FEMALE_LABEL.match(full_match):
                  weight_data["female"] = float(gender_match.group(1))
                  weight_data["male"] = float(gender_match.group(3))
-                 weight_data["unit"] = 'kg' if 'kg' in gender_match.group(2).lower() else 'lb'
+                 weight_data["unit"] = _U_KG if 'kg' in gender_match.group(2).lower() else _U_LB
              else:
                  weight_data["male"] = float(gender_match.group(1))
                  weight_data["female"] = float(gender_match.group(3))
-                 weight_data["unit"] = 'kg' if 'kg' in gender_match.group(2).lower() else 'lb'
+                 weight_data["unit"] = _U_KG if 'kg' in gender_match.group(2).lower() else _U_LB
              found_weight = True 
         else:
             # Try single gender patterns
-            female_match = re.search(r'[♀|Women]\s*(\d+)\s*[- ]?(lb|kg)', line, re.IGNORECASE)
-            male_match = re.search(r'[♂|Men]\s*(\d+)\s*[- ]?(lb|kg)', line, re.IGNORECASE)
+            female_match = _PAT_FEMALE.search(line)
+            male_match = _PAT_MALE.search(line)
             
             if female_match:
                 weight_data["female"] = float(female_match.group(1))
-                weight_data["unit"] = 'kg' if 'kg' in female_match.group(2).lower() else 'lb'
+                weight_data["unit"] = _U_KG if 'kg' in female_match.group(2).lower() else _U_LB
                 found_weight = True
             
             if male_match:
                 weight_data["male"] = float(male_match.group(1))
-                weight_data["unit"] = 'kg' if 'kg' in male_match.group(2).lower() else 'lb'
+                weight_data["unit"] = _U_KG if 'kg' in male_match.group(2).lower() else _U_LB
                 found_weight = True
 
         if found_weight:
-            result['rx_weight'] = weight_data
-            # Remove weight info from clean_line for name matching
-            clean_line = re.sub(r'\(.*?\)', '', clean_line)
-            clean_line = re.sub(r'@[^,]+', '', clean_line)
-            # Remove gender patterns
-            clean_line = re.sub(r'[♀♂|Women|Men]\s*\d+\s*[- ]?(lb|kg)', '', clean_line, flags=re.IGNORECASE)
+            result.rx_weight = weight_data
+            # Remove weight info and gender patterns from clean_line for name matching
+            clean_line = _PAT_RX_GENDER_STRIP.sub('', clean_line)
         
-        parens_match = re.search(r'\((\d+)/(\d+)\s*(lb|kg|lbs)?\)', line)
+        parens_match = _PAT_PARENS.search(line)
         if parens_match:
             weight_data["male"] = float(parens_match.group(1))
             weight_data["female"] = float(parens_match.group(2))
             if parens_match.group(3):
-                weight_data["unit"] = 'kg' if 'kg' in parens_match.group(3).lower() else 'lb'
+                weight_data["unit"] = _U_KG if 'kg' in parens_match.group(3).lower() else _U_LB
             found_weight = True
             
         if not found_weight:
-            single_match = re.search(r'[@\(]\s*(\d+)\s*(lb|kg|lbs)', line, re.IGNORECASE)
+            single_match = _PAT_SINGLE_AT.search(line)
             if single_match:
                 weight_data["male"] = float(single_match.group(1)) # Assume single is M or universal
-                weight_data["unit"] = 'kg' if 'kg' in single_match.group(2).lower() else 'lb'
+                weight_data["unit"] = _U_KG if 'kg' in single_match.group(2).lower() else _U_LB
                 found_weight = True
 
         if found_weight:
-            result['rx_weight'] = weight_data
+            result.rx_weight = weight_data
             # Remove weight info from clean_line for name matching
-            clean_line = re.sub(r'\(.*?\)', '', clean_line)
-            clean_line = re.sub(r'@[^,]+', '', clean_line)
+            clean_line = _PAT_RX_STRIP.sub('', clean_line)
 
-        name = clean_line.strip()
-        name = re.sub(r'[-–—]', ' ', name) # dash to space
-        name = re.sub(r'\s+', ' ', name)
-        name = re.sub(r'^max[-\s]+reps?\s*', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'^max\s+', '', name, flags=re.IGNORECASE)
-        
-        name = re.sub(r'\b(reps|rep|calories|cal)\b', '', name, flags=re.IGNORECASE).strip()
-        
-        result['movement'] = name
-        
-        matched_id, matched_name = self._fuzzy_match_movement(name)
-        if matched_id:
-            result['movement_id'] = matched_id
-            result['movement'] = matched_name # Use canonical name
-            result['is_new'] = False
-        else:
-            result['is_new'] = True
-        
-        line_lower = line.lower()
-        if line_lower.startswith("max-reps") or line_lower.startswith("max reps") or line_lower.startswith("max-") or line_lower.startswith("max "):
-            result['metric_type'] = 'reps'
-            if result['reps'] is None:
-                result['reps'] = 999
-            if result['notes']:
-                if "max" not in result['notes'].lower():
-                    result['notes'] = (result['notes'] + " max").strip()
-            else:
-                result['notes'] = "max"
-        
-        return result
+        return clean_line
 
+    # Movement phrases repeat heavily across workouts. Keyed on (self, candidate);
+    # safe because existing_movements is frozen at __init__.
+    @lru_cache(maxsize=4096)
     def _fuzzy_match_movement(self, candidate: str) -> Tuple[Optional[int], str]:
         """
         Match candidate string against existing movement set.
@@ -402,14 +531,23 @@ class CrossFitParser:
         if candidate_norm in self.existing_movements:
             return (None, candidate_norm) # ID would be looked up later
             
-        # Try "contains"
-        for exist in self.existing_movements:
-            if exist in candidate_norm or candidate_norm in exist:
-                # Basic safety: don't match "press" to "bench press" too eagerly
-                # But for now, simple is better than nothing
-                return (None, exist)
+        # Try "contains": a known movement inside the candidate...
+        # Basic safety: don't match "press" to "bench press" too eagerly
+        # But for now, simple is better than nothing
+        if self._movement_pattern is not None:
+            inner = self._movement_pattern.search(candidate_norm)
+            if inner:
+                return (None, inner.group(0))
+        
+        # ...or the shortest known movement containing the candidate. An empty
+        # candidate is "found" at offset 0 of any haystack, even an empty one
+        if not candidate_norm or not self._movement_names:
+            return (None, candidate)
+        pos = self._movement_haystack.find(candidate_norm)
+        if pos != -1:
+            return (None, self._movement_names[bisect_right(self._movement_offsets, pos) - 1])
                 
         return (None, candidate)
 
     def _normalize(self, text: str) -> str:
-        return re.sub(r'[^a-z0-9\s]', '', text.lower()).strip()
+        return _normalize_text(text)
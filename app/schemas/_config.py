@@ -0,0 +1,9 @@
+"""Shared pydantic configuration for request schemas."""
+from pydantic import ConfigDict
+
+# Leaf request models (a goal, a set, a block) are built many times per request body
+# and never mutated afterwards. Core schemas are built on first use, not at import.
+LEAF_INPUT_CONFIG = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+# Request models with validators keep the defaults apart from the deferred build
+VALIDATED_INPUT_CONFIG = ConfigDict(defer_build=True)
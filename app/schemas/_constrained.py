@@ -0,0 +1,51 @@
+"""
+Field types shared by the API schemas.
+
+A range used by several fields is declared once here, so every model reuses the
+same constraint instead of repeating an inline Field(ge=..., le=...).
+"""
+from datetime import date, timedelta
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, Field, SkipValidation
+
+# Subjective 1-5 / 1-10 scales (soreness, enjoyment, energy, stress, difficulty)
+Rating1to5 = Annotated[int, Field(ge=1, le=5)]
+Rating1to10 = Annotated[int, Field(ge=1, le=10)]
+
+# Ten-dollar-method weight: a goal's or discipline's share of 10 points
+TenPointWeight = Annotated[int, Field(ge=0, le=10)]
+
+# Set effort
+RPE = Annotated[float, Field(ge=1, le=10)]
+RIR = Annotated[int, Field(ge=0, le=10)]
+
+SleepHours = Annotated[float, Field(ge=0, le=24)]
+Percent = Annotated[float, Field(ge=0, le=100)]
+
+# How often an enjoyable activity is suggested
+RecommendEveryDays = Annotated[int, Field(ge=7, le=90)]
+
+
+def latest_loggable_date() -> date:
+    """
+    Latest day a log or check-in may be dated: tomorrow, so a client ahead of the
+    server's timezone can still log its today. Monthly-partitioned tables only have
+    partitions for the next few months.
+    """
+    return date.today() + timedelta(days=1)
+
+
+def _not_after_tomorrow(value: date) -> date:
+    if value > latest_loggable_date():
+        raise ValueError("Date cannot be in the future")
+    return value
+
+
+# The day a log is for
+LogDate = Annotated[date, AfterValidator(_not_after_tomorrow)]
+
+
+# A JSON object read back from a JSON column on the response path. The database
+# already holds valid JSON, so it is passed through instead of re-validated.
+StoredJSON = SkipValidation[dict[str, Any]]
@@ -5,6 +5,8 @@ from typing import Literal
 from pydantic import BaseModel, Field
 
 from app.models.enums import PersonaTone, PersonaAggression, SessionType
+from app.schemas._config import LEAF_INPUT_CONFIG
+from app.schemas._constrained import Rating1to5, Rating1to10, SleepHours, StoredJSON
 from app.schemas.program import ExerciseBlock, FinisherBlock, SessionResponse
 
 
@@ -28,16 +30,20 @@ class DailyPlanResponse(BaseModel):
 
 class SorenessInput(BaseModel):
     """Soreness input for adaptation."""
+    model_config = LEAF_INPUT_CONFIG
+
     body_part: str
-    level: int = Field(ge=1, le=5)  # 1=none, 5=severe
+    level: Rating1to5  # 1=none, 5=severe
 
 
 class RecoveryInput(BaseModel):
     """Recovery signals for adaptation."""
+    model_config = LEAF_INPUT_CONFIG
+
     sleep_quality: Literal["poor", "fair", "good", "excellent"] | None = None
-    sleep_hours: float | None = Field(default=None, ge=0, le=24)
-    energy_level: int | None = Field(default=None, ge=1, le=10)
-    stress_level: int | None = Field(default=None, ge=1, le=10)
+    sleep_hours: SleepHours | None = None
+    energy_level: Rating1to10 | None = None
+    stress_level: Rating1to10 | None = None
     notes: str | None = None
 
 
@@ -103,7 +109,7 @@ class ConversationTurnResponse(BaseModel):
     turn_number: int
     role: str
     content: str
-    structured_response: dict | None = None
+    structured_response: StoredJSON | None = None
 
 
 class ConversationThreadResponse(BaseModel):
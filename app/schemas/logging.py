@@ -2,21 +2,28 @@
 from datetime import date as DateType, datetime as DatetimeType
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveFloat, PositiveInt
 
 from app.models.enums import E1RMFormula, MovementPattern, RecoverySource
+from app.models.logging import NOTES_MAX_LENGTH
+from app.schemas._config import LEAF_INPUT_CONFIG
+from app.schemas._constrained import (
+    RPE, RIR, LogDate, Percent, Rating1to5, Rating1to10, SleepHours, StoredJSON
+)
 
 
 # ============== Top Set Schemas ==============
 
 class TopSetCreate(BaseModel):
     """Top set log creation schema."""
+    model_config = LEAF_INPUT_CONFIG
+
     movement_id: int
-    weight: float = Field(gt=0)
-    reps: int = Field(ge=1)
-    rpe: float | None = Field(default=None, ge=1, le=10)
-    rir: int | None = Field(default=None, ge=0, le=10)
-    avg_rest_seconds: int | None = Field(default=None, ge=0)
+    weight: PositiveFloat
+    reps: PositiveInt
+    rpe: RPE | None = None
+    rir: RIR | None = None
+    avg_rest_seconds: NonNegativeInt | None = None
 
 
 class TopSetResponse(BaseModel):
@@ -44,14 +51,14 @@ class TopSetResponse(BaseModel):
 class WorkoutLogCreate(BaseModel):
     """Workout log creation schema."""
     session_id: int | None = None
-    log_date: DateType | None = None
+    log_date: LogDate | None = None
     completed: bool = True
     top_sets: list[TopSetCreate] | None = None
-    notes: str | None = None
-    perceived_difficulty: int | None = Field(default=None, ge=1, le=10)
-    enjoyment_rating: int | None = Field(default=None, ge=1, le=5)
+    notes: str | None = Field(default=None, max_length=NOTES_MAX_LENGTH)
+    perceived_difficulty: Rating1to10 | None = None
+    enjoyment_rating: Rating1to5 | None = None
     feedback_tags: list[str] | None = None
-    actual_duration_minutes: int | None = Field(default=None, ge=0)
+    actual_duration_minutes: NonNegativeInt | None = None
 
 
 class WorkoutLogResponse(BaseModel):
@@ -92,10 +99,12 @@ class WorkoutLogSummary(BaseModel):
 
 class SorenessLogCreate(BaseModel):
     """Soreness log creation schema."""
+    model_config = LEAF_INPUT_CONFIG
+
     log_date: DateType | None = None
     body_part: str
-    soreness_1_5: int = Field(ge=1, le=5)
-    notes: str | None = None
+    soreness_1_5: Rating1to5
+    notes: str | None = Field(default=None, max_length=NOTES_MAX_LENGTH)
 
 
 class SorenessLogResponse(BaseModel):
@@ -118,16 +127,18 @@ class SorenessLogResponse(BaseModel):
 
 class RecoverySignalCreate(BaseModel):
     """Recovery signal creation schema."""
+    model_config = LEAF_INPUT_CONFIG
+
     log_date: DateType | None = None
     session_id: int | None = None
     source: RecoverySource = RecoverySource.MANUAL
     hrv: float | None = None
     resting_hr: int | None = Field(default=None, ge=20, le=200)
-    sleep_score: float | None = Field(default=None, ge=0, le=100)
-    sleep_hours: float | None = Field(default=None, ge=0, le=24)
-    readiness: float | None = Field(default=None, ge=0, le=100)
+    sleep_score: Percent | None = None
+    sleep_hours: SleepHours | None = None
+    readiness: Percent | None = None
     raw_payload: dict | None = None
-    notes: str | None = None
+    notes: str | None = Field(default=None, max_length=NOTES_MAX_LENGTH)
 
 
 class RecoverySignalResponse(BaseModel):
@@ -142,7 +153,7 @@ class RecoverySignalResponse(BaseModel):
     sleep_score: float | None = None
     sleep_hours: float | None = None
     readiness: float | None = None
-    raw_payload: dict | None = None
+    raw_payload: StoredJSON | None = None
     notes: str | None = None
     created_at: DatetimeType | None = None
     
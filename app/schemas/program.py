@@ -1,6 +1,6 @@
 """Pydantic schemas for program-related API endpoints."""
 from datetime import date as DateType, datetime as DatetimeType
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -13,24 +13,32 @@ from app.models.enums import (
     MicrocycleStatus,
     SessionType,
 )
+from app.schemas._config import LEAF_INPUT_CONFIG, VALIDATED_INPUT_CONFIG
+from app.schemas._constrained import RecommendEveryDays, StoredJSON, TenPointWeight
 
 
 # ============== Program Schemas ==============
 
 class GoalWeight(BaseModel):
     """Single goal with its weight."""
+    model_config = LEAF_INPUT_CONFIG
+
     goal: Goal
-    weight: int = Field(ge=0, le=10)
+    weight: TenPointWeight
 
 
 class DisciplineWeight(BaseModel):
     """Single discipline/training style with its weight."""
+    model_config = LEAF_INPUT_CONFIG
+
     discipline: str  # e.g., "bodybuilding", "powerlifting", "crossfit"
-    weight: int = Field(ge=0, le=10)
+    weight: TenPointWeight
 
 
 class HybridDayDefinition(BaseModel):
     """Day definition for hybrid splits."""
+    model_config = LEAF_INPUT_CONFIG
+
     day: int = Field(ge=1, le=10)
     session_type: SessionType
     focus: list[str] | None = None  # Movement patterns to focus on
@@ -39,12 +47,16 @@ class HybridDayDefinition(BaseModel):
 
 class HybridBlockComposition(BaseModel):
     """Block composition for hybrid splits."""
+    model_config = LEAF_INPUT_CONFIG
+
     blocks: list[str]  # e.g., ["ppl_block", "ppl_block", "cardio_block", "rest_block"]
 
 
 class HybridDefinition(BaseModel):
     """Hybrid split definition - either day-by-day or block composition."""
-    mode: str = Field(pattern="^(day_by_day|block_composition)$")
+    model_config = VALIDATED_INPUT_CONFIG
+
+    mode: Literal["day_by_day", "block_composition"]
     days: list[HybridDayDefinition] | None = None
     composition: HybridBlockComposition | None = None
     
@@ -59,21 +71,27 @@ class HybridDefinition(BaseModel):
 
 class MovementRuleCreate(BaseModel):
     """Movement rule for program creation."""
+    model_config = LEAF_INPUT_CONFIG
+
     movement_id: int
-    rule_type: str = Field(pattern="^(hard_no|hard_yes|preferred)$")
-    cadence: str = Field(default="per_microcycle", pattern="^(per_microcycle|weekly|biweekly)$")
+    rule_type: Literal["hard_no", "hard_yes", "preferred"]
+    cadence: Literal["per_microcycle", "weekly", "biweekly"] = "per_microcycle"
     notes: str | None = None
 
 
 class EnjoyableActivityCreate(BaseModel):
     """Enjoyable activity for program creation."""
+    model_config = LEAF_INPUT_CONFIG
+
     activity_type: str
     custom_name: str | None = None
-    recommend_every_days: int = Field(default=28, ge=7, le=90)
+    recommend_every_days: RecommendEveryDays = 28
 
 
 class ProgramCreate(BaseModel):
     """Schema for creating a new program."""
+    model_config = VALIDATED_INPUT_CONFIG
+
     name: str | None = None
     # Goals (1-3 required, weights must sum to 10)
     goals: list[GoalWeight] = Field(min_length=1, max_length=3)
@@ -107,12 +125,14 @@ class ProgramCreate(BaseModel):
     @field_validator("goals")
     @classmethod
     def validate_goals_sum(cls, v):
-        total = sum(g.weight for g in v)
+        # min_length/max_length already held, so there are 1-3 goals: check them
+        # straight-line instead of via generators and a set
+        n = len(v)
+        total = v[0].weight + (v[1].weight if n > 1 else 0) + (v[2].weight if n > 2 else 0)
         if total != 10:
             raise ValueError(f"Goal weights must sum to 10, got {total}")
         # Check for unique goals
-        goal_names = [g.goal for g in v]
-        if len(goal_names) != len(set(goal_names)):
+        if (n > 1 and v[0].goal == v[1].goal) or (n > 2 and v[2].goal in (v[0].goal, v[1].goal)):
             raise ValueError("Goals must be unique")
         return v
     
@@ -144,7 +164,7 @@ class ProgramResponse(BaseModel):
     goal_weight_3: int
     split_template: SplitTemplate
     progression_style: ProgressionStyle
-    hybrid_definition: dict | None = None
+    hybrid_definition: StoredJSON | None = None
     deload_every_n_microcycles: int
     persona_tone: PersonaTone | None = None
     persona_aggression: PersonaAggression | None = None
@@ -180,6 +200,8 @@ class MicrocycleWithSessionsResponse(MicrocycleResponse):
 
 class ExerciseBlock(BaseModel):
     """Exercise within a session block."""
+    model_config = LEAF_INPUT_CONFIG
+
     movement: str
     movement_id: int | None = None
     sets: int | None = None  # Optional for cooldown/stretches that only have duration
@@ -195,6 +217,8 @@ class ExerciseBlock(BaseModel):
 
 class FinisherBlock(BaseModel):
     """Finisher block schema."""
+    model_config = LEAF_INPUT_CONFIG
+
     type: str  # EMOM, AMRAP, circuit, etc.
     duration_minutes: int | None = None
     rounds: int | None = None
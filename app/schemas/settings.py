@@ -17,6 +17,7 @@ from app.models.enums import (
     MetricType,
     Sex,
 )
+from app.schemas._constrained import RecommendEveryDays
 
 
 # ============== User Settings Schemas ==============
@@ -128,7 +129,7 @@ class MovementCreate(BaseModel):
     cns_load: CNSLoad | None = CNSLoad.MODERATE
     metric_type: MetricType | None = MetricType.REPS
     compound: bool = True
-    description: str | None = None
+    description: str | None = Field(default=None, max_length=4096)
 
 
 class MovementListResponse(BaseModel):
@@ -246,12 +247,12 @@ class EnjoyableActivityCreate(BaseModel):
     """Create enjoyable activity."""
     activity_type: str
     custom_name: str | None = None
-    recommend_every_days: int | None = Field(default=28, ge=7, le=90)
+    recommend_every_days: RecommendEveryDays | None = 28
     notes: str | None = None
 
 
 class EnjoyableActivityUpdate(BaseModel):
     """Update enjoyable activity."""
-    recommend_every_days: int | None = Field(default=None, ge=7, le=90)
+    recommend_every_days: RecommendEveryDays | None = None
     enabled: bool | None = None
     notes: str | None = None
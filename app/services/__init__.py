@@ -5,6 +5,8 @@ from app.services.interference import InterferenceService, interference_service
 from app.services.program import ProgramService, program_service
 from app.services.deload import DeloadService, deload_service
 from app.services.adaptation import AdaptationService, adaptation_service
+from app.services.movement_tags import MovementTagService, movement_tag_service
+from app.services.users import UserService, user_service
 
 __all__ = [
     "MetricsService",
@@ -20,4 +22,8 @@ __all__ = [
     "deload_service",
     "AdaptationService",
     "adaptation_service",
+    "MovementTagService",
+    "movement_tag_service",
+    "UserService",
+    "user_service",
 ]
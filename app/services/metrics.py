@@ -2,12 +2,15 @@
 from datetime import date, timedelta
 from typing import Literal
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.queries import STREAM_BATCH_SIZE
+
 from app.models import (
     TopSetLog,
     PatternExposure,
+    WorkoutLog,
     Microcycle,
     MovementPattern,
     E1RMFormula,
@@ -93,6 +96,66 @@ class MetricsService:
         
         return MetricsService.calculate_e1rm(weight, effective_reps, formula)
     
+    async def recalculate_e1rm(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        formula: E1RMFormula,
+    ) -> int:
+        """
+        Recompute stored e1RM values for all of a user's top sets.
+        
+        Streams (id, weight, reps) in batches of STREAM_BATCH_SIZE and writes
+        each batch with one executemany UPDATE per table, so pattern exposures
+        derived from those top sets stay in sync and memory stays flat for long
+        histories. The caller commits.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            formula: Formula to apply
+            
+        Returns:
+            Number of top sets updated
+        """
+        result = await db.stream(
+            select(TopSetLog.id, TopSetLog.weight, TopSetLog.reps)
+            .join(WorkoutLog, TopSetLog.workout_log_id == WorkoutLog.id)
+            .where(WorkoutLog.user_id == user_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        calculate = self.calculate_e1rm
+        updated = 0
+        
+        async for batch in result.partitions():
+            e1rm_by_top_set = {
+                top_set_id: calculate(weight, reps, formula)
+                for top_set_id, weight, reps in batch
+            }
+            
+            await db.execute(
+                update(TopSetLog),
+                [
+                    {"id": top_set_id, "e1rm_value": e1rm, "e1rm_formula": formula.value}
+                    for top_set_id, e1rm in e1rm_by_top_set.items()
+                ],
+            )
+            
+            exposures = await db.execute(
+                select(PatternExposure.id, PatternExposure.source_top_set_log_id)
+                .where(PatternExposure.source_top_set_log_id.in_(e1rm_by_top_set))
+            )
+            exposure_updates = [
+                {"id": exposure_id, "e1rm_value": e1rm_by_top_set[top_set_id]}
+                for exposure_id, top_set_id in exposures.all()
+            ]
+            if exposure_updates:
+                await db.execute(update(PatternExposure), exposure_updates)
+            
+            updated += len(e1rm_by_top_set)
+        
+        return updated
+    
     async def get_pattern_exposures(
         self,
         db: AsyncSession,
@@ -0,0 +1,87 @@
+"""Movement tag service for the normalized equipment/discipline/tag link tables."""
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Movement,
+    Equipment,
+    Discipline,
+    Tag,
+    MovementEquipment,
+    MovementDiscipline,
+    MovementTag,
+)
+
+
+class MovementTagService:
+    """
+    Attaches equipment, discipline and general tags to movements.
+
+    Tag slugs are stored once in their lookup table and referenced by id from
+    the movement link tables; unknown slugs are created on first use.
+    """
+
+    async def resolve(
+        self,
+        db: AsyncSession,
+        model: type[Equipment] | type[Discipline] | type[Tag],
+        slugs: Iterable[str],
+    ) -> list:
+        """
+        Get or create lookup rows for the given slugs, preserving order.
+
+        New rows are added to the session but not flushed; autoflush makes them
+        visible to the next lookup in the same transaction.
+        """
+        ordered = list(dict.fromkeys(slug for slug in slugs if slug))
+        if not ordered:
+            return []
+
+        result = await db.execute(select(model).where(model.slug.in_(ordered)))
+        by_slug = {row.slug: row for row in result.scalars().all()}
+
+        for slug in ordered:
+            if slug not in by_slug:
+                # Discipline also carries a display name; other lookups are slug-only
+                row = model(slug=slug, name=slug) if model is Discipline else model(slug=slug)
+                db.add(row)
+                by_slug[slug] = row
+
+        return [by_slug[slug] for slug in ordered]
+
+    async def assign(
+        self,
+        db: AsyncSession,
+        movement: Movement,
+        equipment: Iterable[str] = (),
+        disciplines: Iterable[str] = (),
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Set the tag links of a new (not yet loaded from the database) movement.
+
+        Args:
+            db: Database session
+            movement: Movement being created
+            equipment: Equipment slugs; the first is the movement's default
+            disciplines: Discipline slugs
+            tags: General tag slugs
+        """
+        movement.equipment_links = [
+            MovementEquipment(equipment=row, position=position)
+            for position, row in enumerate(await self.resolve(db, Equipment, equipment))
+        ]
+        movement.discipline_links = [
+            MovementDiscipline(discipline=row, position=position)
+            for position, row in enumerate(await self.resolve(db, Discipline, disciplines))
+        ]
+        movement.tag_links = [
+            MovementTag(tag=row, position=position)
+            for position, row in enumerate(await self.resolve(db, Tag, tags))
+        ]
+
+
+# Singleton instance
+movement_tag_service = MovementTagService()
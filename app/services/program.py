@@ -12,9 +12,12 @@ Responsible for:
 from datetime import datetime, timedelta, date
 from typing import Optional, Dict, Any
 import logging
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import get_settings
+from app.db.bulk import bulk_copy
+from app.db.queries import active_microcycle_stmt, microcycle_sessions_stmt
 from app.models import (
     Program, Microcycle, Session, HeuristicConfig, User, Movement, UserProfile
 )
@@ -91,8 +94,11 @@ class ProgramService:
             if not is_valid:
                 raise ValueError(f"Goal validation failed: {warnings}")
         
-        # Fetch user profile for advanced preferences
-        user_profile = await db.get(UserProfile, user_id)
+        # Fetch user (for defaults) and profile (advanced preferences). The profile is
+        # queried explicitly: a User already in the identity map may not have it loaded,
+        # and a lazy load is not possible under AsyncSession.
+        user = await db.get(User, user_id)
+        user_profile = await db.scalar(select(UserProfile).where(UserProfile.user_id == user_id))
         discipline_prefs = user_profile.discipline_preferences if user_profile else None
         scheduling_prefs = user_profile.scheduling_preferences if user_profile else None
 
@@ -102,9 +108,6 @@ class ProgramService:
             discipline_prefs, scheduling_prefs
         )
         
-        # Get user for defaults
-        user = await db.get(User, user_id)
-        
         # Determine progression style if not provided
         progression_style = request.progression_style
         if not progression_style:
@@ -164,27 +167,36 @@ class ProgramService:
         current_date = start_date
         deload_frequency = request.deload_every_n_microcycles or 4
         
-        # Track active microcycle for session generation
-        active_microcycle = None
-        
+        # Build plain rows and write them with Core inserts: one multi-row
+        # INSERT ... RETURNING for microcycles, then one bulk batch of sessions.
+        # No ORM objects are constructed, so there is no unit-of-work overhead.
+        microcycles = []
         for mc_idx in range(microcycle_count):
             is_deload = ((mc_idx + 1) % deload_frequency == 0)
             
-            microcycle = await self._create_microcycle(
-                db,
+            microcycles.append(self._build_microcycle(
                 program_id=program.id,
                 mc_index=mc_idx,
                 start_date=current_date,
                 split_config=split_config,
                 is_deload=is_deload,
-            )
-            
-            # Keep reference to active (first) microcycle
-            if mc_idx == 0:
-                active_microcycle = microcycle
+            ))
             
             current_date += timedelta(days=days_per_cycle)
         
+        result = await db.execute(
+            insert(Microcycle).returning(Microcycle.id, sort_by_parameter_order=True),
+            microcycles,
+        )
+        microcycle_ids = result.scalars().all()
+        
+        session_rows = [
+            row
+            for microcycle_id, microcycle in zip(microcycle_ids, microcycles)
+            for row in self._build_session_rows(microcycle_id, microcycle["start_date"], split_config)
+        ]
+        await bulk_copy(db, Session.__table__, session_rows)
+        
         await db.commit()
         await db.refresh(program)
         return program
@@ -200,12 +212,7 @@ class ProgramService:
             if not program:
                 return
 
-            result = await db.execute(
-                select(Microcycle).where(
-                    Microcycle.program_id == program_id,
-                    Microcycle.status == MicrocycleStatus.ACTIVE,
-                )
-            )
+            result = await db.execute(active_microcycle_stmt(), {"program_id": program_id})
             microcycle = result.scalar_one_or_none()
             if not microcycle:
                 return
@@ -240,11 +247,15 @@ class ProgramService:
             
             # Get all sessions for this microcycle
             sessions_result = await db.execute(
-                select(Session).where(Session.microcycle_id == microcycle.id)
-                .order_by(Session.day_number)
+                microcycle_sessions_stmt(), {"microcycle_id": microcycle.id}
             )
             sessions = list(sessions_result.scalars().all())
         
+        if get_settings().batch_microcycle and await self._generate_microcycle_batched(
+            program_id, microcycle, sessions
+        ):
+            return
+        
         # Track used movements to ensure variety
         used_movements = set()
         used_movement_groups = {}  # Track usage count by substitution_group
@@ -262,11 +273,13 @@ class ProgramService:
                 continue
             
             try:
-                # Apply inter-session interference rules for main lift patterns
+                # Apply inter-session interference rules for main lift patterns;
+                # committed so generation reads the adjusted intent_tags
                 async with async_session_maker() as db:
                     session = await self._apply_pattern_interference_rules(
                         db, session, used_main_patterns, microcycle
                     )
+                    await db.commit()
             except Exception as e:
                 logger.error(
                     "Failed to apply pattern interference rules for session %s: %s",
@@ -320,50 +333,113 @@ class ProgramService:
             # Update previous volume for next iteration
             previous_day_volume = current_volume
             
-            # Track used movements and movement groups
-            if current_volume:
-                # Re-fetch session to get updated content
-                async with async_session_maker() as db:
-                    updated_session = await db.get(Session, session.id)
-                    if updated_session:
-                        # Track individual movements
-                        session_movements = []
-                        main_patterns_used = []
-                        accessory_movements_used = []
-                        
-                        if updated_session.main_json:
-                            for ex in updated_session.main_json:
-                                if ex.get("movement"):
-                                    session_movements.append(ex["movement"])
-                        if updated_session.accessory_json:
-                            for ex in updated_session.accessory_json:
-                                if ex.get("movement"):
-                                    session_movements.append(ex["movement"])
-                                    accessory_movements_used.append(ex["movement"])
-                        if updated_session.finisher_json:
-                            if updated_session.finisher_json.get("exercises"):
-                                for ex in updated_session.finisher_json["exercises"]:
-                                    if ex.get("movement"):
-                                        session_movements.append(ex["movement"])
-                                        # Treat finisher as accessory for interference
-                                        accessory_movements_used.append(ex["movement"])
-                        
-                        # Update tracking sets
-                        for movement_name in session_movements:
-                            used_movements.add(movement_name)
-                        
-                        # Track main lift patterns for this session
-                        if updated_session.intent_tags:
-                            main_patterns_used = updated_session.intent_tags[:2]
-                            used_main_patterns[session.day_number] = main_patterns_used
-                        
-                        # Track accessory movements for this session
-                        used_accessory_movements[session.day_number] = accessory_movements_used
-                        
-                        # Update movement group usage counts
-                        await self._update_movement_group_usage(
-                            db, session_movements, used_movement_groups
-                        )
+            # Track used movements and movement groups (re-fetch session to get updated content)
+            async with async_session_maker() as db:
+                updated_session = await db.get(Session, session.id)
+                if updated_session:
+                    await self._track_session_usage(
+                        db,
+                        updated_session,
+                        used_movements,
+                        used_movement_groups,
+                        used_main_patterns,
+                        used_accessory_movements,
+                    )
+    
+    async def _track_session_usage(
+        self,
+        db: AsyncSession,
+        session: Session,
+        used_movements: set[str],
+        used_movement_groups: dict[str, int],
+        used_main_patterns: dict[int, list[str]],
+        used_accessory_movements: dict[int, list[str]],
+    ) -> None:
+        """
+        Record a generated session's movements and patterns for the days after it.
+        
+        Args:
+            db: Database session
+            session: Session with generated content
+            used_movements: Movements used so far in this microcycle
+            used_movement_groups: Usage count by substitution_group
+            used_main_patterns: Day number -> main lift patterns
+            used_accessory_movements: Day number -> accessory (and finisher) movements
+        """
+        session_movements = []
+        accessory_movements_used = []
+        
+        if session.main_json:
+            for ex in session.main_json:
+                if ex.get("movement"):
+                    session_movements.append(ex["movement"])
+        if session.accessory_json:
+            for ex in session.accessory_json:
+                if ex.get("movement"):
+                    session_movements.append(ex["movement"])
+                    accessory_movements_used.append(ex["movement"])
+        if session.finisher_json:
+            if session.finisher_json.get("exercises"):
+                for ex in session.finisher_json["exercises"]:
+                    if ex.get("movement"):
+                        session_movements.append(ex["movement"])
+                        # Treat finisher as accessory for interference
+                        accessory_movements_used.append(ex["movement"])
+        
+        # Update tracking sets
+        used_movements.update(session_movements)
+        
+        # Track main lift patterns for this session
+        if session.intent_tags:
+            used_main_patterns[session.day_number] = session.intent_tags[:2]
+        
+        # Track accessory movements for this session
+        used_accessory_movements[session.day_number] = accessory_movements_used
+        
+        # Update movement group usage counts
+        await self._update_movement_group_usage(db, session_movements, used_movement_groups)
+    
+    async def _generate_microcycle_batched(
+        self,
+        program_id: int,
+        microcycle: Microcycle,
+        sessions: list[Session],
+    ) -> bool:
+        """
+        Generate all training sessions of a microcycle in one LLM call.
+        
+        Pattern interference rules only depend on intent_tags, so they are
+        resolved for every session up front, in day order with the same
+        used_main_patterns tracking as the per-day path. The adjusted tags are
+        stored in the same transaction as the generated content, so a failed
+        batch leaves the sessions untouched for the per-day fallback.
+        
+        Returns:
+            True if the microcycle was generated, False if the caller should
+            fall back to per-day generation
+        """
+        used_main_patterns: dict[int, list[str]] = {}
+        intent_tags: dict[int, list[str]] = {}
+        for session in sessions:
+            if session.session_type == SessionType.RECOVERY:
+                continue
+            tags = self._resolve_pattern_interference(session, used_main_patterns)
+            intent_tags[session.id] = tags
+            if tags:
+                used_main_patterns[session.day_number] = tags[:2]
+        
+        try:
+            await session_generator.populate_microcycle_by_id(
+                program_id, microcycle.id, list(intent_tags), intent_tags=intent_tags
+            )
+        except Exception as e:
+            logger.error(
+                "Batched generation failed for microcycle %s, falling back to per-day: %s",
+                microcycle.id,
+                e,
+            )
+            return False
+        return True
     
     async def _apply_pattern_interference_rules(
         self,
@@ -375,12 +451,6 @@ class ProgramService:
         """
         Apply inter-session interference rules for main lift patterns.
         
-        Rules:
-        1. No same main pattern on consecutive days (even with rest day between)
-        2. No same main pattern on back-to-back training days
-        3. Prioritize pattern diversity: squat -> hinge -> lunge rotation for lower body
-        4. Enforce minimum 2-day gap for same main pattern
-        
         Args:
             db: Database session
             session: Session to apply rules to
@@ -393,12 +463,39 @@ class ProgramService:
         if session.session_type == SessionType.RECOVERY:
             return session
         
+        new_patterns = self._resolve_pattern_interference(session, used_main_patterns)
+        if new_patterns != (session.intent_tags or []):
+            # Update session intent_tags
+            session.intent_tags = new_patterns
+            db.add(session)
+            await db.flush()
+        
+        return session
+    
+    def _resolve_pattern_interference(
+        self,
+        session: Session,
+        used_main_patterns: dict[int, list[str]],
+    ) -> list[str]:
+        """
+        Resolve a session's intent_tags under the main lift interference rules.
+        
+        Rules:
+        1. No same main pattern on consecutive days (even with rest day between)
+        2. No same main pattern on back-to-back training days
+        3. Prioritize pattern diversity: squat -> hinge -> lunge rotation for lower body
+        4. Enforce minimum 2-day gap for same main pattern
+        
+        Args:
+            session: Session whose intent_tags are checked (not modified)
+            used_main_patterns: Dict mapping day_number to list of main patterns used
+            
+        Returns:
+            The session's intent_tags with conflicting main patterns replaced
+        """
         current_day = session.day_number
         current_patterns = session.intent_tags or []
         
-        # Get all training days in this microcycle for context
-        training_days = sorted([day for day, patterns in used_main_patterns.items() if patterns])
-        
         # Define pattern alternatives for intelligent substitution
         pattern_alternatives = {
             # Lower body pattern rotation
@@ -436,12 +533,9 @@ class ProgramService:
                             f"with '{alternative}' due to interference rules"
                         )
             
-            # Update session intent_tags
-            session.intent_tags = new_patterns
-            db.add(session)
-            await db.flush()
+            return new_patterns
         
-        return session
+        return current_patterns
     
     def _has_pattern_conflict(
         self,
@@ -562,20 +656,18 @@ class ProgramService:
                 group = movement.substitution_group
                 used_movement_groups[group] = used_movement_groups.get(group, 0) + 1
     
-    async def _create_microcycle(
+    def _build_microcycle(
         self,
-        db: AsyncSession,
         program_id: int,
         mc_index: int,
         start_date: date,
         split_config: Dict[str, Any],
         is_deload: bool = False,
-    ) -> Microcycle:
+    ) -> Dict[str, Any]:
         """
-        Create a microcycle with sessions based on split template.
+        Build a microcycle row based on split template.
         
         Args:
-            db: Database session
             program_id: Parent program ID
             mc_index: Microcycle index (0-based)
             start_date: Microcycle start date
@@ -583,48 +675,55 @@ class ProgramService:
             is_deload: Whether this is a deload microcycle
         
         Returns:
-            Created Microcycle
+            Microcycle row dict for a Core insert (sessions are built by _build_session_rows)
         """
         days_per_cycle = split_config.get("days_per_cycle", 7)
-        structure = split_config.get("structure", [])
         
         # First microcycle is active, others are planned
         status = MicrocycleStatus.ACTIVE if mc_index == 0 else MicrocycleStatus.PLANNED
         
-        microcycle = Microcycle(
-            program_id=program_id,
-            sequence_number=mc_index + 1,  # 1-indexed
-            start_date=start_date,
-            length_days=days_per_cycle,
-            status=status,
-            is_deload=is_deload,
-        )
-        db.add(microcycle)
-        await db.flush()  # Get microcycle.id
+        return {
+            "program_id": program_id,
+            "sequence_number": mc_index + 1,  # 1-indexed
+            "start_date": start_date,
+            "length_days": days_per_cycle,
+            "status": status,
+            "is_deload": is_deload,
+        }
+    
+    def _build_session_rows(
+        self,
+        microcycle_id: int,
+        start_date: date,
+        split_config: Dict[str, Any],
+    ) -> list[Dict[str, Any]]:
+        """
+        Build session rows for an inserted microcycle from the split template structure.
         
-        # Create sessions from split template structure
-        for day_def in structure:
+        Args:
+            microcycle_id: Parent microcycle ID
+            start_date: Microcycle start date
+            split_config: Split template configuration from heuristics
+        
+        Returns:
+            Session row dicts for bulk_copy
+        """
+        rows = []
+        for day_def in split_config.get("structure", []):
             day_num = day_def.get("day", 1)
             day_type = day_def.get("type", "rest")
             focus_patterns = day_def.get("focus", [])
             
-            # Calculate session date
-            session_date = start_date + timedelta(days=day_num - 1)
-            
-            # Map day type to SessionType enum
-            session_type = self._map_day_type_to_session_type(day_type)
-            
             # Create session (even for rest days - they can have recovery activities)
-            session = Session(
-                microcycle_id=microcycle.id,
-                date=session_date,
-                day_number=day_num,
-                session_type=session_type,
-                intent_tags=focus_patterns,
-            )
-            db.add(session)
-        
-        return microcycle
+            rows.append({
+                "microcycle_id": microcycle_id,
+                "date": start_date + timedelta(days=day_num - 1),
+                "day_number": day_num,
+                "session_type": self._map_day_type_to_session_type(day_type),
+                "intent_tags": focus_patterns,
+            })
+        
+        return rows
     
     async def _load_split_template(
         self, db: AsyncSession, template: SplitTemplate, days_per_week: int,
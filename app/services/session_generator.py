@@ -12,19 +12,37 @@ import time
 from typing import Any
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import get_settings
+from app.db.bulk import bulk_copy
 from app.llm import get_llm_provider, LLMConfig, Message
-from app.llm.prompts import JEROME_SYSTEM_PROMPT, build_optimized_session_prompt
-from app.llm.ollama_provider import SESSION_PLAN_SCHEMA
-from app.models import Movement, Session, Program, Microcycle, User, UserMovementRule, UserProfile
-from app.models.enums import SessionType, MovementRuleType
+from app.llm.optimization import PromptCache
+from app.llm.prompts import (
+    JEROME_SYSTEM_PROMPT,
+    build_batched_microcycle_prompt,
+    build_optimized_session_prompt,
+)
+from app.llm.ollama_provider import MICROCYCLE_PLAN_SCHEMA, SESSION_PLAN_SCHEMA
+from app.models import (
+    Movement, Session, SessionExercise, Program, Microcycle, User, UserMovementRule, UserProfile
+)
+from app.models.enums import SessionType, MovementRuleType, ExerciseRole
+from app.services.time_estimation import time_estimation_service
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Session content block -> SessionExercise role
+EXERCISE_BLOCK_ROLES = {
+    "warmup": ExerciseRole.WARMUP,
+    "main": ExerciseRole.MAIN,
+    "accessory": ExerciseRole.ACCESSORY,
+    "finisher": ExerciseRole.FINISHER,
+    "cooldown": ExerciseRole.COOLDOWN,
+}
+
 
 class SessionGeneratorService:
     """
@@ -142,6 +160,41 @@ class SessionGeneratorService:
         )
         raise last_exception
     
+    async def _call_llm_cached(
+        self,
+        provider,
+        messages: list,
+        config,
+        session_id: int | None = None,
+        session_type: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Call LLM through the client-side response cache.
+        
+        The rendered prompt is deterministic in its inputs, so identical requests
+        (retries, UI refreshes, regeneration previews) reuse the parsed response
+        for PromptCache.RESPONSE_TTL_SECONDS instead of calling the provider again.
+        """
+        cache_key = PromptCache.response_key(
+            messages, config.model, config.temperature, config.max_tokens
+        )
+        cached = PromptCache.get_response(cache_key)
+        if cached is not None:
+            logger.info(
+                f"LLM response cache hit (session_id={session_id}, type={session_type})"
+            )
+            return cached
+        
+        content = await self._call_llm_with_retry(
+            provider,
+            messages,
+            config,
+            session_id=session_id,
+            session_type=session_type,
+        )
+        PromptCache.set_response(cache_key, content)
+        return content
+    
     async def generate_session_exercises(
         self,
         db: AsyncSession,
@@ -232,12 +285,13 @@ class SessionGeneratorService:
         )
         
         messages = [
-            Message(role="system", content=JEROME_SYSTEM_PROMPT),
+            # Static system prompt first so it forms a cacheable prefix
+            Message(role="system", content=JEROME_SYSTEM_PROMPT, cache_prefix=True),
             Message(role="user", content=user_prompt),
         ]
         
         try:
-            content = await self._call_llm_with_retry(
+            content = await self._call_llm_cached(
                 provider,
                 messages,
                 config,
@@ -245,25 +299,7 @@ class SessionGeneratorService:
                 session_type=session.session_type.value,
             )
             
-            # Validate and complete the session content
-            content = self._validate_and_complete_session(content, session.session_type)
-            
-            # OPTIMIZATION: Use pattern-based warmup/cooldown with flexibility
-            from app.llm.optimization import PromptCache
-            
-            # Enhance warmup with pattern-based suggestions if LLM didn't provide good warmup
-            if not content.get("warmup") or len(content.get("warmup", [])) < 2:
-                content["warmup"] = PromptCache.get_pattern_based_warmup(
-                    session.intent_tags or [], session.session_type
-                )
-            
-            # Enhance cooldown with pattern-based suggestions if LLM didn't provide good cooldown
-            if not content.get("cooldown") or len(content.get("cooldown", [])) < 2:
-                content["cooldown"] = PromptCache.get_pattern_based_cooldown(
-                    session.intent_tags or []
-                )
-            
-            return content
+            return self._finalize_session_content(content, session)
                 
         except Exception as e:
             # All retries exhausted or non-retryable error
@@ -278,6 +314,247 @@ class SessionGeneratorService:
                 used_movements=used_movements,
             )
     
+    def _finalize_session_content(
+        self, content: dict[str, Any], session: Session
+    ) -> dict[str, Any]:
+        """Validate LLM output and fill thin warmup/cooldown from session patterns."""
+        # Validate and complete the session content
+        content = self._validate_and_complete_session(content, session.session_type)
+        
+        # OPTIMIZATION: Use pattern-based warmup/cooldown with flexibility
+        # Enhance warmup with pattern-based suggestions if LLM didn't provide good warmup
+        if not content.get("warmup") or len(content.get("warmup", [])) < 2:
+            content["warmup"] = PromptCache.get_pattern_based_warmup(
+                session.intent_tags or [], session.session_type
+            )
+        
+        # Enhance cooldown with pattern-based suggestions if LLM didn't provide good cooldown
+        if not content.get("cooldown") or len(content.get("cooldown", [])) < 2:
+            content["cooldown"] = PromptCache.get_pattern_based_cooldown(
+                session.intent_tags or []
+            )
+        
+        return content
+    
+    def _apply_session_content(self, session: Session, content: dict[str, Any]) -> None:
+        """Copy generated blocks onto the session row."""
+        session.warmup_json = content.get("warmup")
+        session.main_json = content.get("main")
+        session.accessory_json = content.get("accessory")
+        session.finisher_json = content.get("finisher")
+        session.cooldown_json = content.get("cooldown")
+        # estimated_duration_minutes is generated by the database as the sum of these
+        breakdown = time_estimation_service.estimate_session_blocks(session)
+        session.warmup_duration_minutes = breakdown.warmup_minutes
+        session.main_duration_minutes = breakdown.main_minutes
+        session.accessory_duration_minutes = breakdown.accessory_minutes
+        session.finisher_duration_minutes = breakdown.finisher_minutes
+        session.cooldown_duration_minutes = breakdown.cooldown_minutes
+        session.coach_notes = content.get("reasoning")
+    
+    async def _write_session_exercises(
+        self,
+        db: AsyncSession,
+        contents: list[tuple[Session, dict[str, Any]]],
+    ) -> None:
+        """
+        Replace the SessionExercise rows of the given sessions with their generated blocks.
+        
+        Each block exercise becomes one row with role = block and order_in_session =
+        position within the block. Exercises whose movement is not in the library
+        have no movement_id and stay JSON-only.
+        
+        Args:
+            db: Database session
+            contents: (session, finalized content) pairs
+        """
+        exercises_by_session = {
+            session.id: [
+                (role, position, exercise)
+                for block, role in EXERCISE_BLOCK_ROLES.items()
+                for position, exercise in enumerate(self._block_exercises(content.get(block)))
+            ]
+            for session, content in contents
+        }
+        names = {
+            exercise.get("movement")
+            for exercises in exercises_by_session.values()
+            for _, _, exercise in exercises
+            if exercise.get("movement")
+        }
+        result = await db.execute(select(Movement.name, Movement.id).where(Movement.name.in_(names)))
+        movement_ids = dict(result.all())
+        
+        await db.execute(
+            delete(SessionExercise).where(SessionExercise.session_id.in_(exercises_by_session))
+        )
+        await bulk_copy(db, SessionExercise.__table__, [
+            self._session_exercise_row(session_id, movement_ids[exercise["movement"]], role, position, exercise)
+            for session_id, exercises in exercises_by_session.items()
+            for role, position, exercise in exercises
+            if exercise.get("movement") in movement_ids
+        ])
+    
+    def _session_exercise_row(
+        self,
+        session_id: int,
+        movement_id: int,
+        role: ExerciseRole,
+        position: int,
+        exercise: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Column values of the SessionExercise row for one generated block exercise."""
+        rep_range = (exercise.get("rep_range_min"), exercise.get("rep_range_max"))
+        if None not in rep_range:
+            # LLM output can list the bounds the wrong way round; valid_rep_range rejects that
+            rep_range = tuple(sorted(rep_range))
+        return {
+            "session_id": session_id,
+            "movement_id": movement_id,
+            "role": role,
+            "order_in_session": position,
+            "superset_group": None,
+            # Duration-only work (stretches, carries) is a single set
+            "target_sets": exercise.get("sets") or 1,
+            "target_rep_range_min": rep_range[0],
+            "target_rep_range_max": rep_range[1],
+            "target_rpe_tenths": SessionExercise.rpe_to_tenths(exercise.get("target_rpe")),
+            "target_rir": exercise.get("target_rir"),
+            "target_duration_seconds": exercise.get("duration_seconds"),
+            "default_rest_seconds": exercise.get("rest_seconds"),
+            "is_complex_lift": False,
+            "substitution_allowed": True,
+            "notes": exercise.get("notes"),
+        }
+    
+    def _block_exercises(self, block: Any) -> list[dict]:
+        """Exercises of a content block (finisher blocks nest them under "exercises")."""
+        if isinstance(block, dict):
+            return self._extract_finisher_exercises(block)
+        if isinstance(block, list):
+            return [exercise for exercise in block if isinstance(exercise, dict)]
+        return []
+    
+    async def populate_microcycle_by_id(
+        self,
+        program_id: int,
+        microcycle_id: int,
+        session_ids: list[int],
+        intent_tags: dict[int, list[str]] | None = None,
+    ) -> None:
+        """
+        Generate all given sessions of a microcycle with a single LLM call.
+        
+        The shared prefix (system prompt, program context, movement library) is
+        sent once instead of once per day. Sessions are populated in the order
+        given; accessories repeated from earlier sessions are replaced as in the
+        per-day path. Nothing is committed unless every session is generated.
+        
+        Args:
+            program_id: ID of parent program
+            microcycle_id: ID of parent microcycle
+            session_ids: Sessions to generate, in day order
+            intent_tags: Session ID -> intent_tags to store and generate with
+                (interference-adjusted by the caller)
+        
+        Raises:
+            ValueError: If the LLM does not return one session per request
+            Exception: Any LLM error after retries (callers fall back to per-day)
+        """
+        from app.db.database import async_session_maker
+        
+        if not session_ids:
+            return
+        
+        async with async_session_maker() as db:
+            program = await db.get(Program, program_id)
+            microcycle = await db.get(Microcycle, microcycle_id)
+            if not program or not microcycle:
+                return
+            
+            result = await db.execute(select(Session).where(Session.id.in_(session_ids)))
+            sessions_by_id = {s.id: s for s in result.scalars().all()}
+            sessions = [sessions_by_id[sid] for sid in session_ids if sid in sessions_by_id]
+            for session in sessions:
+                if intent_tags and session.id in intent_tags:
+                    session.intent_tags = intent_tags[session.id]
+            
+            movements_by_pattern = await self._load_movements_by_pattern(db)
+            movement_rules = await self._load_user_movement_rules(db, program.user_id)
+            user_profile = await db.get(UserProfile, program.user_id)
+            
+            program_dict = {
+                "goal_1": program.goal_1.value,
+                "goal_2": program.goal_2.value,
+                "goal_3": program.goal_3.value,
+                "goal_weight_1": program.goal_weight_1,
+                "goal_weight_2": program.goal_weight_2,
+                "goal_weight_3": program.goal_weight_3,
+                "split_template": program.split_template.value,
+                "days_per_week": program.days_per_week,
+            }
+            
+            user_prompt = build_batched_microcycle_prompt(
+                program=program_dict,
+                sessions=[
+                    {
+                        "session_type": s.session_type.value,
+                        "intent_tags": s.intent_tags or [],
+                        "day_number": s.day_number,
+                    }
+                    for s in sessions
+                ],
+                is_deload=microcycle.is_deload,
+                microcycle_number=microcycle.sequence_number,
+                movements_by_pattern=movements_by_pattern,
+                movement_rules=movement_rules,
+                discipline_preferences=user_profile.discipline_preferences if user_profile else None,
+                scheduling_preferences=user_profile.scheduling_preferences if user_profile else None,
+            )
+            
+            from app.llm.optimization import ModelOptimizer
+            optimized_model_config = ModelOptimizer.get_optimized_config("standard")
+            
+            provider = get_llm_provider()
+            config = LLMConfig(
+                model=settings.ollama_model,
+                temperature=optimized_model_config["temperature"],
+                max_tokens=optimized_model_config["max_tokens"] * len(sessions),
+                json_schema=MICROCYCLE_PLAN_SCHEMA,
+            )
+            messages = [
+                Message(role="system", content=JEROME_SYSTEM_PROMPT, cache_prefix=True),
+                Message(role="user", content=user_prompt),
+            ]
+            
+            content = await self._call_llm_cached(
+                provider,
+                messages,
+                config,
+                session_type=f"microcycle:{microcycle_id}",
+            )
+            generated = content.get("sessions") if isinstance(content, dict) else None
+            if not isinstance(generated, list) or len(generated) != len(sessions):
+                raise ValueError(
+                    f"Expected {len(sessions)} sessions from batched generation, "
+                    f"got {len(generated) if isinstance(generated, list) else 'none'}"
+                )
+            
+            used_accessory_movements: dict[int, list[str]] = {}
+            applied: list[tuple[Session, dict[str, Any]]] = []
+            for session, session_content in zip(sessions, generated):
+                session_content = self._finalize_session_content(session_content, session)
+                session_content = self._remove_previous_day_accessories(
+                    session_content, session, used_accessory_movements
+                )
+                self._apply_session_content(session, session_content)
+                db.add(session)
+                applied.append((session, session_content))
+                used_accessory_movements[session.day_number] = self._accessory_movements(session_content)
+            
+            await self._write_session_exercises(db, applied)
+            await db.commit()
+    
     async def populate_session_by_id(
         self,
         session_id: int,
@@ -365,27 +642,13 @@ class SessionGeneratorService:
             db, session, program, microcycle, used_movements, used_movement_groups, used_accessory_movements, fatigued_muscles
         )
         
-        if used_accessory_movements:
-            current_day = session.day_number
-            previous_days = [d for d in used_accessory_movements.keys() if d < current_day]
-            if previous_days:
-                last_day = max(previous_days)
-                previous_accessories = used_accessory_movements.get(last_day) or []
-                if previous_accessories:
-                    content = self._remove_cross_session_accessory_duplicates(
-                        content, set(previous_accessories), session.session_type
-                    )
+        content = self._remove_previous_day_accessories(content, session, used_accessory_movements)
         
         # Update session fields
-        session.warmup_json = content.get("warmup")
-        session.main_json = content.get("main")
-        session.accessory_json = content.get("accessory")
-        session.finisher_json = content.get("finisher")
-        session.cooldown_json = content.get("cooldown")
-        session.estimated_duration_minutes = content.get("estimated_duration_minutes", 60)
-        session.coach_notes = content.get("reasoning")
+        self._apply_session_content(session, content)
         db.add(session)
         await db.flush()
+        await self._write_session_exercises(db, [(session, content)])
         
         # Calculate volume for this session to pass to next day
         current_session_volume = {}
@@ -397,24 +660,28 @@ class SessionGeneratorService:
             all_movements.extend([(m["movement"], 1) for m in session.finisher_json["exercises"] if "movement" in m])
             
         if all_movements:
-            names = [m[0] for m in all_movements]
-            # Resolve muscles
-            result = await db.execute(select(Movement).where(Movement.name.in_(names)))
-            found_movements = {m.name: m for m in result.scalars().all()}
+            names = {m[0] for m in all_movements}
+            # Resolve muscles (only the columns needed, not full Movement rows)
+            result = await db.execute(
+                select(Movement.name, Movement.primary_muscle, Movement.secondary_muscles)
+                .where(Movement.name.in_(names))
+            )
+            muscles_by_name = {
+                name: (primary, secondary if isinstance(secondary, list) else [])
+                for name, primary, secondary in result.all()
+            }
             
             for name, weight in all_movements:
-                mov = found_movements.get(name)
-                if mov:
+                muscles = muscles_by_name.get(name)
+                if muscles:
+                    p_muscle, secs = muscles
                     # Credit primary muscle
-                    p_muscle = mov.primary_muscle
                     current_session_volume[p_muscle] = current_session_volume.get(p_muscle, 0) + weight
                     
                     # Credit secondary muscles (partial weight)
-                    if mov.secondary_muscles:
-                        # Handle JSON list
-                        secs = mov.secondary_muscles if isinstance(mov.secondary_muscles, list) else []
-                        for sec in secs:
-                            current_session_volume[sec] = current_session_volume.get(sec, 0) + (weight // 2)
+                    half = weight // 2
+                    for sec in secs:
+                        current_session_volume[sec] = current_session_volume.get(sec, 0) + half
                             
         return current_session_volume
     
@@ -849,6 +1116,44 @@ class SessionGeneratorService:
         
         return content
     
+    def _remove_previous_day_accessories(
+        self,
+        content: dict[str, Any],
+        session: Session,
+        used_accessory_movements: dict[int, list[str]] | None,
+    ) -> dict[str, Any]:
+        """
+        Replace accessories already used on an earlier day of the microcycle.
+        
+        Shared by the per-day and batched paths. Covers every earlier day, the
+        same set the session prompt tells the LLM to avoid.
+        
+        Args:
+            content: Finalized session content
+            session: Session the content is for
+            used_accessory_movements: Day number -> accessory (and finisher) movements
+        """
+        previous_accessories = {
+            movement
+            for day, movements in (used_accessory_movements or {}).items()
+            if day < session.day_number
+            for movement in movements
+        }
+        if not previous_accessories:
+            return content
+        return self._remove_cross_session_accessory_duplicates(
+            content, previous_accessories, session.session_type
+        )
+    
+    def _accessory_movements(self, content: dict[str, Any]) -> list[str]:
+        """Accessory movements of session content; finisher movements count as accessories."""
+        return [
+            ex["movement"]
+            for ex in self._block_exercises(content.get("accessory"))
+            + self._block_exercises(content.get("finisher"))
+            if ex.get("movement")
+        ]
+    
     def _create_replacement_exercise(
         self,
         original_exercise: dict,
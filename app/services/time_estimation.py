@@ -303,6 +303,50 @@ class TimeEstimationService:
             total_minutes=total
         )
 
+    def estimate_session_blocks(self, blocks: Any) -> SessionTimeBreakdown:
+        """
+        Estimate time for a session's content blocks.
+        
+        Args:
+            blocks: A Session row, or anything with warmup_json..cooldown_json
+        """
+        return self.estimate_session_time(
+            warmup=blocks.warmup_json,
+            main=blocks.main_json,
+            accessory=blocks.accessory_json,
+            finisher=blocks.finisher_json,
+            cooldown=blocks.cooldown_json,
+            intent="hypertrophy" # Default or derive from session type/program
+        )
+    
+    def session_durations(self, session: Any) -> dict[str, int | None]:
+        """
+        Duration fields for a session response.
+        
+        Uses the persisted component durations (estimated_duration_minutes is their
+        database-generated sum); sessions generated before durations were persisted
+        are estimated from their blocks in memory.
+        """
+        if session.estimated_duration_minutes:
+            return {
+                "estimated_duration_minutes": session.estimated_duration_minutes,
+                "warmup_duration_minutes": session.warmup_duration_minutes,
+                "main_duration_minutes": session.main_duration_minutes,
+                "accessory_duration_minutes": session.accessory_duration_minutes,
+                "finisher_duration_minutes": session.finisher_duration_minutes,
+                "cooldown_duration_minutes": session.cooldown_duration_minutes,
+            }
+        
+        breakdown = self.estimate_session_blocks(session)
+        return {
+            "estimated_duration_minutes": breakdown.total_minutes,
+            "warmup_duration_minutes": breakdown.warmup_minutes,
+            "main_duration_minutes": breakdown.main_minutes,
+            "accessory_duration_minutes": breakdown.accessory_minutes,
+            "finisher_duration_minutes": breakdown.finisher_minutes,
+            "cooldown_duration_minutes": breakdown.cooldown_minutes,
+        }
+
     async def estimate_session_duration(
         self,
         db: Any,
@@ -314,23 +358,14 @@ class TimeEstimationService:
         
         Returns dict matching SessionTimeBreakdown fields.
         """
-        from sqlalchemy import select
         from app.models.program import Session
         
-        result = await db.execute(select(Session).where(Session.id == session_id))
-        session = result.scalar_one_or_none()
+        session = await db.get(Session, session_id)
         
         if not session:
             return {"total_minutes": 0}
             
-        breakdown = self.estimate_session_time(
-            warmup=session.warmup_json,
-            main=session.main_json,
-            accessory=session.accessory_json,
-            finisher=session.finisher_json,
-            cooldown=session.cooldown_json,
-            intent="hypertrophy" # Default or derive from session type/program
-        )
+        breakdown = self.estimate_session_blocks(session)
         
         return {
             "total_minutes": breakdown.total_minutes,
@@ -353,16 +388,15 @@ class TimeEstimationService:
         """
         Estimate duration stats for a microcycle.
         """
-        from sqlalchemy import select
-        from app.models.program import Session
+        from app.db.queries import microcycle_sessions_stmt
         
-        result = await db.execute(select(Session).where(Session.microcycle_id == microcycle_id))
+        result = await db.execute(microcycle_sessions_stmt(), {"microcycle_id": microcycle_id})
         sessions = result.scalars().all()
         
-        total_minutes = 0
-        for session in sessions:
-            est = await self.estimate_session_duration(db, user_id, session.id)
-            total_minutes += est["total_minutes"]
+        # Sessions are already loaded; no per-session re-fetch
+        total_minutes = sum(
+            self.session_durations(session)["estimated_duration_minutes"] for session in sessions
+        )
             
         count = len(sessions)
         avg = total_minutes / count if count > 0 else 0
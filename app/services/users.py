@@ -0,0 +1,62 @@
+"""User service for account-level operations."""
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Movement,
+    User,
+    UserFatigueState,
+    ActivityInstanceLink,
+    ExternalProviderAccount,
+    ExternalIngestionRun,
+    ExternalActivityRecord,
+    ExternalMetricStream,
+)
+
+
+class UserService:
+    """Account-level operations on users."""
+
+    async def delete_user(self, db: AsyncSession, user_id: int) -> bool:
+        """
+        Delete a user and everything they own with a fixed number of statements.
+
+        Tables whose foreign keys cascade from users (settings, profile, rules,
+        programs and their hierarchy, logs, goals, ...) are emptied by the
+        database when the user row goes. The remaining user-owned tables are
+        cleared first with one set-based DELETE each, leaves before parents, so
+        no child row is loaded into the session. Custom movements are not
+        deleted, since other data may reference them; their Movement.user_id is
+        cleared so they no longer block the user row's deletion. The caller commits.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            True if the user existed and was deleted
+        """
+        external_records = select(ExternalActivityRecord.id).where(ExternalActivityRecord.user_id == user_id)
+
+        for statement in (
+            delete(UserFatigueState).where(UserFatigueState.user_id == user_id),
+            delete(ExternalMetricStream).where(
+                ExternalMetricStream.external_activity_record_id.in_(external_records)
+            ),
+            delete(ActivityInstanceLink).where(
+                ActivityInstanceLink.external_activity_record_id.in_(external_records)
+            ),
+            delete(ExternalActivityRecord).where(ExternalActivityRecord.user_id == user_id),
+            delete(ExternalIngestionRun).where(ExternalIngestionRun.user_id == user_id),
+            delete(ExternalProviderAccount).where(ExternalProviderAccount.user_id == user_id),
+            update(Movement).where(Movement.user_id == user_id).values(user_id=None),
+        ):
+            await db.execute(statement, execution_options={"synchronize_session": False})
+
+        # Default synchronization marks a User already loaded in the session as deleted
+        result = await db.execute(delete(User).where(User.id == user_id))
+        return result.rowcount > 0
+
+
+# Singleton instance
+user_service = UserService()
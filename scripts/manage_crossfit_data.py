@@ -127,6 +127,7 @@ def parse_workouts(html, existing_movements):
     
     circuits = []
     new_movement_candidates = set()
+    segments = []
     
     print(f"Found {len(headers)} potential workout segments.")
 
@@ -170,8 +171,12 @@ def parse_workouts(html, existing_movements):
         elif "tabata" in lower_w: ctype = "tabata"
         elif "chipper" in lower_w: ctype = "chipper"
 
-        # Parse Exercises
-        parsed_data = parser.parse_workout(workout_text)
+        segments.append((header_text, workout_text, stimulus_text, ctype))
+
+    # Parse Exercises (all workouts in one batch)
+    parsed_workouts = parser.parse_many([segment[1] for segment in segments])
+
+    for (header_text, workout_text, stimulus_text, ctype), parsed_data in zip(segments, parsed_workouts):
         exercises = parsed_data['exercises']
         
         if parsed_data['circuit_type'] != "unknown":
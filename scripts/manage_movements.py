@@ -18,6 +18,7 @@ sys.path.insert(0, os.getcwd())
 from app.config.settings import get_settings
 from app.db.database import async_session_maker
 from app.models.movement import Movement
+from app.services.movement_tags import movement_tag_service
 from app.models.enums import (
     MovementPattern,
     PrimaryMuscle,
@@ -342,12 +343,16 @@ async def run_ingest_exercemus(dry_run: bool = False, commit: bool = False):
                     is_complex_lift=cand.is_complex_lift,
                     is_unilateral=cand.is_unilateral,
                     metric_type=cand.metric_type,
-                    discipline_tags=cand.discipline_tags,
-                    equipment_tags=cand.equipment_tags,
                     description=cand.description,
                     coaching_cues=cand.coaching_cues,
                     substitution_group=cand.substitution_group,
                 )
+                await movement_tag_service.assign(
+                    session,
+                    movement,
+                    equipment=cand.equipment_tags,
+                    disciplines=cand.discipline_tags,
+                )
                 session.add(movement)
                 created_count += 1
             
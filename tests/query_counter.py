@@ -0,0 +1,33 @@
+"""
+Statement counting for tests that guard against N+1 regressions.
+
+Not a benchmark: it asserts the number of round trips an operation makes, so a
+relationship that quietly falls back to lazy loading fails the suite.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def count_queries(session: AsyncSession) -> Iterator[list[str]]:
+    """
+    Record every SQL statement sent by the session's engine inside the block.
+
+    Yields:
+        The statements executed so far, upper-cased and left-stripped
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().upper())
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,32 @@
+"""Tests for the pre-serialized response helpers."""
+
+import json
+from datetime import date
+from types import SimpleNamespace
+
+from app.api.responses import attr_loader, model_list_response
+from app.models.enums import MicrocycleStatus
+from app.schemas.program import MicrocycleResponse
+
+
+def test_attr_loader_maps_renamed_fields_and_keeps_defaults():
+    """Renamed attributes are copied, and fields the row lacks keep the model default."""
+    row = SimpleNamespace(
+        id=3,
+        program_id=1,
+        start_date=date(2026, 3, 2),
+        length_days=7,
+        sequence_number=2,
+        status=MicrocycleStatus.ACTIVE,
+    )
+    load = attr_loader(MicrocycleResponse, micro_start_date="start_date")
+
+    response = load(row)
+
+    assert response.micro_start_date == date(2026, 3, 2)
+    assert response.status is MicrocycleStatus.ACTIVE
+    assert response.is_deload is False  # Not on the row: model default
+
+    body = json.loads(model_list_response([response]).body)
+    assert body == [json.loads(response.model_dump_json())]
+    assert body[0]["micro_start_date"] == "2026-03-02"
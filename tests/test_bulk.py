@@ -0,0 +1,131 @@
+"""
+Unit tests for the bulk row writer.
+
+Tests the INSERT path on SQLite and the choice between INSERT and COPY on
+PostgreSQL, with a stand-in connection in place of asyncpg.
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from app.db.bulk import COPY_THRESHOLD, bulk_copy
+from app.models import SessionExercise
+from app.models.enums import ExerciseRole
+
+
+def _rows(count: int, session_id: int = 1, movement_id: int = 1) -> list[dict]:
+    return [
+        {
+            "session_id": session_id,
+            "movement_id": movement_id,
+            "role": ExerciseRole.ACCESSORY,
+            "order_in_session": position,
+            "target_sets": 3,
+            "target_rep_range_min": 8,
+            "target_rep_range_max": 12,
+            "is_complex_lift": False,
+            "substitution_allowed": True,
+            "notes": None,
+        }
+        for position in range(count)
+    ]
+
+
+class FakeDriverConnection:
+    """Records copy_records_to_table calls."""
+
+    def __init__(self):
+        self.copies: list[tuple[str, list[tuple], list[str]]] = []
+
+    async def copy_records_to_table(self, table_name, records, columns):
+        self.copies.append((table_name, records, columns))
+
+
+class FakeRawConnection:
+    def __init__(self):
+        self.driver_connection = FakeDriverConnection()
+
+
+class FakeConnection:
+    """PostgreSQL connection that records executed statements instead of running them."""
+
+    dialect = PGDialect_asyncpg()
+
+    def __init__(self):
+        self.raw = FakeRawConnection()
+        self.executed: list[tuple] = []
+
+    async def execute(self, statement, parameters):
+        self.executed.append((statement, parameters))
+
+    async def get_raw_connection(self):
+        return self.raw
+
+
+class FakeDB:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    async def connection(self):
+        return self.conn
+
+
+async def test_bulk_copy_without_rows_does_nothing():
+    """Test that an empty batch issues no statement."""
+    db = FakeDB()
+
+    await bulk_copy(db, SessionExercise.__table__, [])
+
+    assert db.conn.executed == []
+    assert db.conn.raw.driver_connection.copies == []
+
+
+@pytest.mark.parametrize("count, copied", [(COPY_THRESHOLD, False), (COPY_THRESHOLD + 1, True)])
+async def test_bulk_copy_threshold_on_postgresql(count, copied):
+    """Test that only batches above COPY_THRESHOLD are streamed with COPY."""
+    db = FakeDB()
+    rows = _rows(count)
+
+    await bulk_copy(db, SessionExercise.__table__, rows)
+
+    copies = db.conn.raw.driver_connection.copies
+    if not copied:
+        assert copies == []
+        assert len(db.conn.executed) == 1
+        assert db.conn.executed[0][1] == rows
+        return
+
+    assert db.conn.executed == []
+    assert len(copies) == 1
+    table_name, records, columns = copies[0]
+    assert table_name == "session_exercises"
+    assert columns == list(rows[0])
+    assert len(records) == count
+
+    # Values go through the column bind processors; None is passed through
+    record = dict(zip(columns, records[0]))
+    role_processor = SessionExercise.__table__.c.role.type.bind_processor(FakeConnection.dialect)
+    assert record["role"] == role_processor(ExerciseRole.ACCESSORY)
+    assert isinstance(record["role"], int)
+    assert record["target_rep_range_max"] == 12
+    assert record["notes"] is None
+
+
+async def test_bulk_copy_inserts_large_batches_on_sqlite(async_db_session, test_session, test_movements):
+    """Test that batches above COPY_THRESHOLD still insert on other dialects."""
+    count = COPY_THRESHOLD + 1
+
+    await bulk_copy(
+        async_db_session,
+        SessionExercise.__table__,
+        _rows(count, session_id=test_session.id, movement_id=test_movements[0].id),
+    )
+
+    result = await async_db_session.execute(
+        select(func.count(), func.max(SessionExercise.order_in_session))
+        .where(SessionExercise.session_id == test_session.id)
+    )
+    assert tuple(result.one()) == (count, count - 1)
+    roles = await async_db_session.execute(select(SessionExercise.role).distinct())
+    assert roles.scalars().all() == [ExerciseRole.ACCESSORY]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the CrossFit workout parser.
+
+Tests movement matching, line parsing and batch parsing.
+"""
+
+import re
+
+from app.parsing.crossfit import CrossFitParser, _normalize_text, _trie_pattern
+
+
+MOVEMENTS = ["thruster", "pull up", "row", "deadlift", "box jump"]
+
+
+def test_parse_workout_with_no_known_movements():
+    """Test that a weights-only line parses when the movement set is empty."""
+    result = CrossFitParser([]).parse_workout("(95/65 lb)")
+
+    assert len(result["exercises"]) == 1
+    assert result["exercises"][0]["rx_weight"] == {"male": 95.0, "female": 65.0, "unit": "lb"}
+
+
+def test_fuzzy_match_with_no_known_movements():
+    """Test that matching against an empty movement set returns the candidate."""
+    parser = CrossFitParser([])
+
+    assert parser._fuzzy_match_movement("dead") == (None, "dead")
+    assert parser._fuzzy_match_movement("") == (None, "")
+
+
+def test_fuzzy_match_empty_candidate():
+    """Test that an empty candidate does not match the first known movement."""
+    assert CrossFitParser(MOVEMENTS)._fuzzy_match_movement("") == (None, "")
+
+
+def test_fuzzy_match_exact_and_contained_movements():
+    """Test exact, movement-in-candidate and candidate-in-movement matches."""
+    parser = CrossFitParser(MOVEMENTS)
+
+    assert parser._fuzzy_match_movement("Row") == (None, "row")
+    assert parser._fuzzy_match_movement("heavy thruster") == (None, "thruster")
+    assert parser._fuzzy_match_movement("dead") == (None, "deadlift")
+    assert parser._fuzzy_match_movement("burpee") == (None, "burpee")
+
+
+def test_parser_copies_movement_set():
+    """Test that later changes to the caller's movements do not reach the parser."""
+    movements = set(MOVEMENTS)
+    parser = CrossFitParser(movements)
+    movements.add("burpee")
+
+    assert "burpee" not in parser.existing_movements
+
+
+def test_parse_workout_metadata_and_quantities():
+    """Test circuit metadata and per-line reps, distance and weights."""
+    parser = CrossFitParser(MOVEMENTS)
+
+    result = parser.parse_workout("AMRAP in 20 minutes\n5 pull-ups\n10 thrusters")
+    assert result["circuit_type"] == "AMRAP"
+    assert result["time_cap"] == "20 min"
+    assert [(e["movement"], e["reps"]) for e in result["exercises"][1:]] == [
+        ("pull ups", 5),
+        ("thrusters", 10),
+    ]
+
+    result = parser.parse_workout("For time:\n500-meter row\n10 deadlifts @ 225 lb")
+    row, deadlifts = result["exercises"][1:]
+    assert (row["distance_meters"], row["metric_type"]) == (500, "distance")
+    assert deadlifts["rx_weight"] == {"male": 225.0, "female": None, "unit": "lb"}
+
+
+def test_parse_workout_rounds_and_footer_weights():
+    """Test that a rounds line sets rounds and footer weights reach the exercise."""
+    result = CrossFitParser(MOVEMENTS).parse_workout(
+        "5 rounds for time of:\n20 box jumps\n♂ 50 lb ♀ 35 lb"
+    )
+
+    assert result["rounds"] == 5
+    assert len(result["exercises"]) == 1
+    assert result["exercises"][0]["rx_weight"] == {"male": 50.0, "female": 35.0, "unit": "lb"}
+
+
+def test_parse_many_keeps_input_order():
+    """Test that batch parsing matches parsing each workout on its own."""
+    parser = CrossFitParser(MOVEMENTS)
+    texts = ["10 thrusters", "500-meter row", "(95/65 lb)"]
+
+    assert parser.parse_many(texts) == [parser.parse_workout(text) for text in texts]
+
+
+def test_normalize_text_ascii_and_unicode():
+    """Test that the ASCII fast path and the regex path strip the same characters."""
+    assert _normalize_text("  Pull-Up (Strict)! ") == "pullup strict"
+    assert _normalize_text("Pull-Up ♂ (Strict)") == "pullup  strict"
+
+
+def test_trie_pattern_prefers_longer_words():
+    """Test that the movement trie matches the longest known prefix."""
+    pattern = re.compile(_trie_pattern(["row", "rower", "run"]))
+
+    assert pattern.search("erg rower sprint").group(0) == "rower"
+    assert pattern.search("easy run").group(0) == "run"
+    assert pattern.search("air bike") is None
@@ -0,0 +1,43 @@
+"""
+Unit tests for the shared column types and defaults.
+
+Tests the stored codes of int-valued and other enums and their round trip, and
+the SQL of the UTC timestamp default.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.types import SmallIntEnum, StringEnum, utcnow
+from app.models.enums import ExerciseRole, PersonaAggression, PersonaTone
+
+
+def test_small_int_enum_stores_int_enum_values():
+    """Test that an int-valued enum is stored as its value, not its position."""
+    column_type = SmallIntEnum(PersonaAggression)
+
+    assert [column_type.process_bind_param(member, None) for member in PersonaAggression] == [1, 2, 3, 4, 5]
+    assert column_type.process_bind_param(3, None) == 3
+    assert column_type.process_result_value(1, None) is PersonaAggression.CONSERVATIVE
+
+
+def test_small_int_enum_stores_positions_of_other_enums():
+    """Test that a str-valued enum is stored as its definition position."""
+    column_type = SmallIntEnum(ExerciseRole)
+
+    for code, member in enumerate(ExerciseRole):
+        assert column_type.process_bind_param(member.value, None) == code
+        assert column_type.process_result_value(code, None) is member
+
+
+def test_string_enum_stores_values():
+    """Test that a str-valued enum round-trips through its value."""
+    column_type = StringEnum(PersonaTone)
+
+    assert column_type.process_bind_param(PersonaTone.SUPPORTIVE, None) == "supportive"
+    assert column_type.process_result_value("supportive", None) is PersonaTone.SUPPORTIVE
+
+
+def test_utcnow_is_utc_on_each_dialect():
+    """Test that utcnow() takes UTC wall-clock time on PostgreSQL, not the session time zone."""
+    assert str(utcnow().compile(dialect=postgresql.dialect())) == "timezone('utc', now())"
+    assert str(utcnow().compile(dialect=sqlite.dialect())) == "CURRENT_TIMESTAMP"
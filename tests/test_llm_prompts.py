@@ -0,0 +1,73 @@
+"""
+Unit tests for LLM prompt builders.
+
+Tests session and microcycle prompt assembly.
+"""
+
+from app.llm.prompts import build_batched_microcycle_prompt, build_optimized_session_prompt
+
+
+PROGRAM = {
+    "goal_1": "strength",
+    "goal_2": "hypertrophy",
+    "goal_3": "endurance",
+    "goal_weight_1": 5,
+    "goal_weight_2": 3,
+    "goal_weight_3": 2,
+    "split_template": "ppl",
+    "days_per_week": 3,
+}
+
+MOVEMENTS_BY_PATTERN = {
+    "squat": ["Back Squat", "Front Squat"],
+    "hinge": ["Romanian Deadlift", "Hip Thrust"],
+    "horizontal_push": ["Barbell Bench Press", "Push-Up"],
+    "vertical_pull": ["Pull-Up"],
+}
+
+
+def test_session_prompt_contains_contexts():
+    """Test that the session prompt includes every dynamic context."""
+    prompt = build_optimized_session_prompt(
+        program=PROGRAM,
+        session_type="legs",
+        intent_tags=["squat", "hinge"],
+        day_number=2,
+        is_deload=False,
+        microcycle_number=1,
+        movements_by_pattern=MOVEMENTS_BY_PATTERN,
+        used_accessory_movements={1: ["Leg Curl"]},
+    )
+
+    assert "Goals: strength(5), hypertrophy(3), endurance(2)" in prompt
+    assert "Type: legs" in prompt
+    assert "Leg Curl" in prompt
+    assert "- squat: Back Squat, Front Squat" in prompt
+    assert "vertical_pull" not in prompt
+    # Escaped braces in the template are rendered as literal JSON braces
+    assert '"warmup": [{"movement": "Name"' in prompt
+    assert "{{" not in prompt
+
+
+def test_batched_microcycle_prompt_lists_each_session():
+    """Test that the batched prompt shares context and indexes sessions."""
+    prompt = build_batched_microcycle_prompt(
+        program=PROGRAM,
+        sessions=[
+            {"session_type": "push", "intent_tags": ["horizontal_push"], "day_number": 1},
+            {"session_type": "legs", "intent_tags": ["squat", "hinge"], "day_number": 3},
+        ],
+        is_deload=False,
+        microcycle_number=1,
+        movements_by_pattern=MOVEMENTS_BY_PATTERN,
+        movement_rules={"avoid": ["Front Squat"]},
+    )
+
+    assert "Generate 2 workout sessions" in prompt
+    assert prompt.count("## Program Context") == 1
+    assert prompt.count("## Available Movements") == 1
+    assert "## Session 1\nType: push" in prompt
+    assert "## Session 2\nType: legs" in prompt
+    assert "Front Squat" not in prompt
+    assert "vertical_pull" not in prompt
+    assert '"sessions": [' in prompt
@@ -0,0 +1,24 @@
+"""Tests for logging request schemas."""
+
+from datetime import date, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.logging import WorkoutLogCreate
+
+
+def test_workout_log_date_accepts_past_today_and_tomorrow():
+    """Backdated logs and a client a timezone ahead (tomorrow) are accepted."""
+    for log_date in (date(2024, 1, 15), date.today(), date.today() + timedelta(days=1)):
+        assert WorkoutLogCreate(log_date=log_date).log_date == log_date
+
+    assert WorkoutLogCreate().log_date is None
+
+
+def test_workout_log_date_rejects_future_dates():
+    """Dates past tomorrow are rejected instead of landing in the default partition."""
+    with pytest.raises(ValidationError):
+        WorkoutLogCreate(log_date=date.today() + timedelta(days=2))
+    with pytest.raises(ValidationError):
+        WorkoutLogCreate(log_date=date.today() + timedelta(days=120))
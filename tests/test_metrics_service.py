@@ -201,3 +201,37 @@ async def test_volume_load_respects_lookback_window(
     # With no data, both should be 0
     assert volume_7d == 0
     assert volume_14d == 0
+
+
+@pytest.mark.asyncio
+async def test_recalculate_e1rm_updates_top_sets(
+    async_db_session: AsyncSession,
+    test_user,
+    test_workout_log,
+    test_movements,
+):
+    """Test that recalculating e1RM rewrites stored values with the new formula."""
+    from app.models.enums import E1RMFormula
+    from app.models.logging import TopSetLog
+    
+    top_set = TopSetLog(
+        workout_log_id=test_workout_log.id,
+        movement_id=test_movements[0].id,
+        weight=100.0,
+        reps=5,
+        e1rm_value=100.0 * (1 + 5 / 30),
+        e1rm_formula=E1RMFormula.EPLEY,
+        pattern=MovementPattern.SQUAT,
+    )
+    async_db_session.add(top_set)
+    await async_db_session.commit()
+    
+    updated = await metrics_service.recalculate_e1rm(
+        async_db_session, test_user.id, E1RMFormula.BRZYCKI
+    )
+    await async_db_session.commit()
+    await async_db_session.refresh(top_set)
+    
+    assert updated == 1
+    assert top_set.e1rm_formula == E1RMFormula.BRZYCKI
+    assert top_set.e1rm_value == pytest.approx(100.0 * 36 / 32)
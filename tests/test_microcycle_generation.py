@@ -0,0 +1,366 @@
+"""
+Unit tests for microcycle session generation.
+
+Tests that batched generation produces the same sessions as the per-day path,
+with the LLM replaced by fixed per-day plans.
+"""
+
+import copy
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import app.db.database as database
+from app.config.settings import get_settings
+from app.db.database import Base
+from app.models import Microcycle, Movement, Program, Session, SessionExercise, User
+from app.models.enums import (
+    ExperienceLevel, Goal, MicrocycleStatus, PersonaAggression, PersonaTone, ProgressionStyle,
+    SessionType, SplitTemplate,
+)
+from app.services.program import program_service
+from app.services.session_generator import session_generator
+
+
+# day -> (session type, intent_tags); day 3 is a rest day
+DAYS = {
+    1: (SessionType.FULL_BODY, ["squat", "horizontal_push"]),
+    2: (SessionType.FULL_BODY, ["squat", "horizontal_pull"]),
+    3: (SessionType.RECOVERY, []),
+    4: (SessionType.FULL_BODY, ["hinge", "vertical_push"]),
+}
+
+MOVEMENTS = {
+    # name: (pattern, primary muscle, substitution group)
+    "Barbell Squat": ("squat", "quadriceps", "squat"),
+    "Romanian Deadlift": ("hinge", "hamstrings", "deadlift"),
+    "Barbell Bench Press": ("horizontal_push", "chest", "bench_press"),
+    "Barbell Row": ("horizontal_pull", "lats", "row"),
+    "Overhead Press": ("vertical_push", "front_delts", "overhead_press"),
+    "Face Pull": ("horizontal_pull", "rear_delts", None),
+    "Lateral Raise": ("isolation", "side_delts", None),
+    "Leg Curl": ("isolation", "hamstrings", None),
+}
+
+
+def _exercise(movement: str, rep_min: int = 8, rep_max: int = 10) -> dict:
+    return {
+        "movement": movement,
+        "sets": 3,
+        "rep_range_min": rep_min,
+        "rep_range_max": rep_max,
+        "target_rpe": 7.5,
+        "rest_seconds": 90,
+    }
+
+
+# LLM output per training day. Face Pull repeats on day 4 after day 1 (not the
+# previous training day), which both paths have to replace.
+PLANS = {
+    1: {
+        "main": [_exercise("Barbell Squat", 5, 5), _exercise("Barbell Bench Press", 5, 5)],
+        "accessory": [_exercise("Face Pull", 12, 15)],
+        "reasoning": "Day 1",
+    },
+    2: {
+        "main": [_exercise("Romanian Deadlift"), _exercise("Barbell Row")],
+        "accessory": [_exercise("Leg Curl", 10, 12)],
+        "reasoning": "Day 2",
+    },
+    4: {
+        "main": [_exercise("Barbell Squat"), _exercise("Overhead Press")],
+        "accessory": [_exercise("Face Pull", 12, 15), _exercise("Lateral Raise", 12, 15)],
+        "reasoning": "Day 4",
+    },
+}
+
+
+@pytest_asyncio.fixture
+async def session_maker(monkeypatch):
+    """In-memory database behind app.db.database.async_session_maker."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(database, "async_session_maker", maker)
+    yield maker
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def microcycle_sessions(session_maker) -> tuple[Program, Microcycle, dict[int, int]]:
+    """A program with one microcycle of DAYS; returns (program, microcycle, session id -> day)."""
+    async with session_maker() as db:
+        user = User(
+            name="Test User",
+            email="test@example.com",
+            experience_level=ExperienceLevel.INTERMEDIATE,
+            persona_tone=PersonaTone.SUPPORTIVE,
+            persona_aggression=PersonaAggression.BALANCED,
+        )
+        db.add(user)
+        db.add_all(
+            Movement(
+                name=name,
+                pattern=pattern,
+                primary_muscle=muscle,
+                primary_region="anterior upper",
+                substitution_group=group,
+            )
+            for name, (pattern, muscle, group) in MOVEMENTS.items()
+        )
+        await db.flush()
+        program = Program(
+            user_id=user.id,
+            split_template=SplitTemplate.FULL_BODY,
+            start_date=date(2026, 1, 5),
+            duration_weeks=8,
+            goal_1=Goal.STRENGTH,
+            goal_2=Goal.HYPERTROPHY,
+            goal_3=Goal.ENDURANCE,
+            goal_weight_1=5,
+            goal_weight_2=3,
+            goal_weight_3=2,
+            days_per_week=3,
+            progression_style=ProgressionStyle.DOUBLE_PROGRESSION,
+            deload_every_n_microcycles=4,
+            persona_tone=PersonaTone.SUPPORTIVE,
+            persona_aggression=PersonaAggression.BALANCED,
+            is_active=True,
+        )
+        db.add(program)
+        await db.flush()
+        microcycle = Microcycle(
+            program_id=program.id,
+            sequence_number=1,
+            start_date=date(2026, 1, 5),
+            length_days=7,
+            status=MicrocycleStatus.ACTIVE,
+            is_deload=False,
+        )
+        db.add(microcycle)
+        await db.flush()
+        sessions = [
+            Session(
+                microcycle_id=microcycle.id,
+                date=date(2026, 1, 4 + day),
+                day_number=day,
+                session_type=session_type,
+                intent_tags=list(tags),
+            )
+            for day, (session_type, tags) in DAYS.items()
+        ]
+        db.add_all(sessions)
+        await db.commit()
+        return program, microcycle, {s.id: s.day_number for s in sessions}
+
+
+class FakeLLM:
+    """Answers per-day and batched LLM calls from PLANS and records the calls made."""
+
+    def __init__(self, day_by_id: dict[int, int]):
+        self.day_by_id = day_by_id
+        self.calls: list[str] = []
+        self.fail_batch = False
+
+    async def __call__(self, provider, messages, config, session_id=None, session_type=None):
+        self.calls.append(session_type)
+        if session_type.startswith("microcycle:"):
+            if self.fail_batch:
+                raise RuntimeError("batched generation failed")
+            return {"sessions": [copy.deepcopy(PLANS[day]) for day in sorted(PLANS)]}
+        return copy.deepcopy(PLANS[self.day_by_id[session_id]])
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, microcycle_sessions) -> FakeLLM:
+    fake = FakeLLM(microcycle_sessions[2])
+    monkeypatch.setattr(session_generator, "_call_llm_cached", fake)
+    return fake
+
+
+async def _reset_sessions(microcycle: Microcycle) -> None:
+    """Restore the session shells of DAYS, without generated content."""
+    async with database.async_session_maker() as db:
+        await db.execute(delete(SessionExercise))
+        sessions = (
+            await db.execute(select(Session).where(Session.microcycle_id == microcycle.id))
+        ).scalars().all()
+        for session in sessions:
+            session.intent_tags = list(DAYS[session.day_number][1])
+            session.warmup_json = session.main_json = session.accessory_json = None
+            session.finisher_json = session.cooldown_json = session.coach_notes = None
+        await db.commit()
+
+
+async def _generate(monkeypatch, microcycle_sessions, batch: bool) -> dict[int, dict]:
+    """Generate the microcycle's content from fresh shells and snapshot every session by day."""
+    program, microcycle, _ = microcycle_sessions
+    await _reset_sessions(microcycle)
+    monkeypatch.setattr(get_settings(), "batch_microcycle", batch)
+    await program_service._generate_session_content_async(program.id, microcycle.id)
+
+    async with database.async_session_maker() as db:
+        sessions = (
+            await db.execute(select(Session).where(Session.microcycle_id == microcycle.id))
+        ).scalars().all()
+        rows = (
+            await db.execute(
+                select(
+                    SessionExercise.session_id,
+                    SessionExercise.role,
+                    SessionExercise.order_in_session,
+                    SessionExercise.movement_id,
+                    SessionExercise.target_rep_range_min,
+                    SessionExercise.target_rep_range_max,
+                ).order_by(SessionExercise.session_id, SessionExercise.role, SessionExercise.order_in_session)
+            )
+        ).all()
+    return {
+        s.day_number: {
+            "intent_tags": s.intent_tags,
+            "warmup": s.warmup_json,
+            "main": s.main_json,
+            "accessory": s.accessory_json,
+            "finisher": s.finisher_json,
+            "cooldown": s.cooldown_json,
+            "coach_notes": s.coach_notes,
+            "estimated_duration_minutes": s.estimated_duration_minutes,
+            "exercises": [tuple(row[1:]) for row in rows if row[0] == s.id],
+        }
+        for s in sessions
+    }
+
+
+async def test_batched_matches_per_day_generation(monkeypatch, microcycle_sessions, fake_llm):
+    """Test that one batched call produces the sessions the per-day path does."""
+    per_day = await _generate(monkeypatch, microcycle_sessions, batch=False)
+    assert fake_llm.calls == ["full_body", "full_body", "full_body"]
+
+    batched = await _generate(monkeypatch, microcycle_sessions, batch=True)
+    assert fake_llm.calls[3:] == [f"microcycle:{microcycle_sessions[1].id}"]
+
+    assert batched == per_day
+
+
+async def test_generation_applies_interference_and_accessory_rules(
+    monkeypatch, microcycle_sessions, fake_llm
+):
+    """Test pattern interference and cross-day accessory replacement in both paths."""
+    for batch in (False, True):
+        sessions = await _generate(monkeypatch, microcycle_sessions, batch=batch)
+
+        # Day 2 repeats day 1's squat; day 4 follows day 2's hinge within two days
+        assert sessions[2]["intent_tags"] == ["hinge", "horizontal_pull"]
+        assert sessions[4]["intent_tags"] == ["squat", "vertical_push"]
+        assert sessions[3]["main"] is None
+
+        # Face Pull was a day 1 accessory, two training days before day 4
+        day_4_accessories = [ex["movement"] for ex in sessions[4]["accessory"]]
+        assert "Face Pull" not in day_4_accessories
+        assert "Lateral Raise" in day_4_accessories
+        assert sessions[4]["exercises"]
+
+
+async def test_failed_batch_falls_back_without_partial_writes(
+    monkeypatch, microcycle_sessions, fake_llm
+):
+    """Test that a failed batch persists nothing and the per-day fallback matches a plain per-day run."""
+    program, microcycle, _ = microcycle_sessions
+    fake_llm.fail_batch = True
+    monkeypatch.setattr(get_settings(), "batch_microcycle", True)
+
+    async with database.async_session_maker() as db:
+        sessions = (
+            await db.execute(select(Session).where(Session.microcycle_id == microcycle.id))
+        ).scalars().all()
+    assert not await program_service._generate_microcycle_batched(program.id, microcycle, sessions)
+
+    async with database.async_session_maker() as db:
+        stored = (
+            await db.execute(select(Session.day_number, Session.intent_tags, Session.main_json))
+        ).all()
+    assert {day: (tags, main) for day, tags, main in stored} == {
+        day: (tags, None) for day, (_, tags) in DAYS.items()
+    }
+
+    fallback = await _generate(monkeypatch, microcycle_sessions, batch=True)
+    per_day = await _generate(monkeypatch, microcycle_sessions, batch=False)
+    assert fallback == per_day
+
+
+async def test_reversed_rep_range_is_stored_in_order(monkeypatch, microcycle_sessions, fake_llm):
+    """Test that a rep range with min above max is written low to high."""
+    day_2 = copy.deepcopy(PLANS[2])
+    day_2["accessory"] = [_exercise("Leg Curl", 12, 10)]
+    monkeypatch.setitem(PLANS, 2, day_2)
+
+    for batch in (False, True):
+        sessions = await _generate(monkeypatch, microcycle_sessions, batch=batch)
+
+        assert [row[-2:] for row in sessions[2]["exercises"]] == [(8, 10), (8, 10), (10, 12)]
+
+
+async def test_regeneration_replaces_session_exercises(monkeypatch, microcycle_sessions, fake_llm):
+    """Test that generating a microcycle again replaces its exercise rows in both paths."""
+    program, microcycle, _ = microcycle_sessions
+    first = await _generate(monkeypatch, microcycle_sessions, batch=False)
+
+    for batch in (False, True):
+        monkeypatch.setattr(get_settings(), "batch_microcycle", batch)
+        await program_service._generate_session_content_async(program.id, microcycle.id)
+
+        async with database.async_session_maker() as db:
+            rows = (
+                await db.execute(select(SessionExercise.session_id, SessionExercise.order_in_session))
+            ).all()
+        # One row per (session, block position) with no leftovers from the previous run
+        assert len(rows) == sum(len(day["exercises"]) for day in first.values())
+
+
+async def test_populate_microcycle_by_id_writes_exercise_rows(monkeypatch, microcycle_sessions, fake_llm):
+    """Test that batched population stores the given tags and one row per library exercise."""
+    program, microcycle, day_by_id = microcycle_sessions
+    await _reset_sessions(microcycle)
+    session_ids = sorted((sid for sid, day in day_by_id.items() if day in PLANS), key=day_by_id.get)
+    intent_tags = {session_id: [f"tag_{day_by_id[session_id]}"] for session_id in session_ids}
+
+    await session_generator.populate_microcycle_by_id(
+        program.id, microcycle.id, session_ids, intent_tags=intent_tags
+    )
+
+    async with database.async_session_maker() as db:
+        sessions = {
+            s.id: s
+            for s in (
+                await db.execute(select(Session).where(Session.id.in_(session_ids)))
+            ).scalars()
+        }
+        movement_names = dict((await db.execute(select(Movement.id, Movement.name))).all())
+        rows = (
+            await db.execute(
+                select(SessionExercise.session_id, SessionExercise.role, SessionExercise.movement_id)
+                .order_by(SessionExercise.session_id, SessionExercise.role, SessionExercise.order_in_session)
+            )
+        ).all()
+
+    assert fake_llm.calls == [f"microcycle:{microcycle.id}"]
+    for session_id in session_ids:
+        session = sessions[session_id]
+        assert session.intent_tags == intent_tags[session_id]
+        expected = [
+            (block, exercise["movement"])
+            for block, exercises in (("main", session.main_json), ("accessory", session.accessory_json))
+            for exercise in exercises or []
+            if exercise["movement"] in MOVEMENTS
+        ]
+        stored = sorted(
+            (role.value, movement_names[movement_id])
+            for sid, role, movement_id in rows
+            if sid == session_id and role.value in ("main", "accessory")
+        )
+        assert stored == sorted(expected)
@@ -0,0 +1,48 @@
+"""
+Unit tests for MovementTagService.
+
+Tests tag lookup reuse and ordered tag links on new movements.
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.movement_tags import movement_tag_service
+from app.models.movement import Movement, Equipment
+from app.models.enums import MovementPattern, PrimaryMuscle, PrimaryRegion
+
+
+def _movement(name: str) -> Movement:
+    return Movement(
+        name=name,
+        pattern=MovementPattern.HORIZONTAL_PUSH.value,
+        primary_muscle=PrimaryMuscle.CHEST.value,
+        primary_region=PrimaryRegion.ANTERIOR_UPPER.value,
+    )
+
+
+@pytest.mark.asyncio
+async def test_assign_reuses_lookup_rows_and_keeps_order(async_db_session: AsyncSession):
+    """Shared equipment slugs map to one lookup row; link order is preserved."""
+    bench = _movement("Dumbbell Bench Press")
+    await movement_tag_service.assign(
+        async_db_session,
+        bench,
+        equipment=["dumbbell", "bench", "dumbbell"],
+        disciplines=["bodybuilding"],
+    )
+    async_db_session.add(bench)
+
+    fly = _movement("Dumbbell Fly")
+    await movement_tag_service.assign(async_db_session, fly, equipment=["bench", "dumbbell"])
+    async_db_session.add(fly)
+    await async_db_session.commit()
+
+    assert bench.equipment_tags == ["dumbbell", "bench"]
+    assert bench.discipline_tags == ["bodybuilding"]
+    assert fly.equipment_tags == ["bench", "dumbbell"]
+    assert fly.tags == []
+
+    count = await async_db_session.execute(select(func.count(Equipment.id)))
+    assert count.scalar() == 2
@@ -0,0 +1,43 @@
+"""
+Unit tests for the Ollama provider's request bodies.
+
+Tests the serialized /api/chat payload without contacting a server.
+"""
+
+import json
+
+from app.llm.base import LLMConfig, Message
+from app.llm.ollama_provider import OllamaProvider
+
+
+CONFIG = LLMConfig(model="llama3.1:8b", temperature=0.3, max_tokens=512, json_schema={"type": "object"})
+
+
+def test_build_body_keeps_model_loaded_for_cached_prefix():
+    """Test that a cache_prefix message asks Ollama to keep the model loaded."""
+    provider = OllamaProvider()
+    messages = [
+        Message(role="system", content="static prompt", cache_prefix=True),
+        Message(role="user", content="today"),
+    ]
+
+    body = json.loads(provider._build_body(messages, CONFIG, stream=False))
+
+    assert body["keep_alive"] == provider.keep_alive
+    assert body["messages"] == [
+        {"role": "system", "content": "static prompt"},
+        {"role": "user", "content": "today"},
+    ]
+    assert body["options"] == {"temperature": 0.3, "num_predict": 512}
+    assert body["format"] == {"type": "object"}
+
+
+def test_build_body_without_cached_prefix_uses_server_default():
+    """Test that keep_alive is left to the server when no prefix is marked, even after a marked request."""
+    provider = OllamaProvider()
+    provider._build_body([Message(role="system", content="static prompt", cache_prefix=True)], CONFIG, stream=False)
+
+    body = json.loads(provider._build_body([Message(role="user", content="hello")], CONFIG, stream=False))
+
+    assert "keep_alive" not in body
+    assert body["messages"] == [{"role": "user", "content": "hello"}]
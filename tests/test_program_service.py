@@ -5,10 +5,12 @@ Tests program generation, microcycle creation, and goal distribution.
 """
 
 import pytest
-from datetime import date
+from datetime import date, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 
+from app.db.queries import daily_plan_stmt, program_with_sessions_stmt
 from app.services.program import program_service
 from app.models.program import Program, Microcycle
 from app.models.enums import Goal, SplitTemplate as SplitTemplateEnum, ProgressionStyle, MicrocycleStatus
@@ -147,6 +149,36 @@ async def test_create_program_invalid_week_count_too_long(
         )
 
 
+@pytest.mark.parametrize(
+    "goals, valid",
+    [
+        ([(Goal.STRENGTH, 10)], True),
+        ([(Goal.STRENGTH, 6), (Goal.HYPERTROPHY, 4)], True),
+        ([(Goal.STRENGTH, 5), (Goal.HYPERTROPHY, 3), (Goal.ENDURANCE, 2)], True),
+        ([(Goal.STRENGTH, 9)], False),  # Does not sum to 10
+        ([(Goal.STRENGTH, 5), (Goal.HYPERTROPHY, 3), (Goal.ENDURANCE, 3)], False),
+        ([(Goal.STRENGTH, 5), (Goal.STRENGTH, 5)], False),  # Duplicate goal
+        ([(Goal.STRENGTH, 5), (Goal.HYPERTROPHY, 3), (Goal.STRENGTH, 2)], False),
+        ([(Goal.STRENGTH, 5), (Goal.HYPERTROPHY, 3), (Goal.HYPERTROPHY, 2)], False),
+    ],
+)
+def test_program_goals_validation(goals, valid):
+    """Goal weights must sum to 10 and goals must be distinct, for 1-3 goals."""
+    def build():
+        return ProgramCreate(
+            goals=[GoalWeight(goal=goal, weight=weight) for goal, weight in goals],
+            duration_weeks=8,
+            split_template=SplitTemplateEnum.UPPER_LOWER,
+            days_per_week=4,
+        )
+
+    if valid:
+        assert len(build().goals) == len(goals)
+    else:
+        with pytest.raises(ValidationError):
+            build()
+
+
 @pytest.mark.asyncio
 async def test_get_program(
     async_db_session: AsyncSession,
@@ -304,3 +336,108 @@ async def test_program_goals_stored_correctly(
     assert program.goal_weight_1 == 5
     assert program.goal_weight_2 == 3
     assert program.goal_weight_3 == 2
+
+
+@pytest.mark.asyncio
+async def test_program_with_sessions_stmt_loads_without_lazy_loads(
+    async_db_session: AsyncSession,
+    test_user,
+):
+    """The program read eager-loads microcycles and sessions; raiseload catches any lazy access."""
+    request = ProgramCreate(
+        goals=[
+            GoalWeight(goal=Goal.STRENGTH, weight=5),
+            GoalWeight(goal=Goal.HYPERTROPHY, weight=3),
+            GoalWeight(goal=Goal.ENDURANCE, weight=2),
+        ],
+        duration_weeks=8,
+        program_start_date=date.today(),
+        split_template=SplitTemplateEnum.UPPER_LOWER,
+        days_per_week=4,
+        progression_style=ProgressionStyle.DOUBLE_PROGRESSION,
+    )
+    created = await program_service.create_program(async_db_session, test_user.id, request)
+    async_db_session.expunge_all()
+    
+    result = await async_db_session.execute(
+        program_with_sessions_stmt().options(raiseload("*")),
+        {"program_id": created.id},
+    )
+    program = result.scalar_one()
+    
+    assert [mc.sequence_number for mc in program.microcycles] == list(range(1, 9))
+    for microcycle in program.microcycles:
+        day_numbers = [s.day_number for s in microcycle.sessions]
+        assert day_numbers and day_numbers == sorted(day_numbers)
+
+
+@pytest.mark.asyncio
+async def test_daily_plan_stmt_returns_program_microcycle_and_session(
+    async_db_session: AsyncSession,
+    test_user,
+):
+    """The daily plan row carries the active microcycle and the date's session, or None for a rest day."""
+    request = ProgramCreate(
+        goals=[
+            GoalWeight(goal=Goal.STRENGTH, weight=5),
+            GoalWeight(goal=Goal.HYPERTROPHY, weight=3),
+            GoalWeight(goal=Goal.ENDURANCE, weight=2),
+        ],
+        duration_weeks=8,
+        program_start_date=date.today(),
+        split_template=SplitTemplateEnum.UPPER_LOWER,
+        days_per_week=4,
+        progression_style=ProgressionStyle.DOUBLE_PROGRESSION,
+    )
+    created = await program_service.create_program(async_db_session, test_user.id, request)
+    
+    result = await async_db_session.execute(
+        program_with_sessions_stmt(), {"program_id": created.id}
+    )
+    active = next(
+        mc for mc in result.scalar_one().microcycles if mc.status == MicrocycleStatus.ACTIVE
+    )
+    planned = active.sessions[0]
+    
+    program, microcycle, session = (
+        await async_db_session.execute(
+            daily_plan_stmt(), {"program_id": created.id, "date": planned.date}
+        )
+    ).one()
+    assert (program.id, microcycle.id, session.id) == (created.id, active.id, planned.id)
+    
+    session_dates = {s.date for s in active.sessions}
+    rest_day = next(
+        active.start_date + timedelta(days=offset)
+        for offset in range(14)
+        if active.start_date + timedelta(days=offset) not in session_dates
+    )
+    _, microcycle, session = (
+        await async_db_session.execute(
+            daily_plan_stmt(), {"program_id": created.id, "date": rest_day}
+        )
+    ).one()
+    assert microcycle.id == active.id
+    assert session is None
+    
+    missing = await async_db_session.execute(
+        daily_plan_stmt(), {"program_id": created.id + 1000, "date": planned.date}
+    )
+    assert missing.one_or_none() is None
+
+
+def test_program_goal_vec_tracks_weighted_goals():
+    """goal_vec lists the goals with non-zero weight and follows later weight changes."""
+    program = Program(
+        goal_1=Goal.STRENGTH,
+        goal_2=Goal.HYPERTROPHY,
+        goal_3=Goal.MOBILITY,
+        goal_weight_1=6,
+        goal_weight_2=4,
+        goal_weight_3=0,
+    )
+    assert program.goal_vec == ["strength", "hypertrophy"]
+    
+    program.goal_weight_2 = 0
+    program.goal_weight_3 = 4
+    assert program.goal_vec == ["strength", "mobility"]
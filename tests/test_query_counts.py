@@ -0,0 +1,87 @@
+"""
+Query-count guards for hot read routes.
+
+Each test runs the statements of a route and reads what the route reads, and
+pins the number of statements made, so a relationship that falls back to lazy
+loading (an N+1 per microcycle or session) fails here rather than in production.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.queries import daily_plan_stmt, program_with_sessions_stmt
+from app.models.program import Microcycle, Session
+from app.models.enums import MicrocycleStatus, SessionType
+from app.services.time_estimation import time_estimation_service
+from tests.query_counter import count_queries
+
+
+async def _add_microcycles(db: AsyncSession, program, count: int) -> None:
+    """Add count weekly microcycles of four sessions each; the first is active and starts today."""
+    for sequence in range(count):
+        start = date.today() + timedelta(days=7 * sequence)
+        microcycle = Microcycle(
+            program_id=program.id,
+            sequence_number=sequence + 1,
+            start_date=start,
+            length_days=7,
+            status=MicrocycleStatus.ACTIVE if sequence == 0 else MicrocycleStatus.PLANNED,
+            is_deload=False,
+        )
+        microcycle.sessions = [
+            Session(
+                date=start + timedelta(days=day - 1),
+                day_number=day,
+                session_type=SessionType.UPPER,
+                intent_tags=[],
+                main_json=[{"movement": "Bench Press", "sets": 3, "rep_range_min": 6, "rep_range_max": 8}],
+            )
+            for day in (1, 2, 4, 5)
+        ]
+        db.add(microcycle)
+    await db.commit()
+    db.expunge_all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("microcycles", [1, 4])
+async def test_get_program_query_count_is_constant(async_db_session: AsyncSession, test_program, microcycles):
+    """GET /programs/{id} loads the program, microcycles and sessions in 3 statements for any program length."""
+    await _add_microcycles(async_db_session, test_program, microcycles)
+
+    with count_queries(async_db_session) as statements:
+        result = await async_db_session.execute(program_with_sessions_stmt(), {"program_id": test_program.id})
+        program = result.scalar_one()
+        # What get_program reads to build its response
+        sessions = [
+            (session.date, session.main_json, time_estimation_service.session_durations(session))
+            for microcycle in program.microcycles
+            for session in microcycle.sessions
+        ]
+
+    assert len(program.microcycles) == microcycles
+    assert len(sessions) == 4 * microcycles
+    # program, then one IN query each for microcycles and sessions
+    assert len(statements) == 3, statements
+
+
+@pytest.mark.asyncio
+async def test_daily_plan_is_one_query(async_db_session: AsyncSession, test_program):
+    """GET /days/{date}/plan reads the program, active microcycle and session in a single statement."""
+    await _add_microcycles(async_db_session, test_program, 2)
+
+    with count_queries(async_db_session) as statements:
+        result = await async_db_session.execute(
+            daily_plan_stmt(), {"program_id": test_program.id, "date": date.today()}
+        )
+        program, microcycle, session = result.one()
+        # What get_daily_plan reads to build its response
+        durations = time_estimation_service.session_durations(session)
+
+    assert program.user_id == test_program.user_id
+    assert durations and session.main_json
+    assert microcycle.status == MicrocycleStatus.ACTIVE
+    assert session.date == date.today()
+    assert len(statements) == 1, statements
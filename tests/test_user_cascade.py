@@ -0,0 +1,106 @@
+"""
+Tests for deleting a user.
+
+Owned rows are removed by ON DELETE CASCADE in the database (or set-based
+DELETEs from UserService), not loaded and deleted one by one by the ORM.
+"""
+
+import pytest
+from datetime import date
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User, UserMovementRule, UserSettings
+from app.models.logging import WorkoutLog, TopSetLog
+from app.models.movement import Movement, Muscle
+from app.models.program import UserFatigueState
+from app.models.config import ExternalActivityRecord, ExternalMetricStream
+from app.models.enums import ExternalProvider, MovementRuleType, RuleCadence
+from app.services.users import user_service
+from tests.query_counter import count_queries
+
+
+@pytest.mark.asyncio
+async def test_user_delete_cascades_in_database(async_db_session: AsyncSession, test_user, test_movements):
+    """Deleting a user issues a single DELETE and removes settings, rules, logs and top sets."""
+    # SQLite enforces foreign keys (and their ON DELETE actions) per connection
+    await async_db_session.execute(text("PRAGMA foreign_keys=ON"))
+
+    movement = test_movements[0]
+    log = WorkoutLog(user_id=test_user.id, date=date(2026, 3, 2))
+    log.top_sets.append(
+        TopSetLog(movement_id=movement.id, weight=100.0, reps=5, pattern=movement.pattern)
+    )
+    async_db_session.add_all([
+        UserMovementRule(
+            user_id=test_user.id,
+            movement_id=movement.id,
+            rule_type=MovementRuleType.HARD_NO,
+            cadence=RuleCadence.PER_MICROCYCLE,
+        ),
+        log,
+    ])
+    await async_db_session.commit()
+
+    with count_queries(async_db_session) as statements:
+        await async_db_session.delete(test_user)
+        await async_db_session.commit()
+
+    # No child collection is loaded to be deleted row by row
+    assert not any(s.startswith("SELECT") for s in statements)
+    deletes = [s for s in statements if s.startswith("DELETE")]
+    assert len(deletes) == 1 and "USERS" in deletes[0]
+
+    for model in (UserSettings, UserMovementRule, WorkoutLog, TopSetLog):
+        count = await async_db_session.scalar(select(func.count()).select_from(model))
+        assert count == 0, model.__tablename__
+
+
+@pytest.mark.asyncio
+async def test_delete_user_clears_tables_without_cascade(async_db_session: AsyncSession, test_user):
+    """delete_user also removes fatigue state and external records, whose keys do not cascade."""
+    await async_db_session.execute(text("PRAGMA foreign_keys=ON"))
+
+    muscle = Muscle(slug="quads", name="Quadriceps")
+    record = ExternalActivityRecord(user_id=test_user.id, provider=ExternalProvider.STRAVA, external_id="run-1")
+    async_db_session.add_all([muscle, record])
+    await async_db_session.flush()
+    async_db_session.add_all([
+        UserFatigueState(user_id=test_user.id, date=date(2026, 3, 2), muscle_id=muscle.id, fatigue_score=0.4),
+        ExternalMetricStream(external_activity_record_id=record.id, stream_type="heartrate"),
+        WorkoutLog(user_id=test_user.id, date=date(2026, 3, 2)),
+    ])
+    await async_db_session.commit()
+
+    assert await user_service.delete_user(async_db_session, test_user.id) is True
+    await async_db_session.commit()
+
+    for model in (User, UserSettings, WorkoutLog, UserFatigueState, ExternalActivityRecord, ExternalMetricStream):
+        count = await async_db_session.scalar(select(func.count()).select_from(model))
+        assert count == 0, model.__tablename__
+    assert await async_db_session.scalar(select(func.count()).select_from(Muscle)) == 1
+
+    assert await user_service.delete_user(async_db_session, test_user.id) is False
+
+
+@pytest.mark.asyncio
+async def test_delete_user_keeps_custom_movements(async_db_session: AsyncSession, test_user):
+    """delete_user keeps a user's custom movements, without an owner, instead of failing on their key."""
+    await async_db_session.execute(text("PRAGMA foreign_keys=ON"))
+
+    movement = Movement(
+        user_id=test_user.id,
+        name="Custom Sled Push",
+        pattern="carry",
+        primary_muscle="quadriceps",
+        primary_region="anterior lower",
+    )
+    async_db_session.add(movement)
+    await async_db_session.commit()
+
+    assert await user_service.delete_user(async_db_session, test_user.id) is True
+    await async_db_session.commit()
+
+    assert await async_db_session.scalar(select(func.count()).select_from(User)) == 0
+    owner = await async_db_session.scalar(select(Movement.user_id).where(Movement.id == movement.id))
+    assert owner is None